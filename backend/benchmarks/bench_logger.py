@@ -0,0 +1,94 @@
+"""
+로깅 파이프라인 벤치마크
+호출 스레드 기준 초당 처리 레코드 수 비교
+- legacy: 동기 StreamHandler + 매번 컴파일하지 않은 re.sub 5회 + f-string 메시지
+- current: QueueHandler(백그라운드 리스너) + 사전 검사 후 미리 컴파일된 마스킹 + %-형식 지연 인자
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_logger [레코드 수]
+"""
+import logging
+import os
+import re
+import sys
+import time
+
+from utils.logger import SensitiveDataFormatter, log_listener, logger
+
+
+class LegacyFormatter(logging.Formatter):
+    """비동기 로깅 도입 전의 마스킹 포맷터 (비교 기준)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        masked = super().format(record)
+        for pattern, replacement in SensitiveDataFormatter.SENSITIVE_PATTERNS:
+            masked = re.sub(pattern, replacement, masked)
+        return masked
+
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 크롤러 로그와 비슷한 메시지 (대부분 숫자/이메일 없음, 일부는 마스킹 대상 포함)
+MESSAGES = [
+    ("Post page ready by %s in %.2fs", ("embedded_json", 0.42)),
+    ("All fields extracted over HTTP, skipping browser", ()),
+    ("Escalating to Selenium for missing fields: %s", ("like_count, caption",)),
+    ("Username extracted using: %s", ("header_link_span",)),
+    ("Contact in caption: %s", ("010-1234-5678 / kim@example.com",)),
+]
+
+
+def run_legacy(count: int, stream) -> float:
+    bench_logger = logging.getLogger("bench.legacy")
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(LegacyFormatter(FORMAT))
+    bench_logger.addHandler(stream_handler)
+    started = time.perf_counter()
+    for index in range(count):
+        message, args = MESSAGES[index % len(MESSAGES)]
+        bench_logger.info(message % args)
+        # 꺼진 DEBUG 로그도 f-string은 매번 만들어짐
+        bench_logger.debug(f"Selector {args} failed: {index}")
+    elapsed = time.perf_counter() - started
+    bench_logger.removeHandler(stream_handler)
+    return elapsed
+
+
+def run_current(count: int) -> float:
+    started = time.perf_counter()
+    for index in range(count):
+        message, args = MESSAGES[index % len(MESSAGES)]
+        logger.info(message, *args)
+        logger.debug("Selector %s failed: %s", args, index)
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    if log_listener is None:
+        print("LOG_ASYNC is disabled; enable it to benchmark the queue pipeline")
+        return
+
+    with open(os.devnull, "w") as devnull:
+        # 현재 파이프라인의 리스너 출력도 /dev/null로 보냄
+        listener_handler = log_listener.handlers[0]
+        original_stream = listener_handler.setStream(devnull)
+        legacy = run_legacy(count, devnull)
+        current = run_current(count)
+        started = time.perf_counter()
+        # 큐에 쌓인 레코드를 리스너가 모두 처리할 때까지 (전체 처리량)
+        log_listener.stop()
+        drained = current + time.perf_counter() - started
+        listener_handler.setStream(original_stream)
+        log_listener.start()
+
+    print(f"records           : {count:,} INFO + {count:,} disabled DEBUG")
+    print(f"legacy (sync)     : {count / legacy:12,.0f} records/s on caller thread")
+    print(f"queue (caller)    : {count / current:12,.0f} records/s on caller thread ({legacy / current:.2f}x)")
+    print(f"queue (end-to-end): {count / drained:12,.0f} records/s including listener drain ({legacy / drained:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
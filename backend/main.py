@@ -4,22 +4,49 @@ FastAPI 서버: 메모리 기반 파일 처리 (Zero Storage Policy)
 """
 from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Optional
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from typing import Dict, List, Optional, Tuple
 import uvicorn
 from dotenv import load_dotenv
 import os
 import traceback
 import logging
+import threading
+import asyncio
+import signal
+import io
+import json
+import zipfile
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
 # 분석 모듈 import
-from utils.text_extractor import extract_text_from_memory
-from utils.pii_detector import PIIDetector
-from utils.ai_analyzer import AIAnalyzer
-from utils.instagram_crawler import InstagramCrawler
+from utils.ai_analyzer import get_ai_stats, ANALYSIS_VERSION
+from utils.result_cache import document_cache_key
+from utils.instagram_crawler import (
+    InstagramCrawler,
+    SELENIUM_AVAILABLE,
+    get_browser_pool,
+    shutdown_browser_pool,
+    BROWSER_POOL_SIZE,
+    canonical_post_url,
+    get_crawl_stats,
+    get_selector_stats,
+    reset_selector_stats,
+)
+from utils.post_cache import PostMetricsCache, DEFAULT_FIELD_TTLS
+from utils.chromedriver import ChromeDriverUnavailable, chromedriver_status, get_chromedriver, reset_chromedriver
+from utils.executors import BoundedExecutor, ExecutorBusyError
+from utils.job_queue import JobQueue, JobQueueFull
+from utils.document_pipeline import extract_and_scan, warm_up_worker
+from utils.components import get_components
+from utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, Sample, render_metrics, stats_samples
+from utils.timing import get_timing_stats, merge_spans, record_request, span, start_timeline
 from utils.logger import safe_log, log_error, sanitize_for_logging
 from pydantic import BaseModel
 
@@ -29,6 +56,151 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Instagram 크롤링 전용 실행기 (블로킹 크롤링이 이벤트 루프를 막지 않도록)
+INSTAGRAM_CRAWL_TIMEOUT = float(os.getenv("INSTAGRAM_CRAWL_TIMEOUT", "45"))
+crawl_executor = BoundedExecutor(
+    "instagram-crawl",
+    max_workers=int(os.getenv("INSTAGRAM_CRAWL_WORKERS", str(BROWSER_POOL_SIZE))),
+    max_queue=int(os.getenv("INSTAGRAM_CRAWL_QUEUE", "16")),
+    timeout=INSTAGRAM_CRAWL_TIMEOUT,
+)
+
+# 백그라운드 크롤링 작업 큐 (워커 수는 크롤링 실행기 워커 수 이하로 유지해 실행기 대기열 초과 방지)
+crawl_jobs = JobQueue(
+    "instagram-jobs",
+    workers=int(os.getenv("INSTAGRAM_JOB_WORKERS", str(crawl_executor.max_workers))),
+    max_queue=int(os.getenv("INSTAGRAM_JOB_QUEUE", "100")),
+    result_ttl=float(os.getenv("INSTAGRAM_JOB_TTL", "600")),
+)
+
+# 게시물 지표 캐시 (shortcode 기준, 필드별 TTL + stale-while-revalidate + 동시 요청 병합)
+post_cache = PostMetricsCache(
+    maxsize=int(os.getenv("INSTAGRAM_CACHE_SIZE", "1024")),
+    field_ttls={
+        field: float(os.getenv(f"INSTAGRAM_CACHE_{field.upper()}_TTL", str(default)))
+        for field, default in DEFAULT_FIELD_TTLS.items()
+    },
+    default_ttl=float(os.getenv("INSTAGRAM_CACHE_DEFAULT_TTL", "300")),
+    stale_ttl=float(os.getenv("INSTAGRAM_CACHE_STALE_TTL", "3600")),
+)
+
+# 문서 텍스트 추출/PII 감지용 프로세스 풀 (0이면 스레드에서 실행)
+DOCUMENT_PROCESS_WORKERS = int(os.getenv("DOCUMENT_PROCESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+document_pool: Optional[ProcessPoolExecutor] = None
+
+
+@app.on_event("startup")
+async def init_components():
+    """공유 분석 컴포넌트 생성 및 설정 재로드 훅(SIGHUP) 등록"""
+    components = get_components()
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, components.reload)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+
+def _create_document_pool() -> ProcessPoolExecutor:
+    # 브라우저 풀 등 스레드가 이미 실행 중이므로 fork 대신 spawn 사용
+    return ProcessPoolExecutor(
+        max_workers=DOCUMENT_PROCESS_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def _warm_up_document_pool(pool: ProcessPoolExecutor):
+    """워커 프로세스를 미리 띄워 첫 요청의 spawn 비용(약 1.5초) 제거"""
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(*(
+            loop.run_in_executor(pool, warm_up_worker) for _ in range(DOCUMENT_PROCESS_WORKERS)
+        ))
+    except Exception as e:
+        log_error(e, "Document process pool warm-up failed")
+
+
+@app.on_event("startup")
+async def start_document_pool():
+    """CPU 작업(PDF/DOCX 추출, 정규식 검사)을 위한 프로세스 풀 생성 (워커 사전 실행은 백그라운드에서)"""
+    global document_pool
+    if DOCUMENT_PROCESS_WORKERS > 0:
+        document_pool = _create_document_pool()
+        asyncio.create_task(_warm_up_document_pool(document_pool))
+
+
+def _replace_document_pool(broken: ProcessPoolExecutor):
+    """
+    워커가 비정상 종료(OOM, 파서 segfault 등)되어 깨진 프로세스 풀 교체
+
+    깨진 풀은 이후 모든 작업을 거부하므로 새 풀을 만들어야 함
+    같은 풀이 동시에 깨진 여러 요청 중 첫 요청만 교체 (이미 교체되었으면 무시)
+    """
+    global document_pool
+    if document_pool is not broken:
+        return
+    safe_log(logging.WARNING, "Document process pool broken, recreating")
+    document_pool = _create_document_pool()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_document_task(fn, *args):
+    """
+    프로세스 풀(없으면 기본 스레드 풀)에서 CPU 작업 실행
+
+    워커가 죽어 풀이 깨지면 풀을 다시 만들고 한 번 재시도
+    (같은 풀에서 실행 중이던 다른 요청의 파일 때문에 깨졌을 수 있음)
+    재시도에서도 깨지면 이 요청의 파일이 원인으로 보고 ValueError로 실패 처리
+
+    Raises:
+        ValueError: 재시도 후에도 워커가 비정상 종료됨
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = document_pool
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            _replace_document_pool(pool)
+            if attempt:
+                raise ValueError("Document processing worker crashed")
+
+
+@app.on_event("startup")
+async def warm_up_browser_pool():
+    """ChromeDriver 경로 확인 후 Selenium 브라우저 풀 사전 실행 (요청 처리를 막지 않도록 백그라운드에서)"""
+    if SELENIUM_AVAILABLE:
+        def _warm_up():
+            try:
+                get_chromedriver()
+            except ChromeDriverUnavailable:
+                safe_log(logging.WARNING, "ChromeDriver unavailable, Instagram crawls will use HTTP only")
+                return
+            get_browser_pool().warm_up()
+
+        threading.Thread(
+            target=_warm_up,
+            name="browser-pool-warmup",
+            daemon=True,
+        ).start()
+
+
+@app.on_event("startup")
+async def start_crawl_jobs():
+    """백그라운드 크롤링 작업 워커 시작"""
+    crawl_jobs.start()
+
+
+@app.on_event("shutdown")
+async def close_browser_pool():
+    """앱 종료 시 작업 큐, 브라우저, 크롤링 실행기 및 문서 프로세스 풀 정리"""
+    await crawl_jobs.stop()
+    crawl_executor.shutdown()
+    shutdown_browser_pool()
+    if document_pool is not None:
+        document_pool.shutdown(wait=False, cancel_futures=True)
+    await get_components().aclose()
+
+
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -73,6 +245,23 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+@app.middleware("http")
+async def server_timing(request: Request, call_next):
+    """
+    요청마다 단계별 소요 시간 타임라인을 시작하고 Server-Timing 응답 헤더로 반환
+
+    스트리밍 응답은 헤더를 먼저 보내므로 본문 전송 중에 측정된 단계는 헤더에 포함되지 않음
+    (전역 통계에는 기록됨, /api/diagnostics/timings)
+    """
+    timeline = start_timeline()
+    response = await call_next(request)
+    response.headers["Server-Timing"] = timeline.server_timing()
+    route = request.scope.get("route")
+    if route is not None:
+        record_request(request.method, route.path, response.status_code, timeline.elapsed_ms())
+    return response
+
+
 # OPTIONS 요청 명시적 처리 (CORS preflight)
 @app.options("/api/analyze")
 async def options_analyze():
@@ -98,126 +287,174 @@ async def root():
     }
 
 
-@app.post("/api/analyze")
-async def analyze_document(file: UploadFile = File(...)):
-    """
-    문서 분석 엔드포인트
-    
-    핵심 원칙:
-    - 파일을 디스크에 저장하지 않음
-    - 메모리(RAM)에서만 처리
-    - 분석 완료 후 즉시 데이터 휘발
-    """
-    # 파일명 검증 (보안)
-    if file.filename:
+# 문서 분석 입력 제한
+ALLOWED_CONTENT_TYPES = ["application/pdf", "text/plain", 
+                         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+
+# 배치 분석 설정
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "200"))
+BATCH_MAX_TOTAL_SIZE = int(os.getenv("BATCH_MAX_TOTAL_SIZE", str(200 * 1024 * 1024)))  # 압축 해제 후 전체 크기
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", str(max(1, DOCUMENT_PROCESS_WORKERS))))
+ZIP_CONTENT_TYPES = ["application/zip", "application/x-zip-compressed"]
+EXTENSION_CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+DISCLAIMER = "본 분석 결과는 참고용으로 제공되며, 법적 자문을 대체하지 않습니다. 자동화된 시스템에 의한 분석으로, 실제 법적 검토나 전문가의 의견을 대신할 수 없습니다. 본 서비스는 분석 결과에 대한 법적 책임을 지지 않으며, 중요한 문서의 경우 반드시 법무 전문가의 검토를 받으시기 바랍니다."
+
+
+def validate_upload(filename: Optional[str], content_type: Optional[str]):
+    """파일명/파일 타입 검증 (보안)"""
+    if filename:
         # 파일명에 위험한 문자 제거
         dangerous_chars = ['..', '/', '\\', '\x00']
-        if any(char in file.filename for char in dangerous_chars):
-            safe_log(logging.WARNING, f"Potentially dangerous filename detected: {file.filename}")
+        if any(char in filename for char in dangerous_chars):
+            safe_log(logging.WARNING, "Potentially dangerous filename detected: %s", filename)
             raise HTTPException(
                 status_code=400,
                 detail="Invalid filename. Please use a safe filename."
             )
     
     # 허용된 파일 타입 검증
-    allowed_types = ["application/pdf", "text/plain", 
-                     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]
-    
-    if not file.content_type or file.content_type not in allowed_types:
-        safe_log(logging.WARNING, f"Unsupported file type: {file.content_type}")
+    if not content_type or content_type not in ALLOWED_CONTENT_TYPES:
+        safe_log(logging.WARNING, "Unsupported file type: %s", content_type)
         raise HTTPException(
             status_code=400,
             detail="Unsupported file type. Allowed types: PDF, TXT, DOCX"
         )
+
+
+def validate_file_size(size: int):
+    """파일 크기 검증 (최대 10MB, 빈 파일 불가)"""
+    if size > MAX_FILE_SIZE:
+        safe_log(logging.WARNING, "File size exceeds limit: %s bytes", size)
+        raise HTTPException(
+            status_code=400,
+            detail=f"File size exceeds maximum limit of {MAX_FILE_SIZE / (1024*1024)}MB"
+        )
     
-    try:
-        # 메모리에서 파일 읽기 (디스크에 저장하지 않음)
-        file_content = await file.read()
+    # 빈 파일 검증
+    if size == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="File is empty. Please upload a file with content."
+        )
+
+
+async def analyze_file_content(filename: Optional[str], content_type: str, file_content: bytes) -> Dict:
+    """
+    메모리 상의 파일 바이트 분석 (텍스트 추출 → PII 감지 → AI 분석)
+    
+    Returns:
+        분석 응답 본문
         
-        # 파일 크기 제한 (예: 10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        if len(file_content) > max_size:
-            safe_log(logging.WARNING, f"File size exceeds limit: {len(file_content)} bytes")
-            raise HTTPException(
-                status_code=400,
-                detail=f"File size exceeds maximum limit of {max_size / (1024*1024)}MB"
+    Raises:
+        HTTPException: 텍스트 추출 실패(400) 또는 분석 오류(500)
+    """
+    # 파일 정보 (메타데이터만, 민감 정보 제외)
+    file_info = {
+        "filename": filename or "unknown",
+        "content_type": content_type,
+        "size_bytes": len(file_content)
+    }
+    
+    safe_log(logging.INFO, "File received: %s, size: %s bytes", file_info['filename'], file_info['size_bytes'])
+    
+    # Step 2: 텍스트 추출 및 분석 로직
+    try:
+        # 1. 텍스트 추출 + 2. 1차 분석: PII 감지 (Rule-based)
+        # CPU 작업이므로 프로세스 풀에서 실행 (바이트 → 텍스트/감지 결과, 디스크 사용 없음)
+        # 단계별 소요 시간은 워커 프로세스에서 측정해 반환되므로 현재 요청 타임라인에 합침
+        with span("extract_scan"):
+            extracted_text, pii_result, stage_timings = await run_document_task(
+                extract_and_scan, file_content, content_type
             )
+        merge_spans(stage_timings)
         
-        # 빈 파일 검증
-        if len(file_content) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="File is empty. Please upload a file with content."
-            )
+        # 메모리에서 원본 파일 데이터 제거 (텍스트만 유지)
+        del file_content
         
-        # 파일 정보 (메타데이터만, 민감 정보 제외)
-        file_info = {
-            "filename": file.filename or "unknown",
-            "content_type": file.content_type,
-            "size_bytes": len(file_content)
-        }
+        # 3. 2차 분석: AI 기반 문맥 분석 (AsyncOpenAI로 응답 대기 중에도 다른 요청 처리)
+        # 같은 텍스트의 OpenAI 분석 결과가 캐시에 있으면 재사용 (캐시에는 결과만 저장)
+        components = get_components()
+        cache_key = document_cache_key(extracted_text, ANALYSIS_VERSION)
+        ai_result = components.analysis_cache.get(cache_key)
+        if ai_result is None:
+            with span("ai"):
+                ai_result = await components.ai_analyzer.analyze_context_async(extracted_text, pii_result["summary"])
+            # Mock/폴백 결과와 일부 청크가 실패한 결과는 캐시하지 않음 (일시적인 API 장애가 고정되지 않도록)
+            if ai_result.get("method") == "openai" and not ai_result.get("partial"):
+                components.analysis_cache.set(cache_key, ai_result)
+        else:
+            safe_log(logging.INFO, "AI analysis served from cache")
         
-        safe_log(logging.INFO, f"File received: {file_info['filename']}, size: {file_info['size_bytes']} bytes")
+        # 최종 위험도 결정 (PII와 AI 분석 결과 종합)
+        final_risk_level = "low"
+        if pii_result["summary"]["high_severity"] > 0:
+            final_risk_level = "high"
+        elif ai_result["result"]["risk_level"] == "high":
+            final_risk_level = "high"
+        elif pii_result["summary"]["total_count"] > 0 or ai_result["result"]["risk_level"] == "medium":
+            final_risk_level = "medium"
         
-        # Step 2: 텍스트 추출 및 분석 로직
-        try:
-            # 1. 텍스트 추출 (메모리에서)
-            extracted_text = extract_text_from_memory(file_content, file.content_type)
-            
-            # 메모리에서 원본 파일 데이터 제거 (텍스트만 유지)
-            del file_content
-            
-            # 2. 1차 분석: PII 감지 (Rule-based)
-            pii_detector = PIIDetector()
-            pii_result = pii_detector.detect_all(extracted_text)
-            
-            # 3. 2차 분석: AI 기반 문맥 분석
-            ai_analyzer = AIAnalyzer()
-            ai_result = ai_analyzer.analyze_context(extracted_text, pii_result["summary"])
-            
-            # 최종 위험도 결정 (PII와 AI 분석 결과 종합)
-            final_risk_level = "low"
-            if pii_result["summary"]["high_severity"] > 0:
-                final_risk_level = "high"
-            elif ai_result["result"]["risk_level"] == "high":
-                final_risk_level = "high"
-            elif pii_result["summary"]["total_count"] > 0 or ai_result["result"]["risk_level"] == "medium":
-                final_risk_level = "medium"
-            
-            # 메모리에서 추출된 텍스트도 제거
-            del extracted_text
-            
-            return {
-                "status": "success",
-                "message": "File analyzed in memory (not stored on disk)",
-                "file_info": file_info,
-                "analysis": {
-                    "risk_level": final_risk_level,
-                    "pii_analysis": {
-                        "findings": pii_result["pii_findings"],
-                        "summary": pii_result["summary"]
-                    },
-                    "ai_analysis": ai_result,
-                    "storage_policy": "Zero Storage - All data processed in memory only and immediately discarded",
-                    "disclaimer": "본 분석 결과는 참고용으로 제공되며, 법적 자문을 대체하지 않습니다. 자동화된 시스템에 의한 분석으로, 실제 법적 검토나 전문가의 의견을 대신할 수 없습니다. 본 서비스는 분석 결과에 대한 법적 책임을 지지 않으며, 중요한 문서의 경우 반드시 법무 전문가의 검토를 받으시기 바랍니다."
-                }
+        # 메모리에서 추출된 텍스트도 제거
+        del extracted_text
+        
+        return {
+            "status": "success",
+            "message": "File analyzed in memory (not stored on disk)",
+            "file_info": file_info,
+            "analysis": {
+                "risk_level": final_risk_level,
+                "pii_analysis": {
+                    "findings": pii_result["pii_findings"],
+                    "summary": pii_result["summary"]
+                },
+                "ai_analysis": ai_result,
+                "storage_policy": "Zero Storage - All data processed in memory only and immediately discarded",
+                "disclaimer": DISCLAIMER
             }
-            
-        except ValueError as ve:
-            # 텍스트 추출 실패
-            log_error(ve, "Text extraction failed")
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to extract text from file. Please ensure the file is not corrupted."
-            )
-        except Exception as analysis_error:
-            # 분석 중 오류 발생
-            # 보안: 상세한 에러 정보는 로그에만 기록
-            log_error(analysis_error, "Analysis error")
-            raise HTTPException(
-                status_code=500,
-                detail="An error occurred during analysis. Please try again."
-            )
+        }
+        
+    except ValueError as ve:
+        # 텍스트 추출 실패
+        log_error(ve, "Text extraction failed")
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to extract text from file. Please ensure the file is not corrupted."
+        )
+    except Exception as analysis_error:
+        # 분석 중 오류 발생
+        # 보안: 상세한 에러 정보는 로그에만 기록
+        log_error(analysis_error, "Analysis error")
+        raise HTTPException(
+            status_code=500,
+            detail="An error occurred during analysis. Please try again."
+        )
+
+
+@app.post("/api/analyze")
+async def analyze_document(file: UploadFile = File(...)):
+    """
+    문서 분석 엔드포인트
+    
+    핵심 원칙:
+    - 파일을 디스크에 저장하지 않음
+    - 메모리(RAM)에서만 처리
+    - 분석 완료 후 즉시 데이터 휘발
+    - 재업로드 대비 AI 분석 결과만 텍스트 해시를 키로 캐시 (원문은 보관하지 않음)
+    """
+    validate_upload(file.filename, file.content_type)
+    
+    try:
+        # 메모리에서 파일 읽기 (디스크에 저장하지 않음)
+        file_content = await file.read()
+        validate_file_size(len(file_content))
+        
+        return await analyze_file_content(file.filename, file.content_type, file_content)
         
     except HTTPException:
         raise
@@ -230,9 +467,207 @@ async def analyze_document(file: UploadFile = File(...)):
         )
 
 
+def unpack_zip_in_memory(
+    content: bytes, total_size: List[int]
+) -> List[Tuple[str, Optional[str], Optional[bytes], Optional[str]]]:
+    """
+    ZIP 파일을 메모리에서 풀어 (파일명, 타입, 바이트, 오류) 목록 반환 (디스크에 풀지 않음)
+    
+    크기 제한을 넘는 항목은 바이트를 읽지 않고 None으로 반환 (분석 시 크기 오류로 보고)
+    읽을 수 없는 항목(손상, 암호화, 지원하지 않는 압축 방식)은 오류 메시지와 함께 반환해 해당 항목만 오류로 보고
+    total_size[0]에 압축 해제된 누적 크기를 더하며, BATCH_MAX_TOTAL_SIZE를 넘으면 400 오류
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Invalid ZIP file.")
+    
+    documents = []
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                continue
+            name = os.path.basename(info.filename)
+            content_type = EXTENSION_CONTENT_TYPES.get(os.path.splitext(name)[1].lower())
+            if content_type is None or info.file_size > MAX_FILE_SIZE:
+                # 지원하지 않는 형식(타입 None) / 크기 초과(바이트 None)는 읽지 않고 오류로 보고
+                documents.append((name, content_type, None if content_type else b"", None))
+                continue
+            total_size[0] += info.file_size
+            if total_size[0] > BATCH_MAX_TOTAL_SIZE:
+                raise HTTPException(status_code=400, detail="Batch exceeds maximum total size.")
+            try:
+                documents.append((name, content_type, archive.read(info), None))
+            except (zipfile.BadZipFile, zlib.error):
+                documents.append((name, content_type, None, "Corrupted ZIP entry."))
+            except RuntimeError:
+                # 암호화된 항목 (비밀번호 없이 읽을 수 없음)
+                documents.append((name, content_type, None, "Encrypted ZIP entries are not supported."))
+            except NotImplementedError:
+                documents.append((name, content_type, None, "Unsupported ZIP compression method."))
+    return documents
+
+
+@app.post("/api/analyze/batch")
+async def analyze_batch(files: List[UploadFile] = File(...)):
+    """
+    여러 문서 일괄 분석 엔드포인트 (여러 파일 또는 ZIP 파일)
+    
+    파일별 분석을 동시에 실행하고(BATCH_CONCURRENCY), 끝나는 순서대로
+    NDJSON(한 줄에 하나의 JSON) 형식으로 결과를 스트리밍
+    각 줄은 index(업로드/ZIP 내 순서)와 /api/analyze와 같은 응답 본문 또는 오류를 포함
+    ZIP은 메모리에서만 풀며 디스크에 저장하지 않음
+    """
+    documents: List[Tuple[str, Optional[str], Optional[bytes], Optional[str]]] = []
+    total_size = [0]
+    for upload in files:
+        content = await upload.read()
+        is_zip = upload.content_type in ZIP_CONTENT_TYPES or (upload.filename or "").lower().endswith(".zip")
+        if is_zip:
+            documents.extend(unpack_zip_in_memory(content, total_size))
+        else:
+            total_size[0] += len(content)
+            if total_size[0] > BATCH_MAX_TOTAL_SIZE:
+                raise HTTPException(status_code=400, detail="Batch exceeds maximum total size.")
+            documents.append((upload.filename, upload.content_type, content, None))
+        if len(documents) > BATCH_MAX_FILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many files. Maximum {BATCH_MAX_FILES} files per batch."
+            )
+    
+    if not documents:
+        raise HTTPException(status_code=400, detail="No files to analyze.")
+    
+    safe_log(logging.INFO, "Batch received: %s files", len(documents))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def _analyze_one(
+        index: int,
+        filename: Optional[str],
+        content_type: Optional[str],
+        content: Optional[bytes],
+        error: Optional[str],
+    ) -> Dict:
+        async with semaphore:
+            try:
+                if error is not None:
+                    raise HTTPException(status_code=400, detail=error)
+                validate_upload(filename, content_type)
+                validate_file_size(MAX_FILE_SIZE + 1 if content is None else len(content))
+                result = await analyze_file_content(filename, content_type, content)
+            except HTTPException as e:
+                return {
+                    "index": index,
+                    "status": "error",
+                    "file_info": {"filename": filename or "unknown", "content_type": content_type},
+                    "detail": e.detail,
+                }
+            except Exception as e:
+                log_error(e, "Batch file processing error")
+                return {
+                    "index": index,
+                    "status": "error",
+                    "file_info": {"filename": filename or "unknown", "content_type": content_type},
+                    "detail": "An error occurred while processing the file. Please try again.",
+                }
+            return {"index": index, **result}
+    
+    async def _stream():
+        tasks = [asyncio.create_task(_analyze_one(index, *document)) for index, document in enumerate(documents)]
+        # 파일 바이트는 각 작업만 참조하도록 목록 비우기 (작업이 끝나면 바로 해제)
+        documents.clear()
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield json.dumps(await next_result, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+@app.get("/api/analyze/stats")
+async def analyze_stats():
+    """AI 분석 호출 통계 (폴백 비율 등) 및 결과 캐시 적중률 조회"""
+    return {"status": "ok", "ai": get_ai_stats(), "cache": get_components().analysis_cache.stats()}
+
+
 # 인스타그램 크롤링 요청 모델
 class InstagramRequest(BaseModel):
     url: str
+    background: bool = False  # True면 작업 ID를 즉시 반환하고 백그라운드에서 크롤링
+    priority: int = 0  # 백그라운드 작업 우선순위 (-10~10, 클수록 먼저 실행)
+
+
+class InstagramBatchRequest(BaseModel):
+    urls: List[str]
+
+
+INSTAGRAM_BATCH_MAX_URLS = int(os.getenv("INSTAGRAM_BATCH_MAX_URLS", "500"))
+
+
+def format_instagram_data(data: Dict) -> Dict:
+    """크롤링 결과를 API 응답 형식으로 변환"""
+    return {
+        "url": data.get("url"),
+        "post_id": data.get("post_id"),
+        "username": data.get("username"),
+        "like_count": data.get("like_count"),
+        "comment_count": data.get("comment_count"),
+        "share_count": None,  # Instagram은 공유 수를 직접 제공하지 않음
+        "post_date": data.get("post_date"),
+        "caption": data.get("caption"),
+        "method": data.get("method", "unknown"),
+        "extraction_methods": data.get("extraction_methods", {}),  # 추출 방법 정보
+        "transfer": data.get("transfer"),  # 브라우저 크롤링 전송량 (bytes, requests, blocked)
+    }
+
+
+async def crawl_instagram_post(crawler: InstagramCrawler, url: str) -> Dict:
+    """
+    게시물 캐시를 거쳐(없거나 만료 시 전용 실행기에서 크롤링) 응답 형식의 데이터 반환
+    
+    Raises:
+        HTTPException: 대기열 초과(503), 타임아웃(504), 크롤링 실패(400/500)
+    """
+    post_id = crawler.parse_instagram_url(url)
+    
+    # 크롤링 실행 (전용 스레드 풀에서 실행하여 이벤트 루프 블로킹 방지)
+    # 같은 게시물은 URL 형태(/p/, /reel/, 쿼리 문자열)와 관계없이 하나의 캐시 항목을 공유
+    def _crawl():
+        return crawl_executor.run(crawler.crawl_post, canonical_post_url(post_id))
+    
+    try:
+        data, cache_status = await post_cache.get_or_fetch(post_id, _crawl)
+        result = format_instagram_data(data)
+        result["cache"] = cache_status
+        return result
+        
+    except ExecutorBusyError:
+        safe_log(logging.WARNING, "Instagram crawl queue is full")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many Instagram requests in progress. Please try again shortly."
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Instagram crawl timed out after {INSTAGRAM_CRAWL_TIMEOUT:.0f} seconds. Please try again later."
+        )
+    except ValueError as ve:
+        # 크롤링 실패
+        raise HTTPException(
+            status_code=400,
+            detail=str(ve)
+        )
+    except Exception as crawl_error:
+        log_error(crawl_error, f"Error crawling Instagram post: {url}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to crawl Instagram post. Instagram may have changed their structure or the post may be private."
+        )
 
 
 @app.post("/api/instagram/analyze")
@@ -264,41 +699,36 @@ async def analyze_instagram(request: InstagramRequest):
                 detail="Invalid Instagram URL. Please provide a valid Instagram post URL (e.g., https://www.instagram.com/p/ABC123/)"
             )
         
-        safe_log(logging.INFO, f"Instagram URL received: {request.url}")
+        safe_log(logging.INFO, "Instagram URL received: %s", request.url)
         
-        # 크롤링 실행
-        try:
-            data = crawler.crawl_post(request.url)
-            
-            return {
-                "status": "success",
-                "message": "Instagram post analyzed successfully",
-                "data": {
-                    "url": data.get("url"),
-                    "post_id": data.get("post_id"),
-                    "username": data.get("username"),
-                    "like_count": data.get("like_count"),
-                    "comment_count": data.get("comment_count"),
-                    "share_count": None,  # Instagram은 공유 수를 직접 제공하지 않음
-                    "post_date": data.get("post_date"),
-                    "caption": data.get("caption"),
-                    "method": data.get("method", "unknown"),
-                    "extraction_methods": data.get("extraction_methods", {}),  # 추출 방법 정보
-                }
-            }
-            
-        except ValueError as ve:
-            # 크롤링 실패
-            raise HTTPException(
-                status_code=400,
-                detail=str(ve)
-            )
-        except Exception as crawl_error:
-            log_error(crawl_error, f"Error crawling Instagram post: {request.url}")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to crawl Instagram post. Instagram may have changed their structure or the post may be private."
+        if request.background:
+            # 크롤링 동안 연결을 붙잡지 않도록 작업 ID만 즉시 반환 (GET /api/instagram/jobs/{job_id}로 조회)
+            try:
+                job = crawl_jobs.submit(
+                    lambda: crawl_instagram_post(crawler, request.url),
+                    kind="instagram_analyze",
+                    priority=max(-10, min(10, request.priority)),
+                )
+            except JobQueueFull:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many Instagram jobs queued. Please try again shortly."
+                )
+            return JSONResponse(
+                status_code=202,
+                content={
+                    "status": "accepted",
+                    "message": "Instagram post analysis queued",
+                    "job_id": job.id,
+                    "status_url": f"/api/instagram/jobs/{job.id}",
+                },
             )
+        
+        return {
+            "status": "success",
+            "message": "Instagram post analyzed successfully",
+            "data": await crawl_instagram_post(crawler, request.url)
+        }
             
     except HTTPException:
         raise
@@ -310,6 +740,198 @@ async def analyze_instagram(request: InstagramRequest):
         )
 
 
+@app.get("/api/instagram/jobs/{job_id}")
+async def get_instagram_job(job_id: str):
+    """
+    백그라운드 크롤링 작업 상태/결과 조회
+    
+    Returns:
+        status(queued/running/succeeded/failed)와 완료 시 result 또는 error
+        (완료 후 INSTAGRAM_JOB_TTL초가 지나면 404)
+    """
+    job = crawl_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job.to_dict()
+
+
+@app.post("/api/instagram/analyze/batch")
+async def analyze_instagram_batch(request: InstagramBatchRequest):
+    """
+    인스타그램 게시물 일괄 분석 엔드포인트
+    
+    URL을 게시물 ID(shortcode)로 정규화해 중복을 제거한 뒤(/p/, /reel/, 쿼리 문자열 차이 무시)
+    브라우저 풀과 공유 HTTP 세션으로 동시에 크롤링하고, 끝나는 순서대로 NDJSON으로 스트리밍
+    각 줄은 post_id, 해당 게시물로 정규화된 입력 URL 목록(urls), 결과(data) 또는 오류(detail)를 포함
+    """
+    if not request.urls:
+        raise HTTPException(status_code=400, detail="At least one URL is required")
+    if len(request.urls) > INSTAGRAM_BATCH_MAX_URLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many URLs. Maximum {INSTAGRAM_BATCH_MAX_URLS} URLs per batch."
+        )
+    
+    crawler = InstagramCrawler()
+    
+    # shortcode 기준 중복 제거 (입력 순서 유지)
+    posts: Dict[str, List[str]] = {}
+    invalid_urls = []
+    for url in request.urls:
+        post_id = crawler.parse_instagram_url(url) if crawler.validate_url(url) else None
+        if post_id is None:
+            invalid_urls.append(url)
+        else:
+            posts.setdefault(post_id, []).append(url)
+    
+    safe_log(logging.INFO, "Instagram batch received: %s URLs, %s unique posts", len(request.urls), len(posts))
+    
+    # 배치 하나가 실행기 대기열을 모두 차지하지 않도록 동시 크롤링 수를 실행기 워커 수로 제한
+    semaphore = asyncio.Semaphore(crawl_executor.max_workers)
+    
+    async def _crawl_one(post_id: str, urls: List[str]) -> Dict:
+        async with semaphore:
+            try:
+                data = await crawl_instagram_post(crawler, canonical_post_url(post_id))
+            except HTTPException as e:
+                return {"post_id": post_id, "urls": urls, "status": "error", "detail": e.detail}
+        return {"post_id": post_id, "urls": urls, "status": "success", "data": data}
+    
+    async def _stream():
+        for url in invalid_urls:
+            yield json.dumps({"post_id": None, "urls": [url], "status": "error", "detail": "Invalid Instagram URL"}, ensure_ascii=False) + "\n"
+        tasks = [asyncio.create_task(_crawl_one(post_id, urls)) for post_id, urls in posts.items()]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield json.dumps(await next_result, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+@app.get("/api/instagram/pool/stats")
+async def instagram_pool_stats():
+    """Selenium 브라우저 풀, 크롤링 실행기, 게시물 캐시 및 티어별 크롤링 통계 조회"""
+    stats = {
+        "executor": crawl_executor.stats(),
+        "jobs": crawl_jobs.stats(),
+        "cache": post_cache.stats(),
+        "crawl": get_crawl_stats(),
+    }
+    if not SELENIUM_AVAILABLE:
+        return {"status": "disabled", "pool": None, **stats}
+    return {"status": "ok", "pool": get_browser_pool().stats(), "chromedriver": chromedriver_status(), **stats}
+
+
+@app.post("/api/instagram/chromedriver/reset")
+async def reset_instagram_chromedriver():
+    """
+    캐시된 ChromeDriver 확인 결과를 초기화하고 다시 확인 (드라이버 설치/경로 수정 후 재시작 없이 복구)
+
+    확인에 webdriver-manager 다운로드가 포함될 수 있으므로 스레드에서 실행
+    결과는 /api/instagram/pool/stats 의 chromedriver 항목과 같은 형식
+    """
+    if not SELENIUM_AVAILABLE:
+        return {"status": "disabled", "chromedriver": None}
+
+    def _resolve():
+        reset_chromedriver()
+        try:
+            get_chromedriver()
+        except ChromeDriverUnavailable:
+            pass
+
+    await asyncio.get_running_loop().run_in_executor(None, _resolve)
+    return {"status": "ok", "chromedriver": chromedriver_status()}
+
+
+@app.get("/api/instagram/selectors")
+async def instagram_selector_stats():
+    """필드별 DOM 셀렉터/텍스트 패턴의 학습된 시도 순서와 성공률, 평가 비용 조회"""
+    return {"status": "ok", **get_selector_stats()}
+
+
+@app.delete("/api/instagram/selectors")
+async def reset_instagram_selectors(group: Optional[str] = None):
+    """셀렉터 학습 기록 초기화 (group 지정 시 해당 필드만, 예: like_count, like_count_text)"""
+    reset_selector_stats(group)
+    return {"status": "ok", **get_selector_stats()}
+
+
+@app.get("/api/diagnostics/timings")
+async def diagnostics_timings():
+    """단계별(추출, PII, OpenAI, 브라우저 임대/페이지 로드 등) 및 엔드포인트별 소요 시간 통계 조회"""
+    return {"status": "ok", "stages": get_timing_stats()}
+
+
+def _metric_samples() -> List[Sample]:
+    """각 구성 요소의 stats()를 /metrics 샘플로 변환"""
+    ai_stats = get_ai_stats()
+    samples = stats_samples(
+        "checking_ai_openai", ai_stats,
+        counters=("calls", "success", "fallbacks", "mock", "retries", "timeouts", "partial"),
+        documentation="OpenAI analysis",
+    )
+    errors = Sample("checking_ai_openai_errors_total", "counter", "OpenAI calls failed after retries by exception type", ("type",))
+    for error_type, count in sorted(ai_stats["errors"].items()):
+        errors.add(count, error_type)
+    samples.append(errors)
+
+    samples += stats_samples(
+        "checking_ai_analysis_cache", get_components().analysis_cache.stats(),
+        counters=("hits", "misses", "evictions", "expirations"), gauges=("size", "hit_rate"),
+        documentation="AI analysis result cache",
+    )
+    samples += stats_samples(
+        "checking_ai_post_cache", post_cache.stats(),
+        counters=("hits", "stale_hits", "misses", "coalesced", "refreshes", "refresh_failures", "evictions"),
+        gauges=("size", "inflight", "hit_rate"),
+        documentation="Instagram post metrics cache",
+    )
+    samples += stats_samples(
+        "checking_ai_crawl_executor", crawl_executor.stats(),
+        counters=("completed", "failed", "timeouts", "rejected"), gauges=("in_flight", "running", "queue_depth", "max_workers"),
+        documentation="Crawl executor",
+    )
+    samples += stats_samples(
+        "checking_ai_jobs", crawl_jobs.stats(),
+        counters=("submitted", "succeeded", "failed", "rejected", "expired"), gauges=("pending", "running", "retained"),
+        documentation="Background crawl jobs",
+    )
+    if SELENIUM_AVAILABLE:
+        samples += stats_samples(
+            "checking_ai_browser_pool", get_browser_pool().stats(),
+            counters=("created", "recycled", "crashed", "leases", "warm_leases", "cold_leases", "lease_timeouts"),
+            gauges=("size", "live", "in_use", "idle"),
+            documentation="Selenium browser pool",
+        )
+
+    crawl_stats = get_crawl_stats()
+    samples.append(Sample("checking_ai_crawls_total", "counter", "Instagram crawls (cache misses)").add(crawl_stats["crawls"]))
+    tier_attempts = Sample("checking_ai_crawl_tier_attempts_total", "counter", "Crawl tier attempts", ("tier",))
+    tier_complete = Sample("checking_ai_crawl_tier_complete_total", "counter", "Crawl tier attempts that filled every field", ("tier",))
+    tier_failures = Sample("checking_ai_crawl_tier_failures_total", "counter", "Crawl tier attempts that failed", ("tier",))
+    for tier, stats in crawl_stats["tiers"].items():
+        tier_attempts.add(stats["attempts"], tier)
+        tier_complete.add(stats["complete"], tier)
+        tier_failures.add(stats["failures"], tier)
+    samples += [tier_attempts, tier_complete, tier_failures]
+    samples.append(
+        Sample("checking_ai_browser_transfer_bytes_total", "counter", "Bytes transferred by measured browser crawls")
+        .add(crawl_stats["browser_transfer"]["bytes_total"])
+    )
+    return samples
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭 (요청/단계별 지연 히스토그램, OpenAI 폴백, 캐시, 브라우저 풀, 필드별 추출 방법)"""
+    return PlainTextResponse(render_metrics(_metric_samples()), media_type=METRICS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     # Railway나 다른 클라우드 환경에서는 PORT 환경 변수 사용
     port = int(os.getenv("PORT", 8000))
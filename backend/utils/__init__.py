@@ -1,9 +1,9 @@
 """
 Utils 패키지 초기화 파일
 """
-from .text_extractor import extract_text_from_memory
+from .text_extractor import extract_text_from_memory, iter_text_pages
 from .pii_detector import PIIDetector
 from .ai_analyzer import AIAnalyzer
 
-__all__ = ["extract_text_from_memory", "PIIDetector", "AIAnalyzer"]
+__all__ = ["extract_text_from_memory", "iter_text_pages", "PIIDetector", "AIAnalyzer"]
 
@@ -6,35 +6,157 @@ API Key가 없으면 Mocking 처리
 import os
 import json
 import re
-from typing import Dict, Optional
+import asyncio
+import random
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
 import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 from utils.logger import safe_log, log_error
+from utils.chunking import TextChunk, split_into_chunks, estimate_tokens
+from utils.timing import span
 import logging
 
 
+# 환경 변수 로드
+load_dotenv()
+
+# OpenAI HTTP 연결 풀 설정 (공유 클라이언트가 keep-alive 연결을 재사용)
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+
+OPENAI_MODEL = "gpt-4o-mini"
+# 프롬프트/응답 형식을 바꾸면 올려서 이전 분석 결과 캐시를 무효화
+PROMPT_VERSION = "2"
+ANALYSIS_VERSION = f"{OPENAI_MODEL}:prompt-v{PROMPT_VERSION}"
+
+# 비동기 호출 제한 설정
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))  # 동시에 진행 중인 최대 호출 수
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))  # 호출 1회 타임아웃 (초)
+OPENAI_DEADLINE = float(os.getenv("OPENAI_DEADLINE", "60"))  # 재시도를 포함한 분석 1건의 전체 마감 시간 (초)
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))  # 429/5xx/연결 오류 시 최대 재시도 횟수
+OPENAI_BACKOFF_BASE = float(os.getenv("OPENAI_BACKOFF_BASE", "0.5"))  # 재시도 대기 기본값 (초, 지수 증가 + 지터)
+
+# 긴 문서 분할 분석 설정
+OPENAI_CHUNK_CHARS = int(os.getenv("OPENAI_CHUNK_CHARS", "8000"))  # 청크 최대 길이 (문자)
+OPENAI_TOKEN_BUDGET = int(os.getenv("OPENAI_TOKEN_BUDGET", "32000"))  # 문서 1건당 입력 토큰 예산 (초과분 청크는 분석 생략)
+
+RISK_ORDER = {"low": 0, "medium": 1, "high": 2}
+
+LEASE_KEYWORDS = [
+    '전세', '임대차', '임차인', '임대인', '보증금', '계약서', 
+    '전세계약', '주택임대차', '전세보증금', '확정일자', '전입신고'
+]
+
+# 재시도할 오류 (429, 5xx, 타임아웃, 연결 오류)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+# 모든 비동기 호출이 공유하는 동시 실행 제한
+_openai_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+# 호출 통계
+_stats_lock = threading.Lock()
+_stats = {
+    "calls": 0,
+    "success": 0,
+    "fallbacks": 0,
+    "mock": 0,
+    "retries": 0,
+    "timeouts": 0,
+    "partial": 0,
+}
+# 재시도 후에도 실패한 호출의 예외 유형별 횟수 (RateLimitError, APIConnectionError 등)
+_errors: Dict[str, int] = {}
+
+
+def _record(key: str, amount: int = 1):
+    with _stats_lock:
+        _stats[key] += amount
+
+
+def _record_error(error: BaseException):
+    with _stats_lock:
+        name = type(error).__name__
+        _errors[name] = _errors.get(name, 0) + 1
+
+
+def get_ai_stats() -> Dict[str, Any]:
+    """AI 분석 호출 통계 (fallback_rate: 실제 호출 중 Mock으로 폴백된 비율)"""
+    with _stats_lock:
+        stats = dict(_stats)
+        stats["errors"] = dict(_errors)
+    attempted = stats["success"] + stats["fallbacks"]
+    stats["fallback_rate"] = round(stats["fallbacks"] / attempted, 4) if attempted else 0.0
+    stats["in_flight_limit"] = OPENAI_MAX_CONCURRENCY
+    return stats
+
+
 class AIAnalyzer:
     """AI 기반 문서 분석 클래스"""
     
-    def __init__(self):
-        # .env 파일을 다시 로드하여 최신 환경 변수 가져오기
-        load_dotenv()
-        self.api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Args:
+            api_key: OpenAI API Key (없으면 OPENAI_API_KEY 환경 변수 사용)
+        """
+        self.api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
         self.use_mock = self.api_key is None or self.api_key.strip() == "" or self.api_key == "your-openai-api-key-here"
         
+        self.client = None
+        self.async_client = None
         if not self.use_mock:
             try:
-                # OpenAI 클라이언트 초기화 (명시적으로 api_key만 전달)
-                self.client = OpenAI(api_key=self.api_key.strip())
+                # OpenAI 클라이언트 초기화 (keep-alive 연결 풀을 명시적으로 구성)
+                limits = httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+                )
+                self.client = OpenAI(
+                    api_key=self.api_key.strip(),
+                    timeout=OPENAI_TIMEOUT,
+                    http_client=openai.DefaultHttpxClient(limits=limits),
+                )
+                # 비동기 클라이언트: 재시도는 _request_with_retries에서 직접 처리
+                self.async_client = AsyncOpenAI(
+                    api_key=self.api_key.strip(),
+                    timeout=OPENAI_TIMEOUT,
+                    max_retries=0,
+                    http_client=openai.DefaultAsyncHttpxClient(limits=limits),
+                )
             except Exception as e:
                 # OpenAI 클라이언트 생성 실패 시 Mock 모드로 폴백
                 log_error(e, "OpenAI client initialization")
                 self.use_mock = True
                 self.client = None
-        else:
+                self.async_client = None
+    
+    def close(self):
+        """동기 OpenAI 클라이언트의 HTTP 연결 정리"""
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception as e:
+                log_error(e, "OpenAI client close")
             self.client = None
     
+    async def aclose(self):
+        """동기/비동기 OpenAI 클라이언트의 HTTP 연결 모두 정리"""
+        self.close()
+        if self.async_client is not None:
+            try:
+                await self.async_client.close()
+            except Exception as e:
+                log_error(e, "OpenAI async client close")
+            self.async_client = None
+    
     def analyze_context(self, text: str, pii_summary: Dict) -> Dict[str, any]:
         """
         문맥 기반 심층 분석
@@ -47,26 +169,223 @@ class AIAnalyzer:
             AI 분석 결과
         """
         if self.use_mock:
+            _record("mock")
             return self._mock_analysis(text, pii_summary)
         
+        _record("calls")
         return self._openai_analysis(text, pii_summary)
     
-    def _openai_analysis(self, text: str, pii_summary: Dict) -> Dict[str, any]:
-        """OpenAI API를 사용한 실제 분석"""
-        try:
-            # 텍스트가 너무 길면 앞부분만 사용 (토큰 제한 고려)
-            max_chars = 8000  # 안전한 토큰 수를 위한 문자 제한
-            text_to_analyze = text[:max_chars] if len(text) > max_chars else text
-            
-            # 전세계약 문서인지 확인 (키워드 기반)
-            is_lease_contract = any(keyword in text_to_analyze.lower() for keyword in [
-                '전세', '임대차', '임차인', '임대인', '보증금', '계약서', 
-                '전세계약', '주택임대차', '전세보증금', '확정일자', '전입신고'
-            ])
+    async def analyze_context_async(self, text: str, pii_summary: Dict) -> Dict[str, any]:
+        """
+        문맥 기반 심층 분석 (비동기)
+        
+        AsyncOpenAI를 사용하므로 응답을 기다리는 동안 다른 요청을 처리할 수 있음
+        - 전역 세마포어로 동시 호출 수 제한 (OPENAI_MAX_CONCURRENCY)
+        - 재시도를 포함한 전체 마감 시간 (OPENAI_DEADLINE)
+        - 429/5xx/연결 오류 시 지터가 포함된 지수 백오프로 재시도 (OPENAI_MAX_RETRIES)
+        - 최종 실패 시 Mock 분석으로 폴백하고 통계에 기록
+        
+        Args:
+            text: 분석할 텍스트
+            pii_summary: 1차 PII 분석 결과 요약
             
-            if is_lease_contract:
-                # 전세계약 특화 분석 프롬프트
-                prompt = f"""다음은 전세계약서 문서입니다. 국토교통부 '전세사기피해 예방을 위한 전세계약 제대로 알고 하기' 안내서를 참조하여 분석해주세요.
+        Returns:
+            AI 분석 결과 (analyze_context와 같은 형식)
+        """
+        if self.use_mock:
+            _record("mock")
+            return self._mock_analysis(text, pii_summary)
+        
+        _record("calls")
+        chunks, total, is_lease_contract = self._plan_chunks(text)
+        
+        async def _analyze_chunk(chunk: TextChunk) -> Tuple[TextChunk, Dict]:
+            messages = self._build_messages(chunk.text, pii_summary, is_lease_contract, (chunk.index + 1, total))
+            return chunk, self._parse_response(await self._request_with_retries(messages))
+        
+        # 청크를 동시에 분석 (전역 세마포어가 실제 동시 호출 수를 제한)
+        tasks = [asyncio.create_task(_analyze_chunk(chunk)) for chunk in chunks]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=OPENAI_DEADLINE)
+        finally:
+            # 마감 시간 초과 또는 호출한 쪽이 취소된 경우(클라이언트 연결 끊김 등) 남은 호출 취소
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        if pending:
+            _record("timeouts")
+            safe_log(logging.WARNING, "OpenAI analysis exceeded deadline of %ss (%d chunk(s) unfinished)", OPENAI_DEADLINE, len(pending))
+        
+        analyzed = []
+        for task in done:
+            if task.exception() is not None:
+                _record_error(task.exception())
+                log_error(task.exception(), "OpenAI async analysis")
+            else:
+                analyzed.append(task.result())
+        
+        if not analyzed:
+            _record("fallbacks")
+            return self._mock_analysis(text, pii_summary)
+        
+        _record("success")
+        failed = len(chunks) - len(analyzed)  # 오류/마감 시간 초과로 분석하지 못한 청크
+        return self._merge_results(sorted(analyzed, key=lambda item: item[0].index), total, len(chunks), failed)
+    
+    def _plan_chunks(self, text: str) -> Tuple[List[TextChunk], int, bool]:
+        """
+        문서를 청크로 나누고 토큰 예산 안에서 분석할 청크 선택
+        
+        Returns:
+            (분석할 청크, 전체 청크 수, 전세계약서 여부)
+        """
+        chunks = split_into_chunks(text, OPENAI_CHUNK_CHARS)
+        selected = []
+        used_tokens = 0
+        for chunk in chunks:
+            cost = estimate_tokens(chunk.text)
+            if selected and used_tokens + cost > OPENAI_TOKEN_BUDGET:
+                safe_log(logging.WARNING, "Token budget reached: analyzing %d of %d chunks", len(selected), len(chunks))
+                break
+            selected.append(chunk)
+            used_tokens += cost
+        # 전세계약서 여부는 문서 전체 기준으로 판단 (청크마다 다른 프롬프트가 쓰이지 않도록)
+        text_lower = text.lower()
+        is_lease_contract = any(keyword in text_lower for keyword in LEASE_KEYWORDS)
+        return selected, max(1, len(chunks)), is_lease_contract
+    
+    def _merge_results(
+        self,
+        analyzed: List[Tuple[TextChunk, Dict]],
+        total_chunks: int,
+        selected_chunks: Optional[int] = None,
+        failed_chunks: int = 0,
+    ) -> Dict[str, any]:
+        """
+        청크별 분석 결과 병합
+        - risk_level: 가장 높은 위험도
+        - issues: 청크 순서대로 연결 (같은 유형/문구 중복 제거), problematic_text의 원문 위치(position) 추가
+        - summary: 청크별 요약 연결
+        - partial: 오류/마감 시간 초과로 분석하지 못한 청크가 있으면 True (토큰 예산으로 제외한 청크와 구분)
+        
+        Args:
+            total_chunks: 문서 전체 청크 수
+            selected_chunks: 토큰 예산 안에서 분석하기로 한 청크 수 (기본값: analyzed 수)
+            failed_chunks: 분석하기로 했지만 실패한 청크 수
+        """
+        if selected_chunks is None:
+            selected_chunks = len(analyzed) + failed_chunks
+        risk_level = "low"
+        issues = []
+        summaries = []
+        seen = set()
+        for chunk, result in analyzed:
+            result = result or {}
+            if RISK_ORDER.get(result.get("risk_level"), 0) > RISK_ORDER[risk_level]:
+                risk_level = result["risk_level"]
+            for issue in result.get("issues", []):
+                key = (issue.get("type"), issue.get("problematic_text") or issue.get("description"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                issue["position"] = self._locate(chunk, issue.get("problematic_text"))
+                issues.append(issue)
+            if result.get("summary") and result["summary"] not in summaries:
+                summaries.append(result["summary"])
+        
+        summary = " ".join(summaries)
+        if selected_chunks < total_chunks:
+            summary += f" (문서가 길어 전체 {total_chunks}개 구간 중 앞의 {selected_chunks}개 구간만 분석 대상으로 선택되었습니다.)"
+        if failed_chunks:
+            _record("partial")
+            summary += f" (일시적인 AI 분석 오류로 {selected_chunks}개 구간 중 {failed_chunks}개 구간을 분석하지 못했습니다. 잠시 후 다시 시도해 주세요.)"
+        
+        return {
+            "method": "openai",
+            "model": OPENAI_MODEL,
+            "partial": failed_chunks > 0,
+            "chunks": {
+                "total": total_chunks,
+                "selected": selected_chunks,
+                "analyzed": len(analyzed),
+                "failed": failed_chunks,
+            },
+            "result": {
+                "risk_level": risk_level,
+                "issues": issues,
+                "summary": summary.strip()
+            }
+        }
+    
+    @staticmethod
+    def _locate(chunk: TextChunk, problematic_text: Optional[str]) -> Optional[List[int]]:
+        """청크 안에서 찾은 problematic_text를 원문 기준 [시작, 끝] 위치로 변환"""
+        if not problematic_text:
+            return None
+        needle = problematic_text.strip()
+        index = chunk.text.find(needle)
+        if index == -1 or not needle:
+            return None
+        return [chunk.start + index, chunk.start + index + len(needle)]
+    
+    async def _request_with_retries(self, messages: List[Dict[str, str]]) -> str:
+        """세마포어 안에서 Chat Completions 호출 (재시도 가능한 오류는 백오프 후 재시도)"""
+        attempt = 0
+        while True:
+            try:
+                async with _openai_semaphore:
+                    # 세마포어 대기 시간은 제외하고 API 호출 시간만 측정 (청크가 여러 개면 합산)
+                    with span("openai"):
+                        response = await self.async_client.chat.completions.create(
+                            model=OPENAI_MODEL,
+                            messages=messages,
+                            temperature=0.3,
+                            max_tokens=2000
+                        )
+                return response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if attempt >= OPENAI_MAX_RETRIES:
+                    raise
+                # 지수 백오프 + 전체 지터 (동시에 실패한 요청들이 한꺼번에 재시도하지 않도록)
+                delay = random.uniform(0, OPENAI_BACKOFF_BASE * (2 ** attempt))
+                attempt += 1
+                _record("retries")
+                safe_log(logging.WARNING, "OpenAI call failed (%s), retry %d in %.2fs", type(e).__name__, attempt, delay)
+                await asyncio.sleep(delay)
+    
+    def _build_messages(
+        self,
+        text: str,
+        pii_summary: Dict,
+        is_lease_contract: Optional[bool] = None,
+        part: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        분석 요청 메시지(system + user 프롬프트) 생성
+        
+        Args:
+            text: 분석할 텍스트 (청크)
+            pii_summary: 1차 PII 분석 결과 요약
+            is_lease_contract: 전세계약서 여부 (None이면 text로 판단)
+            part: (청크 번호, 전체 청크 수) - 분할 분석 시 프롬프트에 표시
+        """
+        # 청크는 이미 OPENAI_CHUNK_CHARS 이하이지만 직접 호출되는 경우를 위해 길이 제한 유지
+        max_chars = OPENAI_CHUNK_CHARS  # 안전한 토큰 수를 위한 문자 제한
+        text_to_analyze = text[:max_chars] if len(text) > max_chars else text
+        
+        if part is not None and part[1] > 1:
+            content_label = f"문서 내용 (전체 {part[1]}개 구간 중 {part[0]}번째 구간):"
+        else:
+            content_label = "문서 내용:"
+        
+        # 전세계약 문서인지 확인 (키워드 기반)
+        if is_lease_contract is None:
+            is_lease_contract = any(keyword in text_to_analyze.lower() for keyword in LEASE_KEYWORDS)
+        
+        if is_lease_contract:
+            # 전세계약 특화 분석 프롬프트
+            prompt = f"""다음은 전세계약서 문서입니다. 국토교통부 '전세사기피해 예방을 위한 전세계약 제대로 알고 하기' 안내서를 참조하여 분석해주세요.
 
 【전세계약 필수 점검사항】
 
@@ -115,7 +434,7 @@ class AIAnalyzer:
 
 이미 감지된 개인정보: {pii_summary.get('total_count', 0)}건
 
-문서 내용:
+{content_label}
 {text_to_analyze}
 
 중요: 반드시 순수 JSON 형식으로만 응답하세요. 마크다운 코드 블록이나 추가 설명 없이 JSON만 반환하세요.
@@ -135,9 +454,9 @@ class AIAnalyzer:
     ],
     "summary": "전체 요약 (전세사기 피해예방 관점에서의 종합 평가)"
 }}"""
-            else:
-                # 일반 문서 분석 프롬프트
-                prompt = f"""다음 문서를 매우 예민하게 분석하여 문제가 될 수 있는 모든 요소를 찾아주세요.
+        else:
+            # 일반 문서 분석 프롬프트
+            prompt = f"""다음 문서를 매우 예민하게 분석하여 문제가 될 수 있는 모든 요소를 찾아주세요.
 
 분석해야 할 항목:
 1. 공격적이거나 비방하는 표현
@@ -148,7 +467,7 @@ class AIAnalyzer:
 
 이미 감지된 개인정보: {pii_summary.get('total_count', 0)}건
 
-문서 내용:
+{content_label}
 {text_to_analyze}
 
 중요: 반드시 순수 JSON 형식으로만 응답하세요. 마크다운 코드 블록이나 추가 설명 없이 JSON만 반환하세요.
@@ -168,100 +487,111 @@ class AIAnalyzer:
     ],
     "summary": "전체 요약"
 }}"""
-
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",  # 비용 효율적인 모델 사용
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 문서의 법적, 윤리적 위험 요소를 분석하는 전문가입니다. 전세계약서의 경우 국토교통부 '전세사기피해 예방을 위한 전세계약 제대로 알고 하기' 안내서의 체크리스트를 참조하여 분석하세요. 매우 예민하게 모든 문제를 찾아내세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # 일관된 분석을 위해 낮은 temperature
-                max_tokens=2000  # 더 상세한 응답을 위해 토큰 수 증가
-            )
-            
-            # 응답 파싱 (마크다운 코드 블록 제거 및 JSON 추출)
-            content = response.choices[0].message.content
-            
-            # JSON 파싱 시도
-            result = None
-            json_content = content
-            
-            # 마크다운 코드 블록 제거 (```json ... ``` 또는 ``` ... ```)
-            # 여러 패턴 시도
-            json_content = content.strip()
-            
-            # 패턴 1: ```json ... ``` 형식
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        
+        return [
+            {
+                "role": "system",
+                "content": "당신은 문서의 법적, 윤리적 위험 요소를 분석하는 전문가입니다. 전세계약서의 경우 국토교통부 '전세사기피해 예방을 위한 전세계약 제대로 알고 하기' 안내서의 체크리스트를 참조하여 분석하세요. 매우 예민하게 모든 문제를 찾아내세요."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _parse_response(self, content: str) -> Dict[str, any]:
+        """모델 응답 파싱 (마크다운 코드 블록 제거 및 JSON 추출)"""
+        # JSON 파싱 시도
+        result = None
+        json_content = content
+        
+        # 마크다운 코드 블록 제거 (```json ... ``` 또는 ``` ... ```)
+        # 여러 패턴 시도
+        json_content = content.strip()
+        
+        # 패턴 1: ```json ... ``` 형식
+        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        if json_match:
+            json_content = json_match.group(1)
+        else:
+            # 패턴 2: ``` ... ``` 형식 (json 태그 없음)
+            json_match = re.search(r'```\s*(\{.*?\})\s*```', content, re.DOTALL)
             if json_match:
                 json_content = json_match.group(1)
             else:
-                # 패턴 2: ``` ... ``` 형식 (json 태그 없음)
-                json_match = re.search(r'```\s*(\{.*?\})\s*```', content, re.DOTALL)
+                # 패턴 3: 중괄호로 시작하고 끝나는 JSON 부분만 추출
+                json_match = re.search(r'\{.*\}', content, re.DOTALL)
                 if json_match:
-                    json_content = json_match.group(1)
-                else:
-                    # 패턴 3: 중괄호로 시작하고 끝나는 JSON 부분만 추출
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                    if json_match:
-                        json_content = json_match.group(0)
-            
+                    json_content = json_match.group(0)
+        
+        try:
+            result = json.loads(json_content)
+            # 필수 필드가 없는 경우 기본값 추가
+            for issue in result.get("issues", []):
+                if "problematic_text" not in issue:
+                    issue["problematic_text"] = None
+                if "corrected_text" not in issue:
+                    issue["corrected_text"] = None
+        except json.JSONDecodeError as e:
+            # JSON 파싱 실패 시 재시도 (더 공격적인 추출)
             try:
-                result = json.loads(json_content)
-                # 필수 필드가 없는 경우 기본값 추가
-                for issue in result.get("issues", []):
-                    if "problematic_text" not in issue:
-                        issue["problematic_text"] = None
-                    if "corrected_text" not in issue:
-                        issue["corrected_text"] = None
-            except json.JSONDecodeError as e:
-                # JSON 파싱 실패 시 재시도 (더 공격적인 추출)
-                try:
-                    # 중괄호로 시작하고 끝나는 부분만 추출
-                    start_idx = json_content.find('{')
-                    end_idx = json_content.rfind('}')
-                    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                        json_content_clean = json_content[start_idx:end_idx+1]
-                        result = json.loads(json_content_clean)
-                        # 필수 필드 추가
-                        for issue in result.get("issues", []):
-                            if "problematic_text" not in issue:
-                                issue["problematic_text"] = None
-                            if "corrected_text" not in issue:
-                                issue["corrected_text"] = None
-                except Exception as parse_error:
-                    # 최종 실패 시 텍스트 기반 응답
-                    log_error(parse_error, "JSON parsing (final attempt)")
-                    safe_log(logging.WARNING, f"Failed to parse AI response. Content length: {len(content)}")
-                    result = {
-                        "risk_level": "medium",
-                        "issues": [
-                            {
-                                "type": "ai_analysis",
-                                "severity": "medium",
-                                "description": "AI 분석 결과를 파싱하는 중 오류가 발생했습니다.",
-                                "problematic_text": None,
-                                "corrected_text": None,
-                                "suggestion": "문서를 다시 분석하거나 관리자에게 문의하세요."
-                            }
-                        ],
-                        "summary": "JSON 파싱 오류로 인해 상세 분석 결과를 표시할 수 없습니다."
-                    }
-            
-            return {
-                "method": "openai",
-                "model": "gpt-4o-mini",
-                "result": result
-            }
-            
-        except Exception as e:
+                # 중괄호로 시작하고 끝나는 부분만 추출
+                start_idx = json_content.find('{')
+                end_idx = json_content.rfind('}')
+                if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
+                    json_content_clean = json_content[start_idx:end_idx+1]
+                    result = json.loads(json_content_clean)
+                    # 필수 필드 추가
+                    for issue in result.get("issues", []):
+                        if "problematic_text" not in issue:
+                            issue["problematic_text"] = None
+                        if "corrected_text" not in issue:
+                            issue["corrected_text"] = None
+            except Exception as parse_error:
+                # 최종 실패 시 텍스트 기반 응답
+                log_error(parse_error, "JSON parsing (final attempt)")
+                safe_log(logging.WARNING, "Failed to parse AI response. Content length: %s", len(content))
+                result = {
+                    "risk_level": "medium",
+                    "issues": [
+                        {
+                            "type": "ai_analysis",
+                            "severity": "medium",
+                            "description": "AI 분석 결과를 파싱하는 중 오류가 발생했습니다.",
+                            "problematic_text": None,
+                            "corrected_text": None,
+                            "suggestion": "문서를 다시 분석하거나 관리자에게 문의하세요."
+                        }
+                    ],
+                    "summary": "JSON 파싱 오류로 인해 상세 분석 결과를 표시할 수 없습니다."
+                }
+        
+        return result
+    
+    def _openai_analysis(self, text: str, pii_summary: Dict) -> Dict[str, any]:
+        """OpenAI API를 사용한 실제 분석 (청크를 순서대로 분석)"""
+        chunks, total, is_lease_contract = self._plan_chunks(text)
+        analyzed = []
+        for chunk in chunks:
+            try:
+                response = self.client.chat.completions.create(
+                    model=OPENAI_MODEL,  # 비용 효율적인 모델 사용
+                    messages=self._build_messages(chunk.text, pii_summary, is_lease_contract, (chunk.index + 1, total)),
+                    temperature=0.3,  # 일관된 분석을 위해 낮은 temperature
+                    max_tokens=2000  # 더 상세한 응답을 위해 토큰 수 증가
+                )
+                analyzed.append((chunk, self._parse_response(response.choices[0].message.content)))
+            except Exception as e:
+                _record_error(e)
+                log_error(e, "OpenAI analysis")
+        
+        if not analyzed:
             # API 호출 실패 시 Mock으로 폴백
+            _record("fallbacks")
             return self._mock_analysis(text, pii_summary)
+        
+        _record("success")
+        return self._merge_results(analyzed, total, len(chunks), len(chunks) - len(analyzed))
     
     def _mock_analysis(self, text: str, pii_summary: Dict) -> Dict[str, any]:
         """Mock 분석 (API Key가 없을 때)"""
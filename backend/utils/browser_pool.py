@@ -0,0 +1,279 @@
+"""
+헤드리스 브라우저 풀 모듈
+프로세스 전역에서 재사용하는 WebDriver 세션 풀 (Warm Pool)
+매 요청마다 Chrome을 새로 띄우는 비용을 없애고, 동시 실행 브라우저 수를 제한
+"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+from utils.logger import safe_log, log_error
+from utils.timing import span
+import logging
+
+
+class BrowserPoolTimeout(Exception):
+    """풀에서 브라우저를 임대하지 못한 경우 (대기 시간 초과)"""
+
+
+class BrowserPool:
+    """WebDriver 세션 풀 클래스"""
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        size: int = 2,
+        max_uses: int = 50,
+        lease_timeout: float = 30.0,
+        clear_origins: Sequence[str] = (),
+    ):
+        """
+        Args:
+            driver_factory: 새 WebDriver를 생성하는 함수
+            size: 동시에 유지할 최대 브라우저 수
+            max_uses: 브라우저 하나가 재활용(종료 후 재생성)되기 전까지 처리할 최대 페이지 수
+            lease_timeout: 임대 대기 최대 시간 (초)
+            clear_origins: 반납 시 저장소(localStorage, IndexedDB 등)를 비울 origin 목록
+        """
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.lease_timeout = lease_timeout
+        self.clear_origins = tuple(clear_origins)
+
+        # 유휴 브라우저 (가장 최근에 반납된 것을 먼저 사용)
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        # 동시에 임대 가능한 브라우저 수 제한
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._uses: Dict[int, int] = {}
+        # 살아 있는 브라우저 수 (유휴 + 임대 중 + 실행 중, size를 넘지 않도록 생성 전에 예약)
+        self._live = 0
+        self._closed = False
+
+        # 통계
+        self._stats = {
+            "created": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "leases": 0,
+            "warm_leases": 0,
+            "cold_leases": 0,
+            "lease_timeouts": 0,
+            "in_use": 0,
+        }
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        브라우저를 미리 실행해 유휴 풀에 채워 넣음 (앱 시작 시 호출)
+
+        Returns:
+            실제로 실행된 브라우저 수
+        """
+        target = self.size if count is None else min(count, self.size)
+        started = 0
+        # 동시에 들어온 임대가 브라우저를 실행 중일 수 있으므로 매번 잠금 안에서 예약 후 실행
+        while self._reserve(target):
+            try:
+                driver = self._create()
+            except Exception as e:
+                self._release_reservation()
+                log_error(e, "Browser pool warm-up")
+                break
+            self._idle.put(driver)
+            started += 1
+        safe_log(logging.INFO, "Browser pool warmed up: %d browser(s) ready", self._idle.qsize())
+        return started
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        브라우저 임대 (with 문으로 사용)
+
+        반납 시 쿠키/탭 상태를 초기화하며, 사용 횟수를 넘었거나 응답하지 않는
+        브라우저는 종료하고 다음 임대 때 새로 생성함
+
+        Raises:
+            BrowserPoolTimeout: 대기 시간 내에 브라우저를 얻지 못한 경우
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        wait = self.lease_timeout if timeout is None else timeout
+        with span("browser_wait"):
+            acquired = self._slots.acquire(timeout=wait)
+        if not acquired:
+            with self._lock:
+                self._stats["lease_timeouts"] += 1
+            raise BrowserPoolTimeout(f"No browser available within {wait}s")
+
+        driver = None
+        try:
+            driver = self._take()
+            yield driver
+        finally:
+            if driver is not None:
+                self._give_back(driver)
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["live"] = self._live
+        stats.update({
+            "size": self.size,
+            "max_uses": self.max_uses,
+            "idle": self._idle.qsize(),
+        })
+        return stats
+
+    def shutdown(self):
+        """유휴 브라우저 모두 종료 (앱 종료 시 호출)"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+    def _reserve(self, limit: Optional[int] = None) -> bool:
+        """브라우저 1개를 실행할 자리 예약 (살아 있는 브라우저가 limit(기본 size) 이상이면 False)"""
+        with self._lock:
+            if self._closed or self._live >= (self.size if limit is None else limit):
+                return False
+            self._live += 1
+            return True
+
+    def _release_reservation(self):
+        with self._lock:
+            self._live -= 1
+
+    def _create(self) -> Any:
+        """브라우저 실행 (호출 전에 _reserve로 자리를 예약해야 함)"""
+        started = time.perf_counter()
+        with span("browser_start"):
+            driver = self.driver_factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._stats["created"] += 1
+        safe_log(logging.INFO, "Browser launched in %.2fs", time.perf_counter() - started)
+        return driver
+
+    def _take(self) -> Any:
+        deadline = time.monotonic() + self.lease_timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+                warm = True
+                break
+            except queue.Empty:
+                pass
+            if self._reserve():
+                try:
+                    driver = self._create()
+                except Exception:
+                    self._release_reservation()
+                    raise
+                warm = False
+                break
+            # 최대 수만큼 살아 있으면 실행 중(워밍업)이거나 반납 중인 브라우저를 기다림
+            # (반납 중 종료되어 자리가 생길 수도 있으므로 짧게 기다린 뒤 다시 확인)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                with self._lock:
+                    self._stats["lease_timeouts"] += 1
+                raise BrowserPoolTimeout(f"No browser available within {self.lease_timeout}s")
+            try:
+                driver = self._idle.get(timeout=min(0.5, remaining))
+                warm = True
+                break
+            except queue.Empty:
+                continue
+        with self._lock:
+            self._stats["leases"] += 1
+            self._stats["warm_leases" if warm else "cold_leases"] += 1
+            self._stats["in_use"] += 1
+        return driver
+
+    def _give_back(self, driver: Any):
+        with self._lock:
+            self._stats["in_use"] -= 1
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if not self._is_alive(driver):
+            with self._lock:
+                self._stats["crashed"] += 1
+            safe_log(logging.WARNING, "Browser became unresponsive, discarding it")
+            self._quit(driver)
+            return
+
+        if self._closed or uses >= self.max_uses:
+            with self._lock:
+                self._stats["recycled"] += 1
+            self._quit(driver)
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as e:
+            log_error(e, "Browser reset")
+            with self._lock:
+                self._stats["crashed"] += 1
+            self._quit(driver)
+            return
+
+        self._idle.put(driver)
+
+    @staticmethod
+    def _is_alive(driver: Any) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver: Any):
+        """
+        다음 임대를 위해 브라우저 상태 초기화
+
+        - 첫 번째 탭만 남기고 about:blank로 이동
+        - 모든 도메인의 쿠키 삭제 (CDP Network.clearBrowserCookies)
+        - clear_origins의 localStorage, IndexedDB, Cache Storage, 서비스 워커 등 삭제 (CDP Storage.clearDataForOrigin)
+          및 남은 탭의 sessionStorage 삭제 (CDP DOMStorage.clear)
+        CDP를 지원하지 않는 드라이버는 현재 도메인 쿠키만 삭제됨 (delete_all_cookies)
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if execute_cdp_cmd is None:
+            # 현재 페이지 도메인 기준이므로 about:blank로 이동하기 전에 삭제
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return
+        driver.get("about:blank")
+        execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in self.clear_origins:
+            execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            # sessionStorage는 탭 단위로 유지되므로 재사용하는 탭에서 따로 삭제
+            try:
+                execute_cdp_cmd("DOMStorage.enable", {})
+                execute_cdp_cmd("DOMStorage.clear", {"storageId": {"securityOrigin": origin, "isLocalStorage": False}})
+            except Exception as e:
+                safe_log(logging.DEBUG, "sessionStorage clear failed: %s", type(e).__name__)
+
+    def _quit(self, driver: Any):
+        with self._lock:
+            if self._uses.pop(id(driver), None) is not None:
+                self._live -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            safe_log(logging.DEBUG, "Browser quit failed: %s", type(e).__name__)
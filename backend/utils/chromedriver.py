@@ -0,0 +1,201 @@
+"""
+ChromeDriver 경로 확인 모듈
+프로세스 시작 시 한 번만 드라이버 경로를 결정하고 결과를 캐시 (크롤링마다 버전 조회/다운로드 없음)
+실패 결과는 CHROMEDRIVER_RETRY_INTERVAL초 후 또는 reset_chromedriver() 호출 시 다시 확인
+확인 순서: CHROMEDRIVER_PATH(고정 경로) → 이전 확인 결과 파일 → PATH의 chromedriver → webdriver-manager(네트워크)
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from utils.logger import safe_log, log_error
+import logging
+
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+CHROMEDRIVER_CACHE_FILE = os.getenv(
+    "CHROMEDRIVER_CACHE_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "checking-ai", "chromedriver.json"),
+)
+CHROMEDRIVER_HEALTH_TIMEOUT = float(os.getenv("CHROMEDRIVER_HEALTH_TIMEOUT", "5"))
+# false면 네트워크로 드라이버를 내려받지 않음 (오프라인 환경)
+CHROMEDRIVER_AUTO_DOWNLOAD = os.getenv("CHROMEDRIVER_AUTO_DOWNLOAD", "true").lower() in ("1", "true", "yes")
+# 확인 실패 후 다시 확인하기까지 대기 시간 (초, 0이면 재시작/초기화 전까지 재확인하지 않음)
+CHROMEDRIVER_RETRY_INTERVAL = float(os.getenv("CHROMEDRIVER_RETRY_INTERVAL", "300"))
+
+
+class ChromeDriverUnavailable(RuntimeError):
+    """사용 가능한 ChromeDriver를 찾지 못한 경우"""
+
+
+class ChromeDriverInfo(NamedTuple):
+    """확인된 ChromeDriver 정보"""
+    path: str
+    version: str
+    source: str  # env / cache / path / webdriver_manager
+
+
+_info: Optional[ChromeDriverInfo] = None
+# 실패 메시지만 보관 (예외 객체를 다시 raise하면 호출마다 traceback이 누적되어 이전 호출의 프레임이 해제되지 않음)
+_error: Optional[str] = None
+_resolved_at: Optional[float] = None
+_lock = threading.Lock()
+
+
+def check_chromedriver(path: str, timeout: float = CHROMEDRIVER_HEALTH_TIMEOUT) -> str:
+    """
+    드라이버 실행 파일 상태 확인 (chromedriver --version)
+
+    Returns:
+        드라이버 버전 문자열
+
+    Raises:
+        ChromeDriverUnavailable: 파일이 없거나 실행할 수 없는 경우
+    """
+    if not path or not os.path.isfile(path):
+        raise ChromeDriverUnavailable(f"ChromeDriver not found: {path}")
+    if not os.access(path, os.X_OK):
+        raise ChromeDriverUnavailable(f"ChromeDriver is not executable: {path}")
+    try:
+        completed = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=timeout, check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        raise ChromeDriverUnavailable(f"ChromeDriver health check failed: {path}: {e}")
+    match = re.search(r'\d+(?:\.\d+)+', completed.stdout)
+    return match.group(0) if match else completed.stdout.strip()
+
+
+def _load_cached_path() -> Optional[str]:
+    """이전에 확인한 드라이버 경로 읽기"""
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("path")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _save_cached(info: ChromeDriverInfo):
+    """확인한 드라이버 정보를 저장해 다음 실행 시 네트워크 없이 재사용"""
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_FILE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"path": info.path, "version": info.version, "source": info.source}, f)
+    except OSError as e:
+        safe_log(logging.DEBUG, "Could not write ChromeDriver cache file: %s", e)
+
+
+def _download_with_webdriver_manager() -> Optional[str]:
+    """webdriver-manager로 드라이버 다운로드/조회 (네트워크 필요)"""
+    if not CHROMEDRIVER_AUTO_DOWNLOAD:
+        return None
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver() -> ChromeDriverInfo:
+    """
+    ChromeDriver 경로 결정 (후보마다 상태 확인 후 첫 번째로 통과한 경로 사용)
+
+    Raises:
+        ChromeDriverUnavailable: 모든 후보가 실패한 경우
+    """
+    candidates: List[Tuple[str, Optional[str]]] = [
+        ("env", CHROMEDRIVER_PATH),
+        ("cache", _load_cached_path()),
+        ("path", shutil.which("chromedriver")),
+    ]
+    failures = []
+    for source, path in candidates:
+        if not path:
+            continue
+        try:
+            return ChromeDriverInfo(path, check_chromedriver(path), source)
+        except ChromeDriverUnavailable as e:
+            failures.append(str(e))
+            if source == "env":
+                # 고정 경로가 잘못된 경우 다른 드라이버로 조용히 대체하지 않음
+                raise
+
+    try:
+        path = _download_with_webdriver_manager()
+    except Exception as e:
+        failures.append(f"webdriver-manager failed: {e}")
+        path = None
+    if path:
+        info = ChromeDriverInfo(path, check_chromedriver(path), "webdriver_manager")
+        _save_cached(info)
+        return info
+
+    raise ChromeDriverUnavailable("No usable ChromeDriver found" + (f" ({'; '.join(failures)})" if failures else ""))
+
+
+def _retry_at() -> Optional[float]:
+    """실패 결과를 다시 확인할 시각 (재확인하지 않으면 None)"""
+    if _error is None or _resolved_at is None or CHROMEDRIVER_RETRY_INTERVAL <= 0:
+        return None
+    return _resolved_at + CHROMEDRIVER_RETRY_INTERVAL
+
+
+def _needs_resolve() -> bool:
+    if _info is not None:
+        return False
+    if _error is None:
+        return True
+    retry_at = _retry_at()
+    return retry_at is not None and time.time() >= retry_at
+
+
+def get_chromedriver() -> ChromeDriverInfo:
+    """
+    프로세스 전역 ChromeDriver 정보 반환 (최초 호출 시 1회 확인)
+
+    실패도 캐시하므로 드라이버가 없는 환경에서 크롤링마다 재조회하지 않고 즉시 실패
+    (CHROMEDRIVER_RETRY_INTERVAL초가 지나면 다음 호출에서 다시 확인)
+
+    Raises:
+        ChromeDriverUnavailable
+    """
+    global _info, _error, _resolved_at
+    if _needs_resolve():
+        with _lock:
+            if _needs_resolve():
+                try:
+                    _info = resolve_chromedriver()
+                    _error = None
+                    safe_log(logging.INFO, "ChromeDriver %s resolved from %s: %s", _info.version, _info.source, _info.path)
+                except ChromeDriverUnavailable as e:
+                    _error = str(e)
+                    log_error(e, "ChromeDriver resolution")
+                _resolved_at = time.time()
+    if _error is not None:
+        raise ChromeDriverUnavailable(_error) from None
+    return _info
+
+
+def reset_chromedriver():
+    """캐시된 확인 결과 초기화 (드라이버 설치 후 재시작 없이 다시 확인할 때 사용)"""
+    global _info, _error, _resolved_at
+    with _lock:
+        _info = None
+        _error = None
+        _resolved_at = None
+
+
+def chromedriver_status() -> Dict:
+    """드라이버 확인 결과 (상태 조회용)"""
+    return {
+        "available": _info is not None,
+        "path": _info.path if _info else None,
+        "version": _info.version if _info else None,
+        "source": _info.source if _info else None,
+        "error": _error,
+        "resolved_at": _resolved_at,
+        "retry_at": _retry_at(),
+    }
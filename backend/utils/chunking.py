@@ -0,0 +1,68 @@
+"""
+문서 분할 모듈
+긴 문서를 조항/문단 경계에서 나누어 AI 분석 단위(청크)로 만듦
+각 청크는 원문에서의 시작/끝 위치를 가지므로 결과를 원문 위치로 되돌릴 수 있음
+"""
+import math
+import re
+from typing import List, NamedTuple
+
+
+class TextChunk(NamedTuple):
+    """원문 text[start:end] 구간"""
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+# 분할 경계 (우선순위 순)
+# 1. 조항 시작 (제1조, 제 2 조 ...)  2. 빈 줄(문단)  3. 줄바꿈  4. 문장 끝
+BOUNDARY_PATTERNS = [
+    re.compile(r'\n(?=[ \t]*제\s*\d+\s*조)'),
+    re.compile(r'\n[ \t]*\n'),
+    re.compile(r'\n'),
+    re.compile(r'(?<=[.!?。])\s+'),
+]
+
+# 한국어 문서 기준 보수적인 문자/토큰 비율
+CHARS_PER_TOKEN = 2
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _best_cut(text: str, start: int, limit: int) -> int:
+    """text[start:limit] 안에서 가장 우선순위가 높은 마지막 경계 위치 (없으면 limit)"""
+    # 너무 작은 청크가 생기지 않도록 구간의 절반 이후에서만 경계를 찾음
+    floor = start + (limit - start) // 2
+    for pattern in BOUNDARY_PATTERNS:
+        cut = None
+        for match in pattern.finditer(text, floor, limit):
+            cut = match.end()
+        if cut is not None and cut > start:
+            return cut
+    return limit
+
+
+def split_into_chunks(text: str, max_chars: int = 8000) -> List[TextChunk]:
+    """
+    조항/문단 경계에서 max_chars 이하의 청크로 분할
+
+    Args:
+        text: 원문
+        max_chars: 청크 최대 길이
+
+    Returns:
+        순서대로 정렬된 청크 목록 (청크를 이어 붙이면 원문과 같음)
+    """
+    chunks = []
+    start = 0
+    while start < len(text):
+        limit = min(start + max_chars, len(text))
+        end = limit if limit == len(text) else _best_cut(text, start, limit)
+        chunks.append(TextChunk(len(chunks), start, end, text[start:end]))
+        start = end
+    return chunks
@@ -0,0 +1,105 @@
+"""
+애플리케이션 공유 컴포넌트 모듈
+요청마다 새로 만들던 분석기들을 앱 수명 동안 한 번만 생성해 모든 요청이 공유
+(AIAnalyzer: keep-alive 연결 풀을 가진 OpenAI 클라이언트)
+PII 감지는 문서 프로세스 풀/스레드 폴백 모두 document_pipeline의 워커별 PIIDetector를 사용
+"""
+import asyncio
+import os
+import threading
+from typing import Optional, Set
+from dotenv import load_dotenv
+from utils.ai_analyzer import AIAnalyzer, OPENAI_DEADLINE, OPENAI_TIMEOUT
+from utils.result_cache import TTLCache
+from utils.logger import safe_log
+import logging
+
+# 설정 재로드 후 이전 AI 분석기를 닫기까지 기다리는 시간 (초)
+# 진행 중인 비동기 분석(OPENAI_DEADLINE)과 동기 호출 1회(OPENAI_TIMEOUT)가 끝날 수 있도록 여유를 둠
+AI_ANALYZER_CLOSE_DELAY = float(os.getenv("AI_ANALYZER_CLOSE_DELAY", str(OPENAI_DEADLINE + OPENAI_TIMEOUT)))
+
+
+class AppComponents:
+    """앱 수명 동안 공유되는 분석 컴포넌트 컨테이너"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # OpenAI 클라이언트(httpx)는 스레드 안전하며 연결 풀을 재사용
+        self.ai_analyzer = AIAnalyzer()
+        # 같은 문서 재업로드 시 유료 AI 호출을 생략하기 위한 결과 캐시 (키: 텍스트 해시)
+        self.analysis_cache = TTLCache(
+            maxsize=int(os.getenv("ANALYSIS_CACHE_SIZE", "256")),
+            ttl=float(os.getenv("ANALYSIS_CACHE_TTL", "86400")),
+        )
+        # 재로드로 교체되어 닫기를 기다리는 이전 분석기와 지연 종료 작업
+        self._retired: Set[AIAnalyzer] = set()
+        self._close_tasks: Set[asyncio.Task] = set()
+        safe_log(logging.INFO, "Shared components ready (AI mode: %s)", "mock" if self.ai_analyzer.use_mock else "openai")
+
+    def reload_ai_analyzer(self):
+        """
+        .env/환경 변수를 다시 읽어 AI 분석기 교체 (API Key 변경 등)
+
+        진행 중인 요청이 이전 분석기를 계속 사용할 수 있도록 참조만 먼저 교체하고,
+        이전 클라이언트의 연결은 AI_ANALYZER_CLOSE_DELAY초 뒤에 닫음
+        """
+        load_dotenv(override=True)
+        new_analyzer = AIAnalyzer()
+        with self._lock:
+            old_analyzer, self.ai_analyzer = self.ai_analyzer, new_analyzer
+        self._close_later(old_analyzer)
+        safe_log(logging.INFO, "AI analyzer reloaded (AI mode: %s)", "mock" if new_analyzer.use_mock else "openai")
+
+    def _close_later(self, analyzer: AIAnalyzer):
+        """이전 분석기의 연결을 지연 종료 (SIGHUP 핸들러는 이벤트 루프에서 호출됨)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서 호출되면 비동기 클라이언트는 닫을 수 없으므로 동기 클라이언트만 정리
+            timer = threading.Timer(AI_ANALYZER_CLOSE_DELAY, analyzer.close)
+            timer.daemon = True
+            timer.start()
+            return
+
+        async def _close():
+            try:
+                await asyncio.sleep(AI_ANALYZER_CLOSE_DELAY)
+            finally:
+                # 앱 종료로 취소되어도 연결은 닫음
+                self._retired.discard(analyzer)
+                await analyzer.aclose()
+
+        self._retired.add(analyzer)
+        task = loop.create_task(_close())
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    def reload(self):
+        """모든 컴포넌트 설정 다시 로드"""
+        self.reload_ai_analyzer()
+
+    async def aclose(self):
+        """앱 종료 시 연결 정리 (닫기를 기다리던 이전 분석기 포함)"""
+        tasks = list(self._close_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 시작 전에 취소된 작업의 분석기
+        for analyzer in list(self._retired):
+            self._retired.discard(analyzer)
+            await analyzer.aclose()
+        await self.ai_analyzer.aclose()
+
+
+_components: Optional[AppComponents] = None
+_components_lock = threading.Lock()
+
+
+def get_components() -> AppComponents:
+    """프로세스 전역 컴포넌트 컨테이너 반환 (최초 호출 시 생성)"""
+    global _components
+    if _components is None:
+        with _components_lock:
+            if _components is None:
+                _components = AppComponents()
+    return _components
@@ -0,0 +1,60 @@
+"""
+문서 분석 파이프라인 (CPU 작업 단계)
+텍스트 추출 + PII 감지를 하나의 함수로 묶어 프로세스 풀에서 실행할 수 있도록 함
+입력/출력은 모두 메모리 객체로만 전달 (Zero Storage Policy - 디스크 사용 없음)
+"""
+import os
+from typing import Dict, Tuple
+from utils.timing import collect_spans
+from utils.text_extractor import iter_text_pages
+from utils.pii_detector import PIIDetector
+
+# 워커 프로세스마다 하나씩 재사용 (패턴은 클래스 수준에서 미리 컴파일됨)
+_pii_detector = PIIDetector()
+
+
+def extract_and_scan(file_content: bytes, content_type: str) -> Tuple[str, Dict, Dict[str, float]]:
+    """
+    파일 바이트에서 텍스트를 추출하고 PII를 감지
+
+    프로세스 풀 워커에서 호출되므로 모듈 최상위 함수로 유지 (pickle 가능해야 함)
+
+    PII 검사는 페이지 단위로 진행되지만, AI 분석 단계가 전체 텍스트를 청크로 나누므로
+    페이지 텍스트를 모아 전체 텍스트를 만들어 반환함
+    따라서 메모리 사용량은 페이지 1개가 아니라 문서 전체 텍스트 크기에 비례함
+    (추출 라이브러리의 페이지 객체는 페이지마다 해제됨)
+
+    Args:
+        file_content: 파일의 바이트 데이터
+        content_type: 파일의 MIME 타입
+
+    Returns:
+        (추출된 텍스트, PII 감지 결과, 단계별 소요 시간 ms)
+        소요 시간은 워커 프로세스에서 측정되므로 호출한 쪽에서 timing.merge_spans로 합침
+
+    Raises:
+        ValueError: 텍스트 추출 실패
+    """
+    # 페이지를 추출하는 즉시 PII 검사 (감지 결과에 페이지 번호 포함)
+    page_texts = []
+
+    def _pages():
+        for page in iter_text_pages(file_content, content_type):
+            page_texts.append(page.text)
+            yield page
+
+    with collect_spans() as timeline:
+        pii_result = _pii_detector.detect_pages(_pages())
+    # AI 분석 단계를 위한 전체 텍스트 (extract_text_from_memory와 동일한 형식)
+    text = "\n".join(page_texts).strip()
+    return text, pii_result, timeline.durations()
+
+
+def warm_up_worker() -> int:
+    """
+    워커 프로세스 사전 실행용 빈 작업
+
+    spawn 방식은 워커 시작 시 이 모듈(PDF/DOCX 파서 포함)을 새로 import하므로
+    앱 시작 시 미리 호출해 첫 요청이 그 비용을 부담하지 않도록 함
+    """
+    return os.getpid()
@@ -0,0 +1,97 @@
+"""
+DOM 스냅샷 모듈
+필드별 후보 XPath의 텍스트를 브라우저 안에서 한 번에 수집해 JSON으로 반환
+(셀렉터마다 find_elements, 요소마다 element.text를 호출하면 WebDriver 왕복이 수십 번 발생)
+"""
+import json
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from utils.page_readiness import wait_until
+from utils.logger import safe_log
+import logging
+
+
+# arguments[0]: {필드: [[XPath, 방법 이름], ...]}, arguments[1]: body 텍스트 포함 여부
+# arguments[2]: {필드: 정규식} - 지정된 필드는 정규식에 맞는 텍스트를 찾은 셀렉터에서 멈춤 (뒤 셀렉터는 평가하지 않음)
+# 반환: JSON 문자열 {"fields": {필드: [[방법 이름, [텍스트, ...]], ...]},
+#                   "attempts": {필드: [[방법 이름, 평가 시간 ms, 정규식 일치 여부], ...]}, "body": 텍스트 또는 null}
+DOM_SNAPSHOT_SCRIPT = r"""
+var selectors = arguments[0], includeBody = arguments[1], accept = arguments[2] || {};
+var MAX_NODES = 20, MAX_TEXT = 2000;
+var snapshot = {fields: {}, attempts: {}, body: null};
+for (var field in selectors) {
+    var candidates = [], attempts = [];
+    var pattern = accept[field] ? new RegExp(accept[field]) : null;
+    for (var i = 0; i < selectors[field].length; i++) {
+        var xpath = selectors[field][i][0], name = selectors[field][i][1], texts = [], matched = false;
+        var started = performance.now();
+        try {
+            var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var j = 0; j < result.snapshotLength && texts.length < MAX_NODES; j++) {
+                var text = (result.snapshotItem(j).innerText || '').trim();
+                if (text) {
+                    texts.push(text.slice(0, MAX_TEXT));
+                    if (pattern && pattern.test(text)) { matched = true; }
+                }
+            }
+        } catch (e) {}
+        attempts.push([name, performance.now() - started, pattern ? matched : texts.length > 0]);
+        if (texts.length) { candidates.push([name, texts]); }
+        if (matched) { break; }
+    }
+    snapshot.fields[field] = candidates;
+    snapshot.attempts[field] = attempts;
+}
+if (includeBody && document.body) { snapshot.body = document.body.innerText; }
+return JSON.stringify(snapshot);
+"""
+
+# 필드 후보 텍스트 목록: [(방법 이름, [텍스트, ...]), ...]
+Candidates = List[Tuple[str, List[str]]]
+
+
+def take_dom_snapshot(driver, selectors: Dict[str, Sequence[Tuple[str, str]]], include_body: bool = False,
+                      accept: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    execute_script 1회로 필드별 후보 텍스트 수집
+
+    Args:
+        driver: WebDriver
+        selectors: {필드: [(XPath, 방법 이름), ...]} (우선순위 순)
+        include_body: 텍스트 패턴 매칭용 body 텍스트 포함 여부
+        accept: {필드: JavaScript 정규식} - 일치하는 텍스트를 찾으면 해당 필드의 나머지 셀렉터 생략
+
+    Returns:
+        {"fields": {필드: Candidates}, "attempts": {필드: [(방법 이름, ms, 일치 여부), ...]}, "body": 텍스트 또는 None}
+    """
+    payload = {field: [list(selector) for selector in field_selectors] for field, field_selectors in selectors.items()}
+    snapshot = json.loads(driver.execute_script(DOM_SNAPSHOT_SCRIPT, payload, include_body, accept or {}))
+    snapshot['fields'] = {
+        field: [(name, texts) for name, texts in candidates]
+        for field, candidates in snapshot.get('fields', {}).items()
+    }
+    snapshot['attempts'] = {
+        field: [(name, cost_ms, matched) for name, cost_ms, matched in attempts]
+        for field, attempts in snapshot.get('attempts', {}).items()
+    }
+    return snapshot
+
+
+def wait_for_dom_snapshot(driver, selectors: Dict[str, Sequence[Tuple[str, str]]], timeout: float,
+                          include_body: bool = False, accept: Optional[Dict[str, str]] = None) -> Optional[Dict]:
+    """
+    모든 필드에 후보 텍스트가 생길 때까지 스냅샷을 폴링 (폴링 1회 = WebDriver 왕복 1회)
+
+    Returns:
+        마지막 스냅샷 (스크립트 실행 실패 시 None)
+    """
+    started = time.monotonic()
+    latest = {}
+
+    def _complete():
+        latest['snapshot'] = take_dom_snapshot(driver, selectors, include_body, accept)
+        return all(latest['snapshot']['fields'].get(field) for field in selectors)
+
+    complete = wait_until(_complete, timeout, poll_interval=0.2)
+    safe_log(logging.INFO, "DOM snapshot %s in %.2fs", "complete" if complete else "partial", time.monotonic() - started)
+    return latest.get('snapshot')
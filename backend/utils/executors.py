@@ -0,0 +1,104 @@
+"""
+작업 실행기 모듈
+동기(블로킹) 작업을 asyncio 이벤트 루프 밖의 전용 스레드 풀에서 실행
+동시 실행 수/대기열 길이 제한 및 요청별 타임아웃 제공
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from utils.logger import safe_log
+import logging
+
+
+class ExecutorBusyError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없는 경우"""
+
+
+class BoundedExecutor:
+    """동시 실행 수와 대기열 길이가 제한된 스레드 실행기"""
+
+    def __init__(self, name: str, max_workers: int = 2, max_queue: int = 16, timeout: Optional[float] = None):
+        """
+        Args:
+            name: 실행기 이름 (스레드 이름/로그에 사용)
+            max_workers: 동시에 실행할 최대 작업 수
+            max_queue: 실행 대기 중인 최대 작업 수 (초과 시 ExecutorBusyError)
+            timeout: 기본 작업 타임아웃 (초, None이면 무제한)
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._stats = {
+            "in_flight": 0,
+            "running": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+        }
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        작업을 스레드 풀에 제출하고 결과를 비동기로 대기
+
+        Raises:
+            ExecutorBusyError: 대기열이 가득 찬 경우
+            asyncio.TimeoutError: 타임아웃 초과 (작업 스레드는 끝날 때까지 계속 실행됨)
+        """
+        with self._lock:
+            if self._stats["in_flight"] >= self.max_queue + self.max_workers:
+                self._stats["rejected"] += 1
+                raise ExecutorBusyError(f"{self.name} executor queue is full")
+            self._stats["in_flight"] += 1
+
+        # 요청 컨텍스트(타이밍 타임라인 등)를 작업 스레드로 전달
+        future = self._pool.submit(contextvars.copy_context().run, self._invoke, fn, args, kwargs)
+        future.add_done_callback(self._on_done)
+        deadline = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), deadline)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            safe_log(logging.WARNING, "%s task timed out after %ss", self.name, deadline)
+            raise
+
+    def _on_done(self, future):
+        # 실행 전에 취소된 작업(타임아웃)은 _invoke가 호출되지 않으므로 여기서 정리
+        if future.cancelled():
+            with self._lock:
+                self._stats["in_flight"] -= 1
+
+    def _invoke(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self._stats["running"] += 1
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self._stats["running"] -= 1
+                self._stats["in_flight"] -= 1
+                self._stats["completed" if ok else "failed"] += 1
+            safe_log(logging.DEBUG, "%s task finished in %.2fs", self.name, time.perf_counter() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        """실행기 상태 통계 (queue_depth: 실행을 기다리는 작업 수)"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = stats["in_flight"] - stats["running"]
+        stats.update({"max_workers": self.max_workers, "max_queue": self.max_queue})
+        return stats
+
+    def shutdown(self):
+        """실행기 종료 (대기 중인 작업은 취소)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,11 @@
 """
 인스타그램 크롤링 모듈
 Instagram 게시물 정보 추출 (좋아요, 댓글, 날짜 등)
-Selenium을 사용한 동적 웹 페이지 크롤링
+HTTP(oEmbed + HTML) 우선, 부족한 필드만 Selenium으로 동적 웹 페이지 크롤링
 """
 import re
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import time
 from typing import Dict, Optional
 from datetime import datetime
@@ -13,47 +13,372 @@ from utils.logger import safe_log, log_error
 import logging
 from dotenv import load_dotenv
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from utils.browser_pool import BrowserPool
+from utils.chromedriver import get_chromedriver
+from utils.instagram_json import extract_post_fields, extract_response_fields
+from utils.page_readiness import DEFAULT_FIELD_DEADLINES, wait_for_post_ready
+from utils.dom_snapshot import take_dom_snapshot, wait_for_dom_snapshot
+from utils.timing import span
+from utils.metrics import EXTRACTION_METHODS
+from utils.selector_ranking import SelectorRanker
+from utils.network_profile import (
+    DEFAULT_BLOCKED_URL_PATTERNS,
+    NetworkCapture,
+    apply_lean_options,
+    block_requests,
+    drain_performance_log,
+    enable_network,
+    enable_performance_log,
+    summarize_transfer,
+)
 
 # Selenium imports
 try:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
-    from webdriver_manager.chrome import ChromeDriverManager
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
-    safe_log(logging.WARNING, "Selenium not available. Install selenium and webdriver-manager for better Instagram crawling.")
+    safe_log(logging.WARNING, "Selenium not available. Install selenium for better Instagram crawling.")
 
 # 환경 변수 로드
 load_dotenv()
 
+# Instagram 주소 (오프라인 테스트 시 로컬 대체 페이지로 변경 가능)
+INSTAGRAM_BASE_URL = os.getenv("INSTAGRAM_BASE_URL", "https://www.instagram.com").rstrip("/")
+INSTAGRAM_OEMBED_URL = os.getenv("INSTAGRAM_OEMBED_URL", "https://api.instagram.com/oembed")
+
+# 브라우저 풀 설정
+BROWSER_POOL_SIZE = int(os.getenv("INSTAGRAM_BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_PAGES = int(os.getenv("INSTAGRAM_BROWSER_MAX_PAGES", "50"))
+BROWSER_LEASE_TIMEOUT = float(os.getenv("INSTAGRAM_BROWSER_LEASE_TIMEOUT", "30"))
+
+# 페이지 준비 대기 설정 (초)
+PAGE_READY_TIMEOUT = float(os.getenv("INSTAGRAM_PAGE_READY_TIMEOUT", "10"))
+FIELD_DEADLINES = {
+    field: float(os.getenv(f"INSTAGRAM_{field.upper()}_DEADLINE", str(default)))
+    for field, default in DEFAULT_FIELD_DEADLINES.items()
+}
+
+# 경량 크롤링 (이미지/동영상/폰트/추적 스크립트 차단, eager 페이지 로드, 전송량 측정)
+LEAN_CRAWL = os.getenv("INSTAGRAM_LEAN_CRAWL", "true").lower() in ("1", "true", "yes")
+BLOCKED_URL_PATTERNS = DEFAULT_BLOCKED_URL_PATTERNS + [
+    pattern.strip() for pattern in os.getenv("INSTAGRAM_BLOCKED_URLS", "").split(",") if pattern.strip()
+]
+
+# 브라우저가 받은 게시물 JSON 응답(GraphQL/API) 수집 (모든 필드를 얻으면 HTML/DOM 추출 생략)
+NETWORK_CAPTURE = os.getenv("INSTAGRAM_NETWORK_CAPTURE", "true").lower() in ("1", "true", "yes")
+# 본문을 읽을 응답 URL 패턴 (URL에 포함된 문자열)
+NETWORK_JSON_URL_PATTERNS = ['/graphql', '/api/v1/'] + [
+    pattern.strip() for pattern in os.getenv("INSTAGRAM_NETWORK_JSON_URLS", "").split(",") if pattern.strip()
+]
+
+# HTTP 티어(oEmbed + HTML 병렬 요청) 전체 마감 시간 (초)
+HTTP_DEADLINE = float(os.getenv("INSTAGRAM_HTTP_DEADLINE", "15"))
+
+# 공유 HTTP 세션 연결 풀 크기 (동시 크롤링 수 이상 권장)
+HTTP_POOL_SIZE = int(os.getenv("INSTAGRAM_HTTP_POOL_SIZE", "16"))
+
+# DOM/텍스트 패턴 셀렉터 순서 학습 (성공률/비용 기준으로 잘 맞는 셀렉터를 먼저 시도)
+ADAPTIVE_SELECTORS = os.getenv("INSTAGRAM_ADAPTIVE_SELECTORS", "true").lower() in ("1", "true", "yes")
+# 최근 결과 가중치 (클수록 페이지 구조 변화에 빨리 반응)
+SELECTOR_DECAY = float(os.getenv("INSTAGRAM_SELECTOR_DECAY", "0.3"))
+
+# 크롤링 대상 필드 (HTTP 티어에서 모두 채우면 브라우저를 사용하지 않음)
+CRAWL_FIELDS = ('like_count', 'comment_count', 'username', 'caption', 'post_date')
+
+# 티어별 통계 (http: oEmbed + HTML, browser: Selenium)
+CRAWL_TIERS = ('http', 'browser')
+_tier_stats = {
+    'crawls': 0,
+    'browser_bytes': 0,
+    'browser_measured': 0,
+    'tiers': {
+        tier: {'attempts': 0, 'complete': 0, 'failures': 0, 'fields': {field: 0 for field in CRAWL_FIELDS}}
+        for tier in CRAWL_TIERS
+    },
+}
+_tier_stats_lock = threading.Lock()
+
+# 임베디드 JSON에서 찾지 못한 필드의 정규식 보완 패턴
+# (페이지의 다른 사용자 이름이 먼저 잡히는 "username" 단독 패턴은 사용하지 않음)
+HTML_FIELD_PATTERNS = {
+    'like_count': [
+        re.compile(r'"like_count":\s*(\d+)'),
+        re.compile(r'"edge_media_preview_like":\s*\{[^}]*"count":\s*(\d+)'),
+        re.compile(r'"edge_liked_by":\s*\{[^}]*"count":\s*(\d+)'),
+    ],
+    'comment_count': [
+        re.compile(r'"comment_count":\s*(\d+)'),
+        re.compile(r'"edge_media_to_comment":\s*\{[^}]*"count":\s*(\d+)'),
+        re.compile(r'"edge_media_to_parent_comment":\s*\{[^}]*"count":\s*(\d+)'),
+    ],
+    'post_date': [
+        re.compile(r'"taken_at_timestamp":\s*(\d+)'),
+        re.compile(r'"uploadDate":\s*"([^"]+)"'),
+    ],
+    'username': [
+        re.compile(r'"owner":\s*\{[^}]*"username":\s*"([^"]+)"'),
+    ],
+    'caption': [
+        re.compile(r'"edge_media_to_caption":\s*\{[^}]*"text":\s*"([^"]+)"'),
+        re.compile(r'"caption":\s*"([^"]+)"'),
+    ],
+}
+
+# DOM 폴백 후보 셀렉터 (필드별 우선순위 순: XPath, 방법 이름)
+DOM_SELECTORS = {
+    'like_count': [
+        ("//button[contains(@aria-label, '좋아요')]//span", "button_aria_label_korean"),
+        ("//button[contains(@aria-label, 'like')]//span", "button_aria_label_english"),
+        ("//a[contains(@href, '/liked_by/')]//span", "link_href_liked_by"),
+        ("//span[contains(text(), '좋아요')]/ancestor::button//span[contains(@class, 'html-span')]", "span_text_ancestor"),
+        ("//section//span[contains(text(), '좋아요')]/following-sibling::span", "section_span_following"),
+    ],
+    'comment_count': [
+        ("//button[contains(@aria-label, '댓글')]//span", "button_aria_label_korean"),
+        ("//button[contains(@aria-label, 'comment')]//span", "button_aria_label_english"),
+        ("//a[contains(@href, '/comments/')]//span", "link_href_comments"),
+        ("//span[contains(text(), '댓글')]/ancestor::button//span[contains(@class, 'html-span')]", "span_text_ancestor"),
+        ("//section//span[contains(text(), '댓글')]/following-sibling::span", "section_span_following"),
+    ],
+    'username': [
+        ("//header//a[contains(@href, '/')]//span", "header_link_span"),
+        ("//article//header//a[contains(@href, '/')]//span", "article_header_link_span"),
+        ("//a[starts-with(@href, '/') and not(contains(@href, 'instagram.com'))]//span", "link_href_span"),
+    ],
+    'caption': [
+        ("//article//h1//span", "article_h1_span"),
+        ("//article//div[contains(@class, '')]//span", "article_div_span"),
+    ],
+}
+
+# DOM 후보 텍스트로 사용할 수 있는 값 (JavaScript 정규식, _pick_count 및 사용자명/캡션 선택 조건과 동일)
+# 일치하는 텍스트를 찾은 셀렉터에서 해당 필드의 나머지 셀렉터 평가를 생략
+DOM_ACCEPT_PATTERNS = {
+    'like_count': r'^[\d,.]*\d[\d,.]*$',
+    'comment_count': r'^[\d,.]*\d[\d,.]*$',
+    'username': r'^[^@][\s\S]{0,48}$',
+    'caption': r'^[\s\S]{11,}$',
+}
+
+# 페이지 텍스트에서 "좋아요"/"likes" 앞뒤의 숫자 찾기
+TEXT_COUNT_PATTERNS = {
+    'like_count': [
+        (re.compile(r'좋아요\s*([\d,]+)', re.IGNORECASE), "text_pattern_korean_after"),
+        (re.compile(r'likes?\s*([\d,]+)', re.IGNORECASE), "text_pattern_english_after"),
+        (re.compile(r'([\d,]+)\s*좋아요', re.IGNORECASE), "text_pattern_korean_before"),
+        (re.compile(r'([\d,]+)\s*likes?', re.IGNORECASE), "text_pattern_english_before"),
+    ],
+    'comment_count': [
+        (re.compile(r'댓글\s*([\d,]+)', re.IGNORECASE), "text_pattern_korean_after"),
+        (re.compile(r'comments?\s*([\d,]+)', re.IGNORECASE), "text_pattern_english_after"),
+        (re.compile(r'([\d,]+)\s*댓글', re.IGNORECASE), "text_pattern_korean_before"),
+        (re.compile(r'([\d,]+)\s*comments?', re.IGNORECASE), "text_pattern_english_before"),
+    ],
+}
+
+_browser_pool: Optional[BrowserPool] = None
+_http_session: Optional[requests.Session] = None
+_http_executor: Optional[ThreadPoolExecutor] = None
+_http_session_lock = threading.Lock()
+_browser_pool_lock = threading.Lock()
+
+
+def create_http_session() -> requests.Session:
+    """Instagram 요청용 HTTP 세션 생성 (브라우저와 같은 헤더, 동시 요청을 위한 연결 풀)"""
+    session = requests.Session()
+    # Instagram이 봇을 차단할 수 있으므로 User-Agent 설정
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+    })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """프로세스 전역 공유 HTTP 세션 반환 (최초 호출 시 생성)"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_http_session()
+    return _http_session
+
+
+def get_http_executor() -> ThreadPoolExecutor:
+    """oEmbed/HTML 요청을 병렬로 보내기 위한 공유 스레드 풀 (최초 호출 시 생성)"""
+    global _http_executor
+    if _http_executor is None:
+        with _http_session_lock:
+            if _http_executor is None:
+                _http_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="instagram-http")
+    return _http_executor
+
+
+def _record_tier(tier: str, filled_fields, complete: bool, failed: bool = False):
+    """티어 실행 결과 기록 (filled_fields: 값이 None이 아닌 필드, 0도 채워진 값으로 집계)"""
+    with _tier_stats_lock:
+        stats = _tier_stats['tiers'][tier]
+        stats['attempts'] += 1
+        stats['complete'] += int(complete)
+        stats['failures'] += int(failed)
+        for field in filled_fields:
+            stats['fields'][field] += 1
+
+
+_selector_ranker = SelectorRanker(decay=SELECTOR_DECAY)
+
+
+def _ordered_selectors(group: str, candidates):
+    """학습된 순서로 셀렉터 정렬 (ADAPTIVE_SELECTORS가 꺼져 있으면 정의된 순서)"""
+    return _selector_ranker.order(group, candidates) if ADAPTIVE_SELECTORS else list(candidates)
+
+
+def get_selector_stats() -> Dict:
+    """
+    필드별 셀렉터 학습 기록 (현재 시도 순서대로)
+
+    그룹: DOM XPath는 필드 이름, 페이지 텍스트 패턴은 {필드}_text
+    """
+    return {'adaptive': ADAPTIVE_SELECTORS, 'decay': _selector_ranker.decay, 'groups': _selector_ranker.stats()}
+
+
+def reset_selector_stats(group: Optional[str] = None):
+    """셀렉터 학습 기록 초기화 (정의된 순서로 돌아감)"""
+    _selector_ranker.reset(group)
+
+
+def _record_methods(data: Dict):
+    """크롤링 결과의 필드별 추출 방법 기록 (/metrics, 찾지 못한 필드는 none)"""
+    methods = data.get('extraction_methods') or {}
+    for field in CRAWL_FIELDS:
+        EXTRACTION_METHODS.inc(field, methods.get(field) or 'none')
+
+
+def _record_transfer(transfer: Dict):
+    """브라우저 크롤링 1회의 전송량 기록"""
+    with _tier_stats_lock:
+        _tier_stats['browser_bytes'] += transfer['bytes']
+        _tier_stats['browser_measured'] += 1
+
+
+def get_crawl_stats() -> Dict:
+    """
+    티어별 크롤링 통계
+
+    hit_rate: 해당 티어에서 모든 필드를 채운 비율
+    browser_escalation_rate: 전체 크롤링 중 브라우저 티어까지 간 비율
+    browser_transfer: 브라우저 크롤링 전송량 (경량 크롤링 시 측정)
+    """
+    with _tier_stats_lock:
+        crawls = _tier_stats['crawls']
+        browser_bytes = _tier_stats['browser_bytes']
+        browser_measured = _tier_stats['browser_measured']
+        tiers = {
+            tier: dict(stats, fields=dict(stats['fields']))
+            for tier, stats in _tier_stats['tiers'].items()
+        }
+    for stats in tiers.values():
+        stats['hit_rate'] = round(stats['complete'] / stats['attempts'], 4) if stats['attempts'] else 0.0
+    browser_attempts = tiers['browser']['attempts']
+    return {
+        'crawls': crawls,
+        'tiers': tiers,
+        'browser_escalation_rate': round(browser_attempts / crawls, 4) if crawls else 0.0,
+        'browser_transfer': {
+            'crawls': browser_measured,
+            'bytes_total': browser_bytes,
+            'bytes_average': browser_bytes // browser_measured if browser_measured else 0,
+        },
+    }
+
+
+def canonical_post_url(post_id: str) -> str:
+    """게시물 ID(shortcode)의 표준 URL (/p/, /reel/, /tv/ 및 쿼리 문자열 차이 제거)"""
+    return f"{INSTAGRAM_BASE_URL}/p/{post_id}/"
+
+
+def create_chrome_driver():
+    """헤드리스 Chrome WebDriver 생성"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 헤드리스 모드
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    if LEAN_CRAWL:
+        apply_lean_options(chrome_options)
+    elif NETWORK_CAPTURE:
+        enable_performance_log(chrome_options)
+
+    # 드라이버 경로는 프로세스 시작 시 1회 확인한 결과를 재사용 (크롤링마다 버전 조회/다운로드 없음)
+    service = Service(get_chromedriver().path)
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        if LEAN_CRAWL:
+            block_requests(driver, BLOCKED_URL_PATTERNS)
+        elif NETWORK_CAPTURE:
+            enable_network(driver)
+    except Exception as e:
+        safe_log(logging.WARNING, "Could not enable CDP network domain: %s", e)
+    return driver
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전역 브라우저 풀 반환 (최초 호출 시 생성)"""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(
+                    create_chrome_driver,
+                    size=BROWSER_POOL_SIZE,
+                    max_uses=BROWSER_MAX_PAGES,
+                    lease_timeout=BROWSER_LEASE_TIMEOUT,
+                    clear_origins=(INSTAGRAM_BASE_URL,),
+                )
+    return _browser_pool
+
+
+def shutdown_browser_pool():
+    """브라우저 풀 종료 (앱 종료 시 호출)"""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is not None:
+            _browser_pool.shutdown()
+            _browser_pool = None
+
 
 class InstagramCrawler:
     """인스타그램 게시물 크롤링 클래스"""
     
-    def __init__(self, use_selenium: bool = True):
+    def __init__(self, use_selenium: bool = True, session: Optional[requests.Session] = None):
         """
         Args:
             use_selenium: Selenium 사용 여부 (기본값: True)
+            session: 사용할 HTTP 세션 (기본값: 프로세스 전역 공유 세션)
         """
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
-        self.session = requests.Session()
-        # Instagram이 봇을 차단할 수 있으므로 User-Agent 설정
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-        })
+        # keep-alive 연결을 재사용하도록 요청 간 공유 세션 사용
+        self.session = session or get_http_session()
         # Instagram Graph API Access Token (선택사항)
         self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
     
@@ -72,6 +397,8 @@ class InstagramCrawler:
             r'instagram\.com/p/([A-Za-z0-9_-]+)',
             r'instagram\.com/reel/([A-Za-z0-9_-]+)',
             r'instagram\.com/tv/([A-Za-z0-9_-]+)',
+            # INSTAGRAM_BASE_URL로 지정한 로컬 대체 페이지의 게시물 URL
+            re.escape(INSTAGRAM_BASE_URL) + r'/p/([A-Za-z0-9_-]+)',
         ]
         
         for pattern in patterns:
@@ -87,26 +414,26 @@ class InstagramCrawler:
             return False
         
         # Instagram 도메인 확인
-        if 'instagram.com' not in url.lower():
+        if 'instagram.com' not in url.lower() and not url.startswith(INSTAGRAM_BASE_URL):
             return False
         
         # 게시물 ID 추출 가능한지 확인
         post_id = self.parse_instagram_url(url)
         return post_id is not None
     
-    def get_oembed_data(self, url: str) -> Dict:
+    def get_oembed_data(self, url: str, timeout: float = 10) -> Dict:
         """
         Instagram oEmbed API 사용 (인증 불필요)
         공개 게시물의 기본 정보 제공
         """
         try:
-            oembed_url = "https://api.instagram.com/oembed"
+            oembed_url = INSTAGRAM_OEMBED_URL
             params = {
                 'url': url,
                 'omitscript': 'true'
             }
             
-            response = self.session.get(oembed_url, params=params, timeout=10)
+            response = self.session.get(oembed_url, params=params, timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -120,13 +447,15 @@ class InstagramCrawler:
             log_error(e, f"Error fetching oEmbed data: {url}")
             return {}
     
-    def extract_from_html(self, html: str) -> Dict:
+    def extract_from_html(self, html: str, shortcode: Optional[str] = None) -> Dict:
         """
         HTML에서 게시물 정보 추출
-        Instagram의 JSON 데이터 구조에서 정보 추출
+        Instagram이 페이지에 포함시킨 JSON 데이터(script 블록)를 한 번 파싱해
+        해당 게시물(shortcode)의 미디어 노드에서 정보 추출
         
         Args:
             html: Instagram 페이지 HTML
+            shortcode: 게시물 ID (주어지면 다른 게시물/사용자의 값을 잘못 잡지 않도록 해당 노드만 사용)
             
         Returns:
             추출된 정보 딕셔너리
@@ -140,359 +469,268 @@ class InstagramCrawler:
         }
         
         try:
-            # Instagram은 게시물 정보를 여러 형태로 포함시킴
-            
-            # 패턴 1: JSON 데이터 직접 추출
-            # 좋아요 수
-            like_patterns = [
-                r'"like_count":\s*(\d+)',
-                r'"edge_media_preview_like":\s*\{[^}]*"count":\s*(\d+)',
-                r'"edge_liked_by":\s*\{[^}]*"count":\s*(\d+)',
-            ]
-            for pattern in like_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    data['like_count'] = int(match.group(1))
-                    break
-            
-            # 댓글 수
-            comment_patterns = [
-                r'"comment_count":\s*(\d+)',
-                r'"edge_media_to_comment":\s*\{[^}]*"count":\s*(\d+)',
-                r'"edge_media_to_parent_comment":\s*\{[^}]*"count":\s*(\d+)',
-            ]
-            for pattern in comment_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    data['comment_count'] = int(match.group(1))
-                    break
-            
-            # 날짜
-            date_patterns = [
-                r'"taken_at_timestamp":\s*(\d+)',
-                r'"uploadDate":\s*"([^"]+)"',
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    if pattern.startswith('"taken_at_timestamp"'):
-                        timestamp = int(match.group(1))
-                        data['post_date'] = datetime.fromtimestamp(timestamp).isoformat()
-                    else:
-                        data['post_date'] = match.group(1)
-                    break
-            
-            # 사용자명
-            username_patterns = [
-                r'"username":\s*"([^"]+)"',
-                r'"owner":\s*\{[^}]*"username":\s*"([^"]+)"',
-            ]
-            for pattern in username_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    data['username'] = match.group(1)
-                    break
-            
-            # 캡션
-            caption_patterns = [
-                r'"edge_media_to_caption":\s*\{[^}]*"text":\s*"([^"]+)"',
-                r'"caption":\s*"([^"]+)"',
-            ]
-            for pattern in caption_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    # 이스케이프 문자 처리
-                    caption = match.group(1).replace('\\n', '\n').replace('\\"', '"')
-                    data['caption'] = caption
-                    break
-            
-            # 패턴 2: window._sharedData에서 추출
-            shared_data_match = re.search(r'window\._sharedData\s*=\s*({.+?});', html, re.DOTALL)
-            if shared_data_match:
-                try:
-                    shared_data = json.loads(shared_data_match.group(1))
-                    # 데이터 구조 탐색
-                    if 'entry_data' in shared_data:
-                        entry_data = shared_data['entry_data']
-                        # 게시물 페이지인 경우
-                        if 'PostPage' in entry_data:
-                            post_data = entry_data['PostPage'][0]['graphql']['shortcode_media']
-                            if not data['like_count']:
-                                data['like_count'] = post_data.get('edge_media_preview_like', {}).get('count')
-                            if not data['comment_count']:
-                                data['comment_count'] = post_data.get('edge_media_to_comment', {}).get('count')
-                            if not data['post_date']:
-                                timestamp = post_data.get('taken_at_timestamp')
-                                if timestamp:
-                                    data['post_date'] = datetime.fromtimestamp(timestamp).isoformat()
-                            if not data['username']:
-                                data['username'] = post_data.get('owner', {}).get('username')
-                            if not data['caption']:
-                                edges = post_data.get('edge_media_to_caption', {}).get('edges', [])
-                                if edges:
-                                    data['caption'] = edges[0].get('node', {}).get('text', '')
-                except Exception as e:
-                    safe_log(logging.DEBUG, f"Could not parse _sharedData: {str(e)}")
+            # 1단계: 임베디드 JSON 구조 파싱 (script 블록 1회 탐색)
+            data.update(extract_post_fields(html, shortcode))
+        except Exception as e:
+            # 구조 파싱이 실패해도 정규식 보완은 계속 진행
+            log_error(e, "Error parsing embedded JSON")
+        
+        try:
+            # 2단계: 구조를 찾지 못한 필드만 정규식으로 보완
+            for field, patterns in HTML_FIELD_PATTERNS.items():
+                if data[field] is not None:
+                    continue
+                for pattern in patterns:
+                    match = pattern.search(html)
+                    if match:
+                        data[field] = self._convert_html_match(field, pattern, match.group(1))
+                        break
             
         except Exception as e:
             log_error(e, "Error extracting data from HTML")
         
         return data
     
-    def crawl_with_selenium(self, url: str) -> Dict:
+    @staticmethod
+    def _convert_html_match(field: str, pattern, value: str):
+        """정규식 보완 단계에서 찾은 문자열을 필드 형식으로 변환"""
+        if field in ('like_count', 'comment_count'):
+            return int(value)
+        if field == 'post_date' and 'taken_at_timestamp' in pattern.pattern:
+            return datetime.fromtimestamp(int(value)).isoformat()
+        if field == 'caption':
+            # 이스케이프 문자 처리
+            return value.replace('\\n', '\n').replace('\\"', '"')
+        return value
+    
+    def crawl_with_selenium(self, url: str, known: Optional[Dict] = None) -> Dict:
         """
         Selenium을 사용한 Instagram 크롤링
         JavaScript 렌더링이 완료된 후 데이터 추출
         
         Args:
             url: Instagram 게시물 URL
+            known: 이미 알고 있는 필드 값 (해당 필드는 DOM 탐색 생략)
             
         Returns:
             게시물 정보 딕셔너리
         """
-        driver = None
         try:
-            # Chrome 옵션 설정
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # 헤드리스 모드
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # WebDriver 생성
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
+            # 브라우저 풀에서 미리 실행된 WebDriver 임대
+            with get_browser_pool().lease() as driver:
+                return self._crawl_with_driver(driver, url, known)
+        except Exception as e:
+            log_error(e, f"Error with Selenium crawling: {url}")
+            raise ValueError(f"Selenium crawling failed: {str(e)}")
+    
+    def _crawl_with_driver(self, driver, url: str, known: Optional[Dict] = None) -> Dict:
+        """임대받은 WebDriver로 게시물 페이지를 로드하고 데이터 추출"""
+        shortcode = self.parse_instagram_url(url)
+        capture = NetworkCapture(driver, NETWORK_JSON_URL_PATTERNS) if NETWORK_CAPTURE else None
+        # 이전 임대에서 남은 네트워크 이벤트 제거 (이번 크롤링 전송량/응답만 사용)
+        if capture is not None:
+            capture.reset()
+        elif LEAN_CRAWL:
+            drain_performance_log(driver)
+        network_data: Dict = {}
+        
+        with span("page_load"):
             # 페이지 로드
             driver.get(url)
             
-            # 페이지가 완전히 로드될 때까지 대기 (최대 15초)
-            time.sleep(3)  # 초기 로딩 대기
-            wait = WebDriverWait(driver, 15)
-            
-            # 페이지 스크롤 (게시물이 완전히 로드되도록)
+            # 고정 대기 대신 게시물 JSON 응답 또는 게시물 데이터(임베디드 JSON/DOM)가 나타나는 즉시 진행
+            wait_for_post_ready(
+                driver,
+                PAGE_READY_TIMEOUT,
+                early=(lambda: self._capture_post_json(capture, shortcode, network_data)) if capture else None,
+            )
+        
+        # 페이지 준비 이후 도착한 응답 확인 (임베디드 JSON이 먼저 감지된 경우)
+        if capture is not None and any(network_data.get(field) is None for field in CRAWL_FIELDS):
+            self._capture_post_json(capture, shortcode, network_data)
+        
+        # 추출 방법 추적을 위한 딕셔너리
+        extraction_methods = {
+            'like_count': None,
+            'comment_count': None,
+            'username': None,
+            'caption': None,
+            'post_date': None,
+        }
+        
+        if all(network_data.get(field) is not None for field in CRAWL_FIELDS):
+            # 게시물 JSON 응답으로 모든 필드를 얻었으면 page_source/DOM 추출을 생략
+            safe_log(logging.INFO, "All fields captured from network JSON, skipping HTML parsing")
+            html_data = dict(network_data)
+        else:
+            # HTML에서 데이터 추출 (임베디드 JSON → 정규식 폴백)
+            with span("html_parse"):
+                html = driver.page_source
+                html_data = self.extract_from_html(html, shortcode)
+            # 해당 게시물의 응답에서 읽은 값을 우선 사용
+            html_data.update({field: value for field, value in network_data.items() if value is not None})
+        
+        # 네트워크 응답/HTML 파싱으로 추출된 데이터 확인
+        for field in extraction_methods:
+            if html_data.get(field) is not None:
+                extraction_methods[field] = 'network_json' if network_data.get(field) is not None else 'html_json_parsing'
+        
+        # 이전 티어에서 얻은 값은 그대로 사용 (DOM 탐색 생략)
+        for field, value in (known or {}).items():
+            if value is not None and html_data.get(field) is None:
+                html_data[field] = value
+                extraction_methods[field] = 'known'
+        
+        like_count = html_data.get('like_count')
+        comment_count = html_data.get('comment_count')
+        username = html_data.get('username')
+        caption = html_data.get('caption')
+        
+        # 임베디드 JSON으로 모든 필드를 얻었으면 DOM 폴백을 건너뜀
+        # 0(댓글 없음 등)도 유효한 값이므로 None만 누락으로 판단
+        missing_fields = [field for field in DOM_SELECTORS if html_data.get(field) is None]
+        if not missing_fields:
+            safe_log(logging.INFO, "All fields found in page data, skipping DOM fallbacks")
+        else:
+            # 페이지 스크롤 (지연 렌더링되는 게시물 영역 로드)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(2)
-            
-            # 추출 방법 추적을 위한 딕셔너리
-            extraction_methods = {
-                'like_count': None,
-                'comment_count': None,
-                'username': None,
-                'caption': None,
-                'post_date': None,
-            }
-            
-            # HTML에서 먼저 데이터 추출 시도 (가장 확실한 방법)
-            html = driver.page_source
-            html_data = self.extract_from_html(html)
             
-            # HTML 파싱으로 추출된 데이터 확인
-            if html_data.get('like_count'):
-                extraction_methods['like_count'] = 'html_json_parsing'
-            if html_data.get('comment_count'):
-                extraction_methods['comment_count'] = 'html_json_parsing'
-            if html_data.get('username'):
-                extraction_methods['username'] = 'html_json_parsing'
-            if html_data.get('caption'):
-                extraction_methods['caption'] = 'html_json_parsing'
-            if html_data.get('post_date'):
-                extraction_methods['post_date'] = 'html_json_parsing'
-            
-            # 좋아요 수 추출 (여러 방법 시도)
-            like_count = html_data.get('like_count')
-            if not like_count:
-                try:
-                    # 방법 1: 버튼에서 추출
-                    like_selectors = [
-                        ("//button[contains(@aria-label, '좋아요')]//span", "button_aria_label_korean"),
-                        ("//button[contains(@aria-label, 'like')]//span", "button_aria_label_english"),
-                        ("//a[contains(@href, '/liked_by/')]//span", "link_href_liked_by"),
-                        ("//span[contains(text(), '좋아요')]/ancestor::button//span[contains(@class, 'html-span')]", "span_text_ancestor"),
-                        ("//section//span[contains(text(), '좋아요')]/following-sibling::span", "section_span_following"),
-                    ]
-                    for selector, method_name in like_selectors:
-                        try:
-                            elements = driver.find_elements(By.XPATH, selector)
-                            for element in elements:
-                                text = element.text.strip()
-                                if text and text.replace(',', '').replace('.', '').isdigit():
-                                    like_count = int(text.replace(',', '').replace('.', ''))
-                                    extraction_methods['like_count'] = f'selenium_xpath_{method_name}'
-                                    safe_log(logging.INFO, f"Like count extracted using: {method_name}")
-                                    break
-                            if like_count:
-                                break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Selector {method_name} failed: {str(e)}")
-                            continue
-                    
-                    # 방법 2: 텍스트에서 숫자 찾기
-                    if not like_count:
-                        try:
-                            page_text = driver.find_element(By.TAG_NAME, "body").text
-                            # "좋아요" 또는 "likes" 다음의 숫자 찾기
-                            like_patterns = [
-                                (r'좋아요\s*([\d,]+)', "text_pattern_korean_after"),
-                                (r'likes?\s*([\d,]+)', "text_pattern_english_after"),
-                                (r'([\d,]+)\s*좋아요', "text_pattern_korean_before"),
-                                (r'([\d,]+)\s*likes?', "text_pattern_english_before"),
-                            ]
-                            for pattern, method_name in like_patterns:
-                                match = re.search(pattern, page_text, re.IGNORECASE)
-                                if match:
-                                    like_count = int(match.group(1).replace(',', ''))
-                                    extraction_methods['like_count'] = f'selenium_text_{method_name}'
-                                    safe_log(logging.INFO, f"Like count extracted using: {method_name}")
-                                    break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Text pattern matching failed: {str(e)}")
-                            pass
-                except Exception as e:
-                    safe_log(logging.DEBUG, f"Could not extract like count from elements: {str(e)}")
-            
-            # 댓글 수 추출 (여러 방법 시도)
-            comment_count = html_data.get('comment_count')
-            if not comment_count:
-                try:
-                    comment_selectors = [
-                        ("//button[contains(@aria-label, '댓글')]//span", "button_aria_label_korean"),
-                        ("//button[contains(@aria-label, 'comment')]//span", "button_aria_label_english"),
-                        ("//a[contains(@href, '/comments/')]//span", "link_href_comments"),
-                        ("//span[contains(text(), '댓글')]/ancestor::button//span[contains(@class, 'html-span')]", "span_text_ancestor"),
-                        ("//section//span[contains(text(), '댓글')]/following-sibling::span", "section_span_following"),
-                    ]
-                    for selector, method_name in comment_selectors:
-                        try:
-                            elements = driver.find_elements(By.XPATH, selector)
-                            for element in elements:
-                                text = element.text.strip()
-                                if text and text.replace(',', '').replace('.', '').isdigit():
-                                    comment_count = int(text.replace(',', '').replace('.', ''))
-                                    extraction_methods['comment_count'] = f'selenium_xpath_{method_name}'
-                                    safe_log(logging.INFO, f"Comment count extracted using: {method_name}")
-                                    break
-                            if comment_count:
-                                break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Selector {method_name} failed: {str(e)}")
-                            continue
-                    
-                    # 방법 2: 텍스트에서 숫자 찾기
-                    if not comment_count:
-                        try:
-                            page_text = driver.find_element(By.TAG_NAME, "body").text
-                            comment_patterns = [
-                                (r'댓글\s*([\d,]+)', "text_pattern_korean_after"),
-                                (r'comments?\s*([\d,]+)', "text_pattern_english_after"),
-                                (r'([\d,]+)\s*댓글', "text_pattern_korean_before"),
-                                (r'([\d,]+)\s*comments?', "text_pattern_english_before"),
-                            ]
-                            for pattern, method_name in comment_patterns:
-                                match = re.search(pattern, page_text, re.IGNORECASE)
-                                if match:
-                                    comment_count = int(match.group(1).replace(',', ''))
-                                    extraction_methods['comment_count'] = f'selenium_text_{method_name}'
-                                    safe_log(logging.INFO, f"Comment count extracted using: {method_name}")
-                                    break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Text pattern matching failed: {str(e)}")
-                            pass
-                except Exception as e:
-                    safe_log(logging.DEBUG, f"Could not extract comment count from elements: {str(e)}")
-            
-            # 사용자명 추출
-            username = html_data.get('username')
-            if not username:
-                try:
-                    username_selectors = [
-                        ("//header//a[contains(@href, '/')]//span", "header_link_span"),
-                        ("//article//header//a[contains(@href, '/')]//span", "article_header_link_span"),
-                        ("//a[starts-with(@href, '/') and not(contains(@href, 'instagram.com'))]//span", "link_href_span"),
-                    ]
-                    for selector, method_name in username_selectors:
-                        try:
-                            elements = driver.find_elements(By.XPATH, selector)
-                            for element in elements:
-                                text = element.text.strip()
-                                if text and not text.startswith('@') and len(text) > 0 and len(text) < 50:
-                                    username = text.replace('@', '')
-                                    extraction_methods['username'] = f'selenium_xpath_{method_name}'
-                                    safe_log(logging.INFO, f"Username extracted using: {method_name}")
-                                    break
-                            if username:
-                                break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Selector {method_name} failed: {str(e)}")
-                            continue
-                except Exception as e:
-                    safe_log(logging.DEBUG, f"Username extraction failed: {str(e)}")
-                    pass
-            
-            # 캡션 추출
-            caption = html_data.get('caption')
-            if not caption:
+            # 부족한 필드의 후보 텍스트를 스크립트 1회 실행으로 수집 (후보가 생길 때까지 폴링)
+            # 학습된 순서로 시도하고, 사용할 수 있는 값을 찾은 셀렉터에서 멈춤
+            try:
+                with span("dom_snapshot"):
+                    snapshot = wait_for_dom_snapshot(
+                        driver,
+                        {field: _ordered_selectors(field, DOM_SELECTORS[field]) for field in missing_fields},
+                        max(FIELD_DEADLINES[field] for field in missing_fields),
+                        accept={field: DOM_ACCEPT_PATTERNS[field] for field in missing_fields},
+                    )
+            except Exception as e:
+                safe_log(logging.DEBUG, "DOM snapshot failed: %s", e)
+                snapshot = None
+            # 마지막 스냅샷 기준으로 셀렉터별 성공 여부/비용 기록 (렌더링 전 폴링 결과는 기록하지 않음)
+            for field, attempts in (snapshot or {}).get('attempts', {}).items():
+                for method_name, cost_ms, matched in attempts:
+                    _selector_ranker.record(field, method_name, matched, cost_ms)
+            candidates = (snapshot or {}).get('fields', {})
+            
+            # 좋아요/댓글 수: 버튼/링크 텍스트에서 숫자 추출
+            if like_count is None:
+                like_count, extraction_methods['like_count'] = self._pick_count(candidates.get('like_count', []))
+            if comment_count is None:
+                comment_count, extraction_methods['comment_count'] = self._pick_count(candidates.get('comment_count', []))
+            
+            # 찾지 못했으면 페이지 텍스트에서 숫자 찾기 (body 텍스트도 1회만 요청)
+            if like_count is None or comment_count is None:
                 try:
-                    caption_selectors = [
-                        ("//article//h1//span", "article_h1_span"),
-                        ("//article//div[contains(@class, '')]//span", "article_div_span"),
-                    ]
-                    for selector, method_name in caption_selectors:
-                        try:
-                            elements = driver.find_elements(By.XPATH, selector)
-                            for element in elements:
-                                text = element.text.strip()
-                                if text and len(text) > 10:
-                                    caption = text
-                                    extraction_methods['caption'] = f'selenium_xpath_{method_name}'
-                                    safe_log(logging.INFO, f"Caption extracted using: {method_name}")
-                                    break
-                            if caption:
-                                break
-                        except Exception as e:
-                            safe_log(logging.DEBUG, f"Selector {method_name} failed: {str(e)}")
-                            continue
+                    page_text = take_dom_snapshot(driver, {}, include_body=True).get('body') or ''
                 except Exception as e:
-                    safe_log(logging.DEBUG, f"Caption extraction failed: {str(e)}")
-                    pass
-            
-            # 데이터 병합
-            data = {
-                'url': url,
-                'post_id': self.parse_instagram_url(url),
-                'username': username or html_data.get('username'),
-                'caption': caption or html_data.get('caption'),
-                'like_count': like_count or html_data.get('like_count'),
-                'comment_count': comment_count or html_data.get('comment_count'),
-                'post_date': html_data.get('post_date'),
-                'share_count': None,
-                'method': 'selenium',
-                'extraction_methods': extraction_methods  # 추출 방법 정보 추가
-            }
-            
-            # 추출 방법 로그 출력
-            safe_log(logging.INFO, f"Extracted data: likes={data['like_count']} (method: {extraction_methods.get('like_count', 'none')}), "
-                                  f"comments={data['comment_count']} (method: {extraction_methods.get('comment_count', 'none')}), "
-                                  f"username={data['username']} (method: {extraction_methods.get('username', 'none')})")
-            
-            return data
-            
-        except Exception as e:
-            log_error(e, f"Error with Selenium crawling: {url}")
-            raise ValueError(f"Selenium crawling failed: {str(e)}")
-        finally:
-            if driver:
-                driver.quit()
+                    safe_log(logging.DEBUG, "Text pattern matching failed: %s", e)
+                    page_text = ''
+                if like_count is None:
+                    like_count, method_name = self._match_text_count(page_text, 'like_count')
+                    if like_count is not None:
+                        extraction_methods['like_count'] = method_name
+                if comment_count is None:
+                    comment_count, method_name = self._match_text_count(page_text, 'comment_count')
+                    if comment_count is not None:
+                        extraction_methods['comment_count'] = method_name
+            
+            # 사용자명: 헤더 링크 텍스트
+            if username is None:
+                for method_name, texts in candidates.get('username', []):
+                    username = next((text.replace('@', '') for text in texts if not text.startswith('@') and len(text) < 50), None)
+                    if username:
+                        extraction_methods['username'] = f'selenium_xpath_{method_name}'
+                        safe_log(logging.INFO, "Username extracted using: %s", method_name)
+                        break
+            
+            # 캡션: 게시물 본문 텍스트
+            if caption is None:
+                for method_name, texts in candidates.get('caption', []):
+                    caption = next((text for text in texts if len(text) > 10), None)
+                    if caption:
+                        extraction_methods['caption'] = f'selenium_xpath_{method_name}'
+                        safe_log(logging.INFO, "Caption extracted using: %s", method_name)
+                        break
+        
+        # 데이터 병합
+        data = {
+            'url': url,
+            'post_id': self.parse_instagram_url(url),
+            'username': username or html_data.get('username'),
+            'caption': caption or html_data.get('caption'),
+            'like_count': like_count if like_count is not None else html_data.get('like_count'),
+            'comment_count': comment_count if comment_count is not None else html_data.get('comment_count'),
+            'post_date': html_data.get('post_date'),
+            'share_count': None,
+            'method': 'selenium',
+            'extraction_methods': extraction_methods  # 추출 방법 정보 추가
+        }
+        
+        if LEAN_CRAWL:
+            data['transfer'] = capture.transfer() if capture is not None else summarize_transfer(drain_performance_log(driver))
+            _record_transfer(data['transfer'])
+            safe_log(logging.INFO, "Browser transfer: %d bytes, %d requests, %d blocked",
+                     data['transfer']['bytes'], data['transfer']['requests'], data['transfer']['blocked'])
+        
+        # 추출 방법 로그 출력
+        safe_log(logging.INFO, "Extracted data: likes=%s (method: %s), comments=%s (method: %s), username=%s (method: %s)",
+                 data['like_count'], extraction_methods.get('like_count', 'none'),
+                 data['comment_count'], extraction_methods.get('comment_count', 'none'),
+                 data['username'], extraction_methods.get('username', 'none'))
+        
+        return data
+
+    @staticmethod
+    def _capture_post_json(capture: NetworkCapture, shortcode: Optional[str], found: Dict) -> Optional[str]:
+        """
+        새로 도착한 JSON 응답에서 게시물 필드를 찾아 found에 채움 (wait_for_post_ready의 조기 종료 조건)
+
+        Returns:
+            해당 게시물의 미디어 노드를 찾았으면 'network_json', 아니면 None
+        """
+        for response_url, body in capture.poll():
+            with span("network_json"):
+                fields = extract_response_fields(body, shortcode)
+            for field, value in fields.items():
+                if value is not None and found.get(field) is None:
+                    found[field] = value
+            if fields:
+                safe_log(logging.INFO, "Post JSON captured from network response: %s", response_url.split('?')[0])
+        return 'network_json' if found else None
+    
+    @staticmethod
+    def _pick_count(candidates) -> tuple:
+        """DOM 후보 텍스트 중 숫자로만 된 첫 텍스트를 정수로 변환 (값, 추출 방법)"""
+        for method_name, texts in candidates:
+            for text in texts:
+                digits = text.replace(',', '').replace('.', '')
+                if digits.isdigit():
+                    safe_log(logging.INFO, "Count extracted using: %s", method_name)
+                    return int(digits), f'selenium_xpath_{method_name}'
+        return None, None
+    
+    @staticmethod
+    def _match_text_count(page_text: str, field: str) -> tuple:
+        """페이지 텍스트에서 '좋아요 N' 형태의 숫자 찾기 (값, 추출 방법, 학습된 순서로 시도)"""
+        if not page_text:
+            return None, None
+        group = f'{field}_text'
+        for pattern, method_name in _ordered_selectors(group, TEXT_COUNT_PATTERNS[field]):
+            started = time.perf_counter()
+            match = pattern.search(page_text)
+            _selector_ranker.record(group, method_name, match is not None, (time.perf_counter() - started) * 1000)
+            if match:
+                safe_log(logging.INFO, "Count extracted using: %s", method_name)
+                return int(match.group(1).replace(',', '')), f'selenium_text_{method_name}'
+        return None, None
     
     def crawl_post(self, url: str) -> Dict:
         """
         Instagram 게시물 정보 크롤링
-        Selenium 우선 사용, 실패 시 oEmbed + HTML 파싱
+        1단계(HTTP): oEmbed + HTML 파싱을 병렬로 실행
+        2단계(브라우저): HTTP로 채우지 못한 필드가 있을 때만 Selenium으로 보완
         
         Args:
             url: Instagram 게시물 URL
@@ -504,69 +742,131 @@ class InstagramCrawler:
         if not self.validate_url(url):
             raise ValueError("Invalid Instagram URL. Please provide a valid Instagram post URL.")
         
-        # Selenium 사용 시도
+        with _tier_stats_lock:
+            _tier_stats['crawls'] += 1
+        
+        # 1단계: 가장 저렴한 HTTP 티어
+        with span("http_tier"):
+            data, fetch_error = self.crawl_with_http(url)
+        # 0(좋아요/댓글 없음)도 유효한 값이므로 None만 누락으로 판단 (post_cache._store와 동일)
+        missing_fields = [field for field in CRAWL_FIELDS if data.get(field) is None]
+        _record_tier(
+            'http',
+            [field for field in CRAWL_FIELDS if data.get(field) is not None],
+            complete=not missing_fields,
+            failed=fetch_error is not None,
+        )
+        if not missing_fields:
+            safe_log(logging.INFO, "All fields extracted over HTTP, skipping browser")
+            _record_methods(data)
+            return data
+        
+        # 2단계: 부족한 필드만 브라우저로 보완
         if self.use_selenium:
+            safe_log(logging.INFO, "Escalating to Selenium for missing fields: %s", ', '.join(missing_fields))
+            known = {field: data[field] for field in CRAWL_FIELDS if data.get(field) is not None}
             try:
-                safe_log(logging.INFO, f"Attempting Selenium crawl for: {url}")
-                return self.crawl_with_selenium(url)
+                with span("browser_tier"):
+                    browser_data = self.crawl_with_selenium(url, known)
+                filled_fields = [field for field in missing_fields if browser_data.get(field) is not None]
+                _record_tier('browser', filled_fields, complete=len(filled_fields) == len(missing_fields))
+                browser_methods = browser_data.get('extraction_methods', {})
+                for field in filled_fields:
+                    data[field] = browser_data[field]
+                    data['extraction_methods'][field] = browser_methods.get(field)
+                data['method'] = 'selenium' if fetch_error else 'requests+selenium'
+                if 'transfer' in browser_data:
+                    data['transfer'] = browser_data['transfer']
+                _record_methods(data)
+                return data
             except Exception as e:
-                safe_log(logging.WARNING, f"Selenium crawl failed, falling back to requests: {str(e)}")
+                _record_tier('browser', [], complete=False, failed=True)
+                safe_log(logging.WARNING, "Selenium crawl failed, using HTTP result: %s", e)
         
-        # 폴백: oEmbed + HTML 파싱
-        try:
-            # 1단계: oEmbed API로 기본 정보 가져오기
-            oembed_data = self.get_oembed_data(url)
-            
-            # 2단계: HTML에서 상세 정보 추출
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            html = response.text
-            
-            # HTML에서 데이터 추출
-            html_data = self.extract_from_html(html)
-            
-            # 추출 방법 추적
-            extraction_methods = {
-                'like_count': 'html_json_parsing' if html_data.get('like_count') else 'oembed_only',
-                'comment_count': 'html_json_parsing' if html_data.get('comment_count') else 'oembed_only',
-                'username': 'html_json_parsing' if html_data.get('username') else ('oembed_api' if oembed_data.get('username') else 'none'),
-                'caption': 'html_json_parsing' if html_data.get('caption') else ('oembed_api' if oembed_data.get('caption') else 'none'),
-                'post_date': 'html_json_parsing' if html_data.get('post_date') else 'none',
-            }
-            
-            # 데이터 병합 (oEmbed 우선, HTML로 보완)
-            data = {
-                'url': url,
-                'post_id': self.parse_instagram_url(url),
-                'username': html_data.get('username') or oembed_data.get('username'),
-                'caption': html_data.get('caption') or oembed_data.get('caption'),
-                'like_count': html_data.get('like_count'),
-                'comment_count': html_data.get('comment_count'),
-                'post_date': html_data.get('post_date'),
-                'share_count': None,  # Instagram은 공유 수를 직접 제공하지 않음
-                'thumbnail_url': oembed_data.get('thumbnail_url'),
-                'method': 'requests',
-                'extraction_methods': extraction_methods  # 추출 방법 정보 추가
-            }
-            
-            # 추출 방법 로그 출력
-            safe_log(logging.INFO, f"Extracted data (requests): likes={data['like_count']} (method: {extraction_methods.get('like_count', 'none')}), "
-                                  f"comments={data['comment_count']} (method: {extraction_methods.get('comment_count', 'none')})")
-            
-            # 데이터 추출 성공 여부 확인
-            if not any([data['like_count'], data['comment_count'], data['post_date']]):
-                safe_log(logging.WARNING, "Could not extract detailed data from Instagram page. Using oEmbed data only.")
-            
-            return data
+        # HTML도 브라우저도 가져오지 못한 경우 실패 처리
+        if fetch_error is not None:
+            log_error(fetch_error, f"Error fetching Instagram URL: {url}")
+            raise ValueError(f"Failed to fetch Instagram post: {str(fetch_error)}")
+        
+        # 데이터 추출 성공 여부 확인
+        if all(data[field] is None for field in ('like_count', 'comment_count', 'post_date')):
+            safe_log(logging.WARNING, "Could not extract detailed data from Instagram page. Using oEmbed data only.")
+        
+        _record_methods(data)
+        return data
+    
+    def fetch_html(self, url: str, timeout: float = 15) -> str:
+        """게시물 페이지 HTML 요청"""
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    
+    def crawl_with_http(self, url: str):
+        """
+        oEmbed API와 게시물 HTML을 병렬로 요청해 데이터 추출
+        두 요청은 개별 타임아웃을 합산하지 않고 하나의 마감 시간(HTTP_DEADLINE)을 공유
+        
+        Args:
+            url: Instagram 게시물 URL
             
-        except requests.exceptions.RequestException as e:
-            log_error(e, f"Error fetching Instagram URL: {url}")
-            raise ValueError(f"Failed to fetch Instagram post: {str(e)}")
+        Returns:
+            (게시물 정보 딕셔너리, HTML 요청 오류 또는 None)
+        """
+        deadline = time.monotonic() + HTTP_DEADLINE
+        executor = get_http_executor()
+        oembed_future = executor.submit(self.get_oembed_data, url, min(10, HTTP_DEADLINE))
+        html_future = executor.submit(self.fetch_html, url, min(15, HTTP_DEADLINE))
+        
+        fetch_error = None
+        try:
+            html = html_future.result(timeout=max(0.0, deadline - time.monotonic()))
+            with span("html_parse"):
+                html_data = self.extract_from_html(html, self.parse_instagram_url(url))
+        except FutureTimeoutError:
+            html_future.cancel()
+            fetch_error = TimeoutError(f"HTML fetch exceeded {HTTP_DEADLINE:g}s deadline")
+            html_data = {}
         except Exception as e:
-            log_error(e, f"Error crawling Instagram post: {url}")
-            raise ValueError(f"Error crawling Instagram post: {str(e)}")
-    
+            fetch_error = e
+            html_data = {}
+        # get_oembed_data는 실패 시 빈 딕셔너리를 반환, 마감 시간을 넘기면 결과 없이 진행
+        try:
+            oembed_data = oembed_future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            oembed_future.cancel()
+            safe_log(logging.WARNING, "oEmbed request exceeded %gs deadline: %s", HTTP_DEADLINE, url)
+            oembed_data = {}
+        
+        # 추출 방법 추적
+        extraction_methods = {
+            'like_count': 'html_json_parsing' if html_data.get('like_count') is not None else None,
+            'comment_count': 'html_json_parsing' if html_data.get('comment_count') is not None else None,
+            'username': 'html_json_parsing' if html_data.get('username') else ('oembed_api' if oembed_data.get('username') else None),
+            'caption': 'html_json_parsing' if html_data.get('caption') else ('oembed_api' if oembed_data.get('caption') else None),
+            'post_date': 'html_json_parsing' if html_data.get('post_date') is not None else None,
+        }
+        
+        # 데이터 병합 (HTML 우선, oEmbed로 보완)
+        data = {
+            'url': url,
+            'post_id': self.parse_instagram_url(url),
+            'username': html_data.get('username') or oembed_data.get('username'),
+            'caption': html_data.get('caption') or oembed_data.get('caption'),
+            'like_count': html_data.get('like_count'),
+            'comment_count': html_data.get('comment_count'),
+            'post_date': html_data.get('post_date'),
+            'share_count': None,  # Instagram은 공유 수를 직접 제공하지 않음
+            'thumbnail_url': oembed_data.get('thumbnail_url'),
+            'method': 'requests',
+            'extraction_methods': extraction_methods  # 추출 방법 정보 추가
+        }
+        
+        # 추출 방법 로그 출력
+        safe_log(logging.INFO, "Extracted data (requests): likes=%s (method: %s), comments=%s (method: %s)",
+                 data['like_count'], extraction_methods.get('like_count') or 'none',
+                 data['comment_count'], extraction_methods.get('comment_count') or 'none')
+        
+        return data, fetch_error
 
 
 def crawl_instagram_post(url: str, use_selenium: bool = True) -> Dict:
@@ -0,0 +1,225 @@
+"""
+인스타그램 임베디드 JSON 추출 모듈
+페이지 HTML의 <script> 블록을 한 번만 훑어 게시물 데이터가 담긴 JSON을 파싱하고,
+요청한 게시물(shortcode)의 미디어 노드를 찾아 필드를 읽음
+(페이지 전체에 정규식을 필드별로 반복 적용하면 다른 사용자/게시물의 값이 먼저 잡힐 수 있음)
+브라우저가 받은 XHR/GraphQL 응답 본문도 같은 방식으로 파싱 (extract_response_fields)
+"""
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+SCRIPT_PATTERN = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.DOTALL | re.IGNORECASE)
+
+# 스크립트 안에서 JSON 값이 시작되는 위치 (전역 변수 대입, 지연 로드 콜백)
+ASSIGNMENT_PATTERN = re.compile(
+    r'(?:window\._sharedData\s*=|window\.__additionalDataLoaded\(\s*[\'"][^\'"]*[\'"]\s*,)\s*'
+)
+
+# 게시물 미디어 노드로 판단할 키 (shortcode만 같은 링크/썸네일 노드 제외)
+MEDIA_KEYS = (
+    'owner', 'user', 'taken_at', 'taken_at_timestamp', 'like_count',
+    'edge_media_preview_like', 'edge_liked_by', 'edge_media_to_caption', 'caption',
+)
+
+# XHR 응답 앞에 붙는 JSON 하이재킹 방지 접두사
+RESPONSE_PREFIX = re.compile(r'^\s*(?:for\s*\(;;\);|while\s*\(1\);|\)\]\}\'?,?)')
+
+_decoder = json.JSONDecoder()
+
+
+def iter_embedded_json(html: str, shortcode: Optional[str] = None) -> Iterator[Any]:
+    """
+    HTML의 <script> 블록에 포함된 JSON 값을 순서대로 반환
+
+    - type="application/json" / "application/ld+json" 블록 (relay 페이로드 포함)
+    - window._sharedData = {...}
+    - window.__additionalDataLoaded('...', {...})
+
+    shortcode가 주어지면 해당 문자열이 없는 블록은 파싱하지 않음
+    """
+    for match in SCRIPT_PATTERN.finditer(html):
+        attrs, body = match.group(1), match.group(2)
+        if shortcode and shortcode not in body:
+            continue
+        if 'json' in attrs.lower():
+            try:
+                yield json.loads(body)
+            except ValueError:
+                continue
+            continue
+        for assignment in ASSIGNMENT_PATTERN.finditer(body):
+            try:
+                # 정규식으로 끝을 찾지 않고 JSON 값 하나만 정확히 디코딩
+                value, _ = _decoder.raw_decode(body, assignment.end())
+            except ValueError:
+                continue
+            yield value
+
+
+def find_media_node(data: Any, shortcode: Optional[str] = None) -> Optional[Dict]:
+    """
+    JSON 트리에서 게시물 미디어 노드 탐색 (shortcode/code가 일치하고 미디어 키를 가진 dict)
+
+    shortcode가 없으면 미디어 키를 가진 첫 번째 노드 반환
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            code = node.get('shortcode') or node.get('code')
+            if isinstance(code, str) and (shortcode is None or code == shortcode) \
+                    and any(key in node for key in MEDIA_KEYS):
+                return node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+
+def _count(node: Dict, *keys: str) -> Optional[int]:
+    """정수 필드 또는 {"count": n} 형태의 edge 필드 중 처음 발견되는 값"""
+    for key in keys:
+        value = node.get(key)
+        if isinstance(value, dict):
+            value = value.get('count')
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def media_fields(node: Dict) -> Dict:
+    """미디어 노드에서 게시물 필드 추출 (GraphQL shortcode_media / v1 API items 형식 모두 지원)"""
+    owner = node.get('owner') or node.get('user') or {}
+
+    timestamp = node.get('taken_at_timestamp') or node.get('taken_at')
+    post_date = datetime.fromtimestamp(timestamp).isoformat() if isinstance(timestamp, (int, float)) else None
+
+    caption = node.get('caption')
+    if isinstance(caption, dict):
+        caption = caption.get('text')
+    if not caption:
+        edges = (node.get('edge_media_to_caption') or {}).get('edges') or []
+        if edges:
+            caption = (edges[0].get('node') or {}).get('text')
+
+    return {
+        'like_count': _count(node, 'like_count', 'edge_media_preview_like', 'edge_liked_by'),
+        'comment_count': _count(node, 'comment_count', 'edge_media_to_parent_comment', 'edge_media_to_comment'),
+        'post_date': post_date,
+        'caption': caption if isinstance(caption, str) and caption else None,
+        'username': owner.get('username') if isinstance(owner, dict) else None,
+    }
+
+
+def _parse_count(value: Any) -> Optional[int]:
+    """정수 또는 숫자 문자열("1,234")만 개수로 인정 (None, "1.2K" 등은 None)"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        digits = value.strip().replace(',', '')
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def _ld_json_fields(data: Any) -> Dict:
+    """schema.org(ld+json) 게시물 정보에서 필드 추출"""
+    if isinstance(data, list):
+        for item in data:
+            fields = _ld_json_fields(item)
+            if fields:
+                return fields
+        return {}
+    if not isinstance(data, dict) or ('uploadDate' not in data and 'interactionStatistic' not in data):
+        return {}
+    fields = {
+        'post_date': data.get('uploadDate') or data.get('dateCreated'),
+        'caption': data.get('articleBody') or data.get('caption'),
+    }
+    author = data.get('author')
+    if isinstance(author, dict):
+        fields['username'] = (author.get('alternateName') or '').lstrip('@') or None
+    statistics = data.get('interactionStatistic') or []
+    if isinstance(statistics, dict):
+        statistics = [statistics]
+    for stat in statistics if isinstance(statistics, list) else []:
+        if not isinstance(stat, dict):
+            continue
+        interaction = str(stat.get('interactionType', ''))
+        # 형식을 알 수 없는 값은 건너뛰고 다른 블록/정규식 보완에 맡김
+        count = _parse_count(stat.get('userInteractionCount'))
+        if 'LikeAction' in interaction:
+            fields['like_count'] = count
+        elif 'CommentAction' in interaction:
+            fields['comment_count'] = count
+    return {key: value for key, value in fields.items() if value is not None and value != ''}
+
+
+def extract_post_fields(html: str, shortcode: Optional[str] = None) -> Dict:
+    """
+    HTML을 한 번 훑어 게시물 필드 추출
+
+    Args:
+        html: Instagram 페이지 HTML
+        shortcode: 게시물 ID (주어지면 해당 게시물의 노드만 사용)
+
+    Returns:
+        찾은 필드만 담은 딕셔너리 (like_count, comment_count, post_date, caption, username)
+    """
+    fields: Dict = {}
+    for data in iter_embedded_json(html, shortcode):
+        node = find_media_node(data, shortcode)
+        found = media_fields(node) if node is not None else _ld_json_fields(data)
+        for key, value in found.items():
+            if value is not None and fields.get(key) is None:
+                fields[key] = value
+        if len(fields) == 5:
+            break
+    return fields
+
+
+def iter_json_documents(text: str) -> Iterator[Any]:
+    """
+    XHR 응답 본문의 JSON 값을 순서대로 반환
+
+    보안 접두사(for (;;); 등)를 제거하고, 스트리밍 응답처럼 여러 JSON이 이어진 본문도 지원
+    파싱할 수 없는 위치에서 중단
+    """
+    text = RESPONSE_PREFIX.sub('', text, count=1)
+    index, length = 0, len(text)
+    while index < length:
+        while index < length and text[index].isspace():
+            index += 1
+        if index >= length:
+            return
+        try:
+            value, index = _decoder.raw_decode(text, index)
+        except ValueError:
+            return
+        yield value
+
+
+def extract_response_fields(body: str, shortcode: Optional[str] = None) -> Dict:
+    """
+    네트워크 응답 본문에서 게시물 필드 추출
+
+    Args:
+        body: XHR/GraphQL 응답 본문
+        shortcode: 게시물 ID (주어지면 해당 게시물의 노드만 사용)
+
+    Returns:
+        찾은 필드만 담은 딕셔너리 (게시물 노드가 없으면 빈 딕셔너리)
+    """
+    if shortcode and shortcode not in body:
+        return {}
+    fields: Dict = {}
+    for data in iter_json_documents(body):
+        node = find_media_node(data, shortcode)
+        if node is None:
+            continue
+        for key, value in media_fields(node).items():
+            if value is not None and fields.get(key) is None:
+                fields[key] = value
+    return fields
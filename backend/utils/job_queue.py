@@ -0,0 +1,188 @@
+"""
+백그라운드 작업 큐 모듈
+오래 걸리는 작업(Selenium 크롤링 등)을 즉시 작업 ID로 응답하고 워커에서 실행한 뒤,
+클라이언트가 작업 ID로 상태/결과를 조회하는 방식 (HTTP 연결을 작업 시간 동안 붙잡지 않음)
+
+프로세스 내 구현이며 submit/get/stats 인터페이스만 사용하므로
+필요 시 외부 브로커(Redis 등) 기반 구현으로 교체 가능
+"""
+import asyncio
+import itertools
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from utils.logger import safe_log, log_error
+import logging
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 최대치에 도달한 경우"""
+
+
+class Job:
+    """작업 1건의 상태와 결과"""
+
+    def __init__(self, kind: str, priority: int):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.priority = priority
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[Dict] = None
+        self.expires_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        """API 응답 형식"""
+        def _iso(timestamp: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "priority": self.priority,
+            "created_at": _iso(self.created_at),
+            "started_at": _iso(self.started_at),
+            "finished_at": _iso(self.finished_at),
+        }
+        if self.status == JOB_SUCCEEDED:
+            data["result"] = self.result
+        elif self.status == JOB_FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobQueue:
+    """우선순위 + 동시 실행 수 제한 + 결과 보관 기간(TTL)을 가진 프로세스 내 작업 큐"""
+
+    def __init__(self, name: str, workers: int = 2, max_queue: int = 100, result_ttl: float = 600.0):
+        """
+        Args:
+            name: 로그/통계용 이름
+            workers: 동시에 실행할 최대 작업 수
+            max_queue: 대기 중인 최대 작업 수 (초과 시 JobQueueFull)
+            result_ttl: 완료된 작업 결과 보관 시간 (초)
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.result_ttl = result_ttl
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._tasks = []
+        self._jobs: Dict[str, Job] = {}
+        self._runners: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._sequence = itertools.count()
+        self._stats = {"submitted": 0, "succeeded": 0, "failed": 0, "rejected": 0, "expired": 0}
+
+    def start(self):
+        """워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{index}")
+            for index in range(self.workers)
+        ]
+        safe_log(logging.INFO, "Job queue '%s' started with %d worker(s)", self.name, self.workers)
+
+    async def stop(self):
+        """워커 종료 (대기 중인 작업은 실행하지 않음)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, runner: Callable[[], Awaitable[Any]], kind: str = "job", priority: int = 0) -> Job:
+        """
+        작업 등록
+
+        Args:
+            runner: 작업을 실행하는 코루틴 함수 (반환값이 결과로 저장됨)
+            kind: 작업 종류
+            priority: 우선순위 (클수록 먼저 실행, 같으면 등록 순서)
+
+        Raises:
+            JobQueueFull: 대기 중인 작업이 max_queue 이상인 경우
+        """
+        if self._queue is None:
+            self.start()
+        self._prune()
+        if self._queue.qsize() >= self.max_queue:
+            self._stats["rejected"] += 1
+            raise JobQueueFull(f"Job queue '{self.name}' is full ({self.max_queue} pending)")
+
+        job = Job(kind, priority)
+        self._jobs[job.id] = job
+        self._runners[job.id] = runner
+        self._queue.put_nowait((-priority, next(self._sequence), job.id))
+        self._stats["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (없거나 보관 기간이 지났으면 None)"""
+        self._prune()
+        return self._jobs.get(job_id)
+
+    async def _worker(self):
+        """큐에서 우선순위 순으로 작업을 꺼내 실행"""
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            runner = self._runners.pop(job_id, None)
+            if job is None or runner is None:
+                self._queue.task_done()
+                continue
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+            try:
+                job.result = await runner()
+                job.status = JOB_SUCCEEDED
+                self._stats["succeeded"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # HTTPException 등 status_code/detail을 가진 예외는 그대로 전달
+                job.error = {
+                    "status_code": getattr(e, "status_code", 500),
+                    "detail": getattr(e, "detail", None) or "An internal error occurred.",
+                }
+                job.status = JOB_FAILED
+                self._stats["failed"] += 1
+                if not hasattr(e, "status_code"):
+                    log_error(e, f"Job {job.id} ({job.kind}) failed")
+            finally:
+                if job.status in (JOB_SUCCEEDED, JOB_FAILED):
+                    job.finished_at = time.time()
+                    job.expires_at = time.monotonic() + self.result_ttl
+                self._queue.task_done()
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업 제거"""
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self._jobs.items() if job.expires_at is not None and job.expires_at <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._stats["expired"] += len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태 (pending: 대기 중, running: 실행 중, retained: 보관 중인 작업 수)"""
+        running = sum(1 for job in self._jobs.values() if job.status == JOB_RUNNING)
+        stats = dict(self._stats)
+        stats.update({
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "running": running,
+            "retained": len(self._jobs),
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "result_ttl": self.result_ttl,
+        })
+        return stats
@@ -1,9 +1,14 @@
 """
 로깅 유틸리티
 민감한 정보가 로그에 기록되지 않도록 처리
+요청 처리 스레드는 레코드를 큐에 넣기만 하고, 포맷/마스킹/출력은 백그라운드 리스너 스레드에서 수행
 """
+import atexit
 import logging
+import os
+import queue
 import re
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 # 로거 설정
@@ -26,33 +31,59 @@ class SensitiveDataFormatter(logging.Formatter):
         (r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', 'XXXX-XXXX-XXXX-XXXX'),  # 카드번호
         (r'sk-[A-Za-z0-9]+', 'sk-***'),  # API Key
     ]
+    COMPILED_PATTERNS = [(re.compile(pattern), replacement) for pattern, replacement in SENSITIVE_PATTERNS]
     
-    def format(self, record: logging.LogRecord) -> str:
-        """로그 메시지에서 민감 정보 마스킹"""
-        original_msg = super().format(record)
-        
-        # 민감 정보 마스킹
-        masked_msg = original_msg
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            masked_msg = re.sub(pattern, replacement, masked_msg)
-        
-        return masked_msg
+    # 사전 검사: 숫자, '@', 'sk-'가 하나도 없으면 어떤 패턴에도 해당하지 않으므로 마스킹 생략
+    PRECHECK = re.compile(r'[\d@]|sk-')
+    
+    @classmethod
+    def mask(cls, text: str) -> str:
+        """문자열에서 민감 정보 마스킹"""
+        if not cls.PRECHECK.search(text):
+            return text
+        for pattern, replacement in cls.COMPILED_PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """로그 메시지에서 민감 정보 마스킹 (시간/레벨 등 포맷 필드는 검사하지 않음)"""
+        record.message = self.mask(record.message)
+        return super().formatMessage(record)
+    
+    def formatException(self, ei) -> str:
+        """예외 메시지/스택 트레이스에서 민감 정보 마스킹"""
+        return self.mask(super().formatException(ei))
 
 formatter = SensitiveDataFormatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 handler.setFormatter(formatter)
-logger.addHandler(handler)
+
+# 비동기 로깅 (LOG_ASYNC=false면 호출 스레드에서 바로 출력)
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() in ("1", "true", "yes")
+log_listener = None
+if LOG_ASYNC:
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    log_listener.start()
+    # 종료 시 큐에 남은 레코드 출력
+    atexit.register(log_listener.stop)
+else:
+    logger.addHandler(handler)
 
 
 def safe_log(level: int, message: str, *args, **kwargs):
     """
     안전한 로깅 (민감 정보 자동 마스킹)
     
+    f-string 대신 %-형식 인자를 사용하면 해당 레벨이 꺼져 있을 때 문자열을 만들지 않음
+    예: safe_log(logging.DEBUG, "Selector %s failed: %s", name, e)
+    
     Args:
         level: 로그 레벨 (logging.INFO, logging.ERROR 등)
-        message: 로그 메시지
-        *args, **kwargs: 추가 인자
+        message: 로그 메시지 (%-형식)
+        *args, **kwargs: 메시지 인자 및 logging 옵션
     """
     logger.log(level, message, *args, **kwargs)
 
@@ -81,10 +112,7 @@ def sanitize_for_logging(data: Any) -> str:
         정제된 문자열
     """
     if isinstance(data, str):
-        result = data
-        for pattern, replacement in SensitiveDataFormatter.SENSITIVE_PATTERNS:
-            result = re.sub(pattern, replacement, result)
-        return result
+        return SensitiveDataFormatter.mask(data)
     elif isinstance(data, dict):
         # 딕셔너리의 경우 값만 정제
         sanitized = {}
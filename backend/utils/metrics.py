@@ -0,0 +1,182 @@
+"""
+Prometheus 형식 메트릭 모듈
+외부 서비스/라이브러리 없이 프로세스 안에서 카운터와 히스토그램을 누적하고
+GET /metrics 에서 텍스트 노출 형식(text/plain; version=0.0.4)으로 반환
+
+- 카운터/히스토그램: 이벤트가 발생하는 곳에서 직접 기록 (단계별 소요 시간, 추출 방법 등)
+- 게이지/누적 통계: 각 모듈의 stats() 결과를 조회 시점에 변환 (render_metrics의 samples 인자)
+"""
+import bisect
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# PlainTextResponse가 charset=utf-8을 덧붙임
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 초 단위 버킷 (정규식 검사 수 ms ~ OpenAI/브라우저 수십 초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value) -> str:
+    """라벨 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1):
+        key = tuple(str(value) for value in labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        lines.extend(
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values
+        )
+        return lines
+
+
+class Histogram:
+    """라벨별 히스토그램 (누적 버킷 + 합계 + 개수)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 라벨 값 → [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labelvalues):
+        key = tuple(str(label) for label in labelvalues)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(counts), total) for key, (counts, total) in self._series.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        names = self.labelnames + ("le",)
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, key + (_format_value(float(bound)),))} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# 이벤트 시점에 기록하는 메트릭
+REQUEST_SECONDS = Histogram(
+    "checking_ai_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route", "status"),
+)
+STAGE_SECONDS = Histogram(
+    "checking_ai_stage_duration_seconds",
+    "Latency of internal processing stages (extract, pii, openai, page_load, ...)",
+    ("stage",),
+)
+EXTRACTION_METHODS = Counter(
+    "checking_ai_instagram_extraction_total",
+    "Instagram fields extracted per crawl by extraction method (method=none when not found)",
+    ("field", "method"),
+)
+
+
+class Sample:
+    """조회 시점에 만든 메트릭 값 묶음 (stats() 결과 변환용)"""
+
+    def __init__(self, name: str, kind: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.kind = kind  # counter / gauge
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: List[Tuple[LabelValues, float]] = []
+
+    def add(self, value: Optional[float], *labelvalues) -> "Sample":
+        if value is not None:
+            self.values.append((tuple(str(label) for label in labelvalues), float(value)))
+        return self
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self.values
+        )
+        return lines
+
+
+def stats_samples(
+    prefix: str,
+    stats: Dict,
+    counters: Iterable[str] = (),
+    gauges: Iterable[str] = (),
+    documentation: str = "",
+) -> List[Sample]:
+    """
+    stats() 딕셔너리를 메트릭으로 변환
+
+    counters의 키는 {prefix}_{key}_total, gauges의 키는 {prefix}_{key} 이름으로 노출
+    """
+    samples = [
+        Sample(f"{prefix}_{key}_total", "counter", f"{documentation} {key}".strip()).add(stats.get(key))
+        for key in counters
+    ]
+    samples.extend(
+        Sample(f"{prefix}_{key}", "gauge", f"{documentation} {key}".strip()).add(stats.get(key))
+        for key in gauges
+    )
+    return samples
+
+
+def render_metrics(samples: Iterable[Sample] = ()) -> str:
+    """등록된 카운터/히스토그램과 조회 시점 샘플을 텍스트 노출 형식으로 변환"""
+    lines: List[str] = []
+    for metric in (REQUEST_SECONDS, STAGE_SECONDS, EXTRACTION_METHODS, *samples):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
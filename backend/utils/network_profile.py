@@ -0,0 +1,170 @@
+"""
+브라우저 네트워크 프로필 모듈
+게시물 수치/텍스트만 읽으므로 이미지, 동영상, 폰트, 추적 스크립트를 내려받지 않는 경량 크롤링 설정과
+크롤링 1회당 전송량 측정과 게시물 JSON 응답 수집 (Chrome DevTools Protocol + performance 로그)
+"""
+import base64
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from utils.logger import safe_log
+import logging
+
+
+# CDP Network.setBlockedURLs 패턴 (와일드카드 *)
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    # 이미지
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.heic', '*.svg', '*.ico',
+    # 동영상/오디오
+    '*.mp4', '*.m4v', '*.m4a', '*.webm', '*.mpd', '*.m3u8',
+    # 폰트
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    # 미디어 CDN (확장자 없는 이미지/동영상 URL)
+    '*://*.cdninstagram.com/*', '*://*.fbcdn.net/*',
+    # 서드파티 추적/광고
+    '*://connect.facebook.net/*', '*://*.doubleclick.net/*', '*://*.google-analytics.com/*',
+    '*://*.googletagmanager.com/*', '*://graph.instagram.com/logging*',
+]
+
+
+def apply_lean_options(options):
+    """
+    Chrome 옵션에 경량 크롤링 설정 적용
+
+    - pageLoadStrategy eager: DOMContentLoaded 시점에 driver.get 반환 (이미지/하위 리소스 대기 안 함)
+    - 이미지 로딩 비활성화
+    - performance 로그 활성화 (전송량 측정용)
+    """
+    options.page_load_strategy = 'eager'
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    enable_performance_log(options)
+
+
+def enable_performance_log(options):
+    """performance 로그(CDP 네트워크 이벤트) 활성화 (전송량 측정, 응답 수집용)"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def enable_network(driver):
+    """CDP Network 도메인 활성화 (Network.getResponseBody로 응답 본문을 읽기 위해 필요)"""
+    driver.execute_cdp_cmd('Network.enable', {})
+
+
+def block_requests(driver, patterns: Iterable[str]):
+    """CDP로 패턴에 해당하는 요청 차단 (드라이버 생성 직후 1회 호출)"""
+    patterns = list(patterns)
+    enable_network(driver)
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    safe_log(logging.INFO, "Blocking %d URL patterns in browser", len(patterns))
+
+
+def drain_performance_log(driver) -> List[Dict]:
+    """
+    쌓여 있는 performance 로그를 읽고 비움 (CDP 이벤트 메시지 목록)
+
+    로그가 비활성화된 드라이버에서는 빈 목록 반환
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        safe_log(logging.DEBUG, "Performance log unavailable: %s", e)
+        return []
+    messages = []
+    for entry in entries:
+        try:
+            messages.append(json.loads(entry['message'])['message'])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return messages
+
+
+def summarize_transfer(messages: Iterable[Dict]) -> Dict[str, int]:
+    """
+    CDP 네트워크 이벤트에서 전송량 집계
+
+    Returns:
+        bytes: 네트워크로 받은 바이트 (압축 상태 기준), requests: 완료된 요청 수, blocked: 차단된 요청 수
+    """
+    summary = {'bytes': 0, 'requests': 0, 'blocked': 0}
+    for message in messages:
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.loadingFinished':
+            summary['bytes'] += int(params.get('encodedDataLength') or 0)
+            summary['requests'] += 1
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            summary['blocked'] += 1
+    return summary
+
+
+class NetworkCapture:
+    """
+    크롤링 1회 동안 performance 로그를 누적하며 대상 JSON 응답 본문을 꺼내는 도구
+
+    poll()을 반복 호출해 로딩이 끝난 응답만 읽으므로 응답이 도착하는 즉시 처리 가능
+    읽은 이벤트는 모두 보관해 크롤링이 끝나면 transfer()로 전송량 집계
+    """
+
+    # JSON 응답으로 간주할 MIME 타입 (GraphQL 응답은 text/javascript인 경우가 있음)
+    JSON_MIME_TYPES = ('json', 'javascript')
+
+    def __init__(self, driver, url_patterns: Sequence[str]):
+        """
+        Args:
+            driver: performance 로그와 Network 도메인이 활성화된 WebDriver
+            url_patterns: 본문을 읽을 응답 URL에 포함된 문자열 (예: /graphql, /api/v1/)
+        """
+        self.driver = driver
+        self.url_patterns = tuple(url_patterns)
+        self.messages: List[Dict] = []
+        self.responses = 0  # 본문을 읽은 응답 수
+        self._candidates: Dict[str, str] = {}  # requestId → URL
+
+    def reset(self):
+        """이전 임대에서 남은 이벤트 제거 (페이지 로드 직전에 호출)"""
+        drain_performance_log(self.driver)
+        self.messages = []
+        self._candidates.clear()
+
+    def poll(self) -> List[Tuple[str, str]]:
+        """새 이벤트를 읽고 로딩이 끝난 대상 응답의 (URL, 본문) 목록 반환"""
+        bodies = []
+        for message in drain_performance_log(self.driver):
+            self.messages.append(message)
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                mime_type = response.get('mimeType', '')
+                if any(pattern in url for pattern in self.url_patterns) \
+                        and any(kind in mime_type for kind in self.JSON_MIME_TYPES):
+                    self._candidates[params.get('requestId')] = url
+            elif method == 'Network.loadingFinished':
+                url = self._candidates.pop(params.get('requestId'), None)
+                if url is not None:
+                    body = self._response_body(params.get('requestId'))
+                    if body:
+                        bodies.append((url, body))
+        return bodies
+
+    def _response_body(self, request_id: str) -> Optional[str]:
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            # 페이지 이동 등으로 본문이 이미 해제된 경우
+            safe_log(logging.DEBUG, "Response body unavailable: %s", e)
+            return None
+        self.responses += 1
+        body = result.get('body') or ''
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        return body
+
+    def transfer(self) -> Dict[str, int]:
+        """남은 이벤트까지 읽어 크롤링 전체 전송량 집계 (summarize_transfer 형식, 응답 본문은 읽지 않음)"""
+        self.messages.extend(drain_performance_log(self.driver))
+        return summarize_transfer(self.messages)
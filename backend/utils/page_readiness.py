@@ -0,0 +1,78 @@
+"""
+페이지 준비 상태 감지 모듈
+고정 대기(time.sleep) 대신 필요한 데이터가 나타나는 즉시 반환하는 조건 기반 대기
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+from utils.logger import safe_log
+import logging
+
+
+# 게시물 데이터가 준비되었는지 브라우저 안에서 한 번에 확인하는 스크립트
+# - 임베디드 JSON(script 태그)에 게시물 필드가 있으면 'embedded_json'
+# - 게시물 DOM(좋아요/댓글 버튼, 헤더 링크)이 렌더링되었으면 'dom'
+POST_READY_SCRIPT = r"""
+var markers = /"(like_count|comment_count|taken_at_timestamp|edge_media_preview_like|edge_media_to_comment)"\s*:/;
+var scripts = document.getElementsByTagName('script');
+for (var i = 0; i < scripts.length; i++) {
+    if (markers.test(scripts[i].textContent || '')) {
+        return 'embedded_json';
+    }
+}
+if (document.querySelector('article section button, article header a, a[href*="/liked_by/"]')) {
+    return 'dom';
+}
+return null;
+"""
+
+# 필드별 DOM 대기 최대 시간 (초)
+DEFAULT_FIELD_DEADLINES: Dict[str, float] = {
+    'like_count': 3.0,
+    'comment_count': 2.0,
+    'username': 2.0,
+    'caption': 2.0,
+}
+
+
+def wait_until(condition: Callable[[], Any], timeout: float, poll_interval: float = 0.1) -> Any:
+    """
+    조건이 참 값을 반환할 때까지 폴링
+
+    조건 함수에서 발생한 예외는 '아직 준비되지 않음'으로 간주
+
+    Returns:
+        조건 함수의 첫 참 값, 시간 초과 시 None
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = condition()
+            if result:
+                return result
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(poll_interval, remaining))
+
+
+def wait_for_post_ready(driver, timeout: float = 10.0, early: Optional[Callable[[], Optional[str]]] = None) -> Optional[str]:
+    """
+    게시물 데이터가 임베디드 JSON 또는 DOM으로 나타날 때까지 대기
+
+    Args:
+        early: 폴링마다 먼저 확인할 조건 (예: 네트워크 응답 수집), 참 값을 반환하면 즉시 종료
+
+    Returns:
+        early의 반환값 / 'embedded_json' / 'dom' / 시간 초과 시 None
+    """
+    started = time.monotonic()
+
+    def _ready():
+        return (early() if early is not None else None) or driver.execute_script(POST_READY_SCRIPT)
+
+    ready_by = wait_until(_ready, timeout)
+    safe_log(logging.INFO, "Post page ready by %s in %.2fs", ready_by or "timeout", time.monotonic() - started)
+    return ready_by
+
@@ -3,96 +3,95 @@ PII (개인정보) 감지 모듈
 정규식을 사용한 1차 분석 (Rule-based)
 """
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterable, Tuple
+from utils.timing import span
 
 
 class PIIDetector:
     """개인정보 감지 클래스"""
     
-    def __init__(self):
-        # 한국 휴대폰 번호 패턴 (010-1234-5678, 01012345678 등)
-        self.phone_patterns = [
-            r'010-?\d{4}-?\d{4}',  # 010-1234-5678 또는 01012345678
-            r'011-?\d{3,4}-?\d{4}',
-            r'016-?\d{3,4}-?\d{4}',
-            r'017-?\d{3,4}-?\d{4}',
-            r'018-?\d{3,4}-?\d{4}',
-            r'019-?\d{3,4}-?\d{4}',
-        ]
-        
-        # 주민등록번호 패턴 (123456-1234567 형식)
-        self.ssn_pattern = r'\d{6}-?\d{7}'
-        
-        # 이메일 패턴
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
-        # 신용카드 번호 패턴 (간단한 패턴)
-        self.card_pattern = r'\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}'
-        
-        # 계좌번호 패턴 (은행별로 다양하지만 기본 패턴)
-        self.account_patterns = [
-            r'\d{3,4}-\d{2,3}-\d{6,12}',  # 일반적인 계좌번호 형식
-        ]
+    # 한국 휴대폰 번호 패턴 (010-1234-5678, 01012345678 등)
+    PHONE_PATTERN = r'010-?\d{4}-?\d{4}|01[16789]-?\d{3,4}-?\d{4}'
+    
+    # 주민등록번호 패턴 (123456-1234567 형식)
+    SSN_PATTERN = r'\d{6}-?\d{7}'
+    
+    # 이메일 패턴
+    EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    
+    # 신용카드 번호 패턴 (간단한 패턴)
+    CARD_PATTERN = r'\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}'
+    
+    # 계좌번호 패턴 (은행별로 다양하지만 기본 패턴)
+    ACCOUNT_PATTERNS = [
+        r'\d{3,4}-\d{2,3}-\d{6,12}',  # 일반적인 계좌번호 형식
+    ]
+    
+    # 유형별 심각도/설명
+    PII_TYPES = {
+        "phone_number": ("high", "한국 휴대폰 번호가 감지되었습니다"),
+        "ssn": ("high", "주민등록번호 형식이 감지되었습니다"),
+        "email": ("medium", "이메일 주소가 감지되었습니다"),
+        "card_number": ("high", "신용카드 번호 형식이 감지되었습니다"),
+    }
+    
+    # 모든 패턴을 하나로 합친 단일 스캐너 (텍스트를 한 번만 훑음)
+    # - 맨 앞의 문자 집합 lookahead 덕분에 한글 등 후보가 될 수 없는 문자는 빠르게 건너뜀
+    # - 같은 위치에서 여러 유형이 겹치면 앞쪽 그룹이 우선
+    #   (이메일 > 카드번호 > 주민등록번호 > 휴대폰 번호: 숫자로 시작하는 이메일, 16자리 카드번호를
+    #    주민등록번호/휴대폰 번호로 중복 보고하지 않도록)
+    SCANNER = re.compile(
+        r'(?=[A-Za-z0-9._%+-])(?:'
+        rf'(?P<email>{EMAIL_PATTERN})'
+        r'|(?=\d)(?:'
+        rf'(?P<card_number>{CARD_PATTERN})'
+        rf'|(?P<ssn>{SSN_PATTERN})'
+        rf'|(?P<phone_number>{PHONE_PATTERN})'
+        r'))'
+    )
+    
+    _phone_re = re.compile(PHONE_PATTERN)
+    _ssn_re = re.compile(SSN_PATTERN)
+    _email_re = re.compile(EMAIL_PATTERN)
+    _card_re = re.compile(CARD_PATTERN)
+    
+    def _finding(self, pii_type: str, match: re.Match) -> Dict[str, any]:
+        severity, description = self.PII_TYPES[pii_type]
+        return {
+            "type": pii_type,
+            "value": match.group(),
+            "severity": severity,
+            "position": match.span(),
+            "description": description
+        }
+    
+    def _find(self, pattern: re.Pattern, pii_type: str, text: str) -> List[Dict[str, any]]:
+        return [self._finding(pii_type, match) for match in pattern.finditer(text)]
     
     def detect_phone_numbers(self, text: str) -> List[Dict[str, any]]:
         """휴대폰 번호 감지"""
-        findings = []
-        for pattern in self.phone_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                findings.append({
-                    "type": "phone_number",
-                    "value": match.group(),
-                    "severity": "high",
-                    "position": match.span(),
-                    "description": "한국 휴대폰 번호가 감지되었습니다"
-                })
-        return findings
+        return self._find(self._phone_re, "phone_number", text)
     
     def detect_ssn(self, text: str) -> List[Dict[str, any]]:
         """주민등록번호 감지"""
-        findings = []
-        matches = re.finditer(self.ssn_pattern, text)
-        for match in matches:
-            ssn = match.group().replace('-', '')
-            # 간단한 유효성 검사 (주민번호 체크섬은 복잡하므로 기본 패턴만 확인)
-            if len(ssn) == 13:
-                findings.append({
-                    "type": "ssn",
-                    "value": match.group(),
-                    "severity": "high",
-                    "position": match.span(),
-                    "description": "주민등록번호 형식이 감지되었습니다"
-                })
-        return findings
+        return self._find(self._ssn_re, "ssn", text)
     
     def detect_emails(self, text: str) -> List[Dict[str, any]]:
         """이메일 주소 감지"""
-        findings = []
-        matches = re.finditer(self.email_pattern, text)
-        for match in matches:
-            findings.append({
-                "type": "email",
-                "value": match.group(),
-                "severity": "medium",
-                "position": match.span(),
-                "description": "이메일 주소가 감지되었습니다"
-            })
-        return findings
+        return self._find(self._email_re, "email", text)
     
     def detect_card_numbers(self, text: str) -> List[Dict[str, any]]:
         """신용카드 번호 감지"""
-        findings = []
-        matches = re.finditer(self.card_pattern, text)
-        for match in matches:
-            findings.append({
-                "type": "card_number",
-                "value": match.group(),
-                "severity": "high",
-                "position": match.span(),
-                "description": "신용카드 번호 형식이 감지되었습니다"
-            })
-        return findings
+        return self._find(self._card_re, "card_number", text)
+    
+    def scan(self, text: str) -> List[Dict[str, any]]:
+        """
+        단일 패스 PII 스캔
+        
+        Returns:
+            위치 순으로 정렬된 감지 결과 (서로 겹치지 않음)
+        """
+        return [self._finding(match.lastgroup, match) for match in self.SCANNER.finditer(text)]
     
     def detect_all(self, text: str) -> Dict[str, any]:
         """
@@ -109,23 +108,43 @@ class PIIDetector:
                 }
             }
         """
-        all_findings = []
-        
-        # 각 타입별로 감지
-        all_findings.extend(self.detect_phone_numbers(text))
-        all_findings.extend(self.detect_ssn(text))
-        all_findings.extend(self.detect_emails(text))
-        all_findings.extend(self.detect_card_numbers(text))
+        # 한 번의 선형 스캔으로 모든 유형 감지 (스캐너가 겹치지 않는 결과만 반환하므로 중복 제거 불필요)
+        with span("pii"):
+            return self._build_result(self.scan(text))
+    
+    def detect_pages(self, pages: Iterable[Tuple[int, str]]) -> Dict[str, any]:
+        """
+        페이지 단위로 PII 검사 (text_extractor.iter_text_pages와 함께 사용)
         
-        # 중복 제거 (같은 위치의 같은 값)
-        unique_findings = []
-        seen = set()
-        for finding in all_findings:
-            key = (finding["type"], finding["value"], finding["position"])
-            if key not in seen:
-                seen.add(key)
-                unique_findings.append(finding)
+        페이지를 하나씩 소비하므로 문서 전체를 메모리에 올리지 않아도 됨
+        각 감지 결과에 page 번호를 추가하며, position은 extract_text_from_memory가
+        반환하는 전체 텍스트(페이지를 줄바꿈으로 연결 후 strip) 기준 위치로 유지
         
+        Args:
+            pages: (page_number, text) 순회 가능 객체
+            
+        Returns:
+            detect_all과 같은 형식의 결과
+        """
+        findings = []
+        offset = 0  # 줄바꿈으로 연결한 전체 텍스트에서 현재 페이지의 시작 위치
+        leading = None  # strip()으로 제거될 문서 앞쪽 공백 길이
+        for page_number, text in pages:
+            if leading is None:
+                stripped = text.lstrip()
+                if stripped:
+                    leading = offset + len(text) - len(stripped)
+            with span("pii"):
+                page_findings = self.scan(text)
+            for finding in page_findings:
+                start, end = finding["position"]
+                finding["position"] = (offset + start - leading, offset + end - leading)
+                finding["page"] = page_number
+                findings.append(finding)
+            offset += len(text) + 1
+        return self._build_result(findings)
+    
+    def _build_result(self, unique_findings: List[Dict[str, any]]) -> Dict[str, any]:
         # 심각도별 카운트
         severity_counts = {"high": 0, "medium": 0, "low": 0}
         for finding in unique_findings:
@@ -0,0 +1,192 @@
+"""
+인스타그램 게시물 지표 캐시 모듈
+게시물 ID(shortcode) 기준으로 크롤링 결과를 보관해 같은 게시물의 반복 크롤링을 줄임
+- 필드별 TTL: 자주 바뀌는 값(좋아요/댓글 수)은 짧게, 거의 바뀌지 않는 값(작성자/캡션/게시일)은 길게
+- stale-while-revalidate: 만료 직후 일정 시간 동안은 이전 값을 즉시 반환하고 백그라운드에서 갱신
+- single-flight: 같은 게시물에 대한 동시 요청은 하나의 크롤링 결과를 공유
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from utils.logger import safe_log
+
+# 필드별 기본 TTL (초)
+DEFAULT_FIELD_TTLS = {
+    'like_count': 300,
+    'comment_count': 300,
+    'username': 86400,
+    'caption': 86400,
+    'post_date': 86400,
+}
+
+# 캐시 조회 결과 상태
+CACHE_HIT = "hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+CACHE_COALESCED = "coalesced"
+
+
+class _Entry:
+    """게시물 1건의 캐시 항목 (필드별 만료 시각)"""
+
+    __slots__ = ("data", "field_expires", "expires_at")
+
+    def __init__(self, data: Dict, field_expires: Dict[str, float]):
+        self.data = data
+        self.field_expires = field_expires
+        # 항목 전체의 신선도는 가장 먼저 만료되는 필드 기준
+        self.expires_at = min(field_expires.values()) if field_expires else 0.0
+
+
+class PostMetricsCache:
+    """
+    shortcode 기준 게시물 지표 캐시 (이벤트 루프 안에서만 사용, 별도 잠금 없음)
+    """
+
+    def __init__(self, maxsize: int = 1024, field_ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 300.0, stale_ttl: float = 3600.0):
+        """
+        Args:
+            maxsize: 최대 게시물 수 (0이면 캐시 비활성화, single-flight는 유지)
+            field_ttls: 필드별 TTL (초)
+            default_ttl: 값을 얻지 못한 필드가 있을 때 다시 크롤링하기까지의 시간 (초)
+            stale_ttl: 만료 후 이전 값을 반환하며 백그라운드 갱신할 수 있는 시간 (초)
+        """
+        self.maxsize = max(0, maxsize)
+        self.field_ttls = dict(DEFAULT_FIELD_TTLS if field_ttls is None else field_ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0,
+            "refreshes": 0, "refresh_failures": 0, "evictions": 0,
+        }
+
+    async def get_or_fetch(self, post_id: str, fetch: Callable[[], Awaitable[Dict]]) -> Tuple[Dict, str]:
+        """
+        캐시된 게시물 정보를 반환하거나 fetch로 크롤링
+
+        Args:
+            post_id: 게시물 ID (shortcode)
+            fetch: 게시물 정보를 크롤링하는 코루틴 함수
+
+        Returns:
+            (게시물 정보, 캐시 상태: hit/stale/miss/coalesced)
+
+        Raises:
+            fetch에서 발생한 예외 (실패 결과는 캐시하지 않음)
+        """
+        now = time.monotonic()
+        entry = self._entries.get(post_id)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end(post_id)
+                self._stats["hits"] += 1
+                return dict(entry.data), CACHE_HIT
+            if entry.expires_at + self.stale_ttl > now:
+                self._entries.move_to_end(post_id)
+                self._stats["stale_hits"] += 1
+                self._refresh_in_background(post_id, fetch)
+                return dict(entry.data), CACHE_STALE
+
+        inflight = self._inflight.get(post_id)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            return dict(await asyncio.shield(inflight)), CACHE_COALESCED
+
+        self._stats["misses"] += 1
+        # 요청이 취소되어도 크롤링은 계속되어 다른 대기 요청과 캐시에 결과가 반영되도록 shield
+        return dict(await asyncio.shield(self._fetch(post_id, fetch))), CACHE_MISS
+
+    def _fetch(self, post_id: str, fetch: Callable[[], Awaitable[Dict]]) -> asyncio.Future:
+        """게시물당 하나의 크롤링만 실행 (진행 중이면 같은 Future 반환)"""
+        inflight = self._inflight.get(post_id)
+        if inflight is not None:
+            return inflight
+
+        async def _run() -> Dict:
+            try:
+                data = await fetch()
+                return self._store(post_id, data)
+            finally:
+                self._inflight.pop(post_id, None)
+
+        task = asyncio.ensure_future(_run())
+        # 기다리는 요청이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고가 남지 않도록 확인
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[post_id] = task
+        return task
+
+    def _refresh_in_background(self, post_id: str, fetch: Callable[[], Awaitable[Dict]]):
+        """만료된 항목을 백그라운드에서 갱신 (이미 갱신 중이면 무시)"""
+        if post_id in self._inflight:
+            return
+        self._stats["refreshes"] += 1
+        task = self._fetch(post_id, fetch)
+
+        def _done(t: asyncio.Future):
+            self._refreshing.discard(t)
+            if t.cancelled():
+                return
+            error = t.exception()
+            if error is not None:
+                self._stats["refresh_failures"] += 1
+                safe_log(logging.WARNING, "Background refresh failed for post %s: %s", post_id, error)
+
+        self._refreshing.add(task)
+        task.add_done_callback(_done)
+
+    def _store(self, post_id: str, data: Dict) -> Dict:
+        """
+        크롤링 결과 저장
+
+        이번 크롤링에서 값을 얻지 못한 필드는 이전 값이 아직 유효하면(필드 TTL 이내) 유지
+        """
+        now = time.monotonic()
+        previous = self._entries.get(post_id)
+        merged = dict(data)
+        field_expires = {}
+        for field, ttl in self.field_ttls.items():
+            if merged.get(field) is not None:
+                field_expires[field] = now + ttl
+            elif previous is not None and previous.field_expires.get(field, 0.0) > now:
+                merged[field] = previous.data.get(field)
+                field_expires[field] = previous.field_expires[field]
+        if len(field_expires) < len(self.field_ttls):
+            # 추출하지 못한 필드가 있으면 default_ttl 후 다시 크롤링 (그 전까지는 반복 크롤링 방지)
+            field_expires["_missing"] = now + self.default_ttl
+
+        if self.maxsize:
+            self._entries[post_id] = _Entry(merged, field_expires)
+            self._entries.move_to_end(post_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return merged
+
+    def invalidate(self, post_id: str):
+        """게시물 항목 제거"""
+        self._entries.pop(post_id, None)
+
+    def clear(self):
+        """모든 항목 제거"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit_rate: 크롤링 없이 응답한 비율 - hit/stale/coalesced 포함)"""
+        stats = dict(self._stats)
+        served = stats["hits"] + stats["stale_hits"] + stats["coalesced"]
+        lookups = served + stats["misses"]
+        stats["hit_rate"] = round(served / lookups, 4) if lookups else 0.0
+        stats.update({
+            "size": len(self._entries),
+            "inflight": len(self._inflight),
+            "maxsize": self.maxsize,
+            "stale_ttl": self.stale_ttl,
+            "field_ttls": dict(self.field_ttls),
+        })
+        return stats
@@ -0,0 +1,84 @@
+"""
+분석 결과 캐시 모듈
+크기 제한(LRU) + 만료 시간(TTL)을 가진 인메모리 캐시
+문서 원문이 아닌 분석 결과만 저장하며, 키는 텍스트의 해시값 (Zero Storage Policy)
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """LRU + TTL 인메모리 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            ttl: 항목 유지 시간 (초)
+        """
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """캐시 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        if self.maxsize == 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit_rate: 전체 조회 중 적중 비율)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._data)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats.update({"maxsize": self.maxsize, "ttl": self.ttl})
+        return stats
+
+
+def document_cache_key(text: str, version: str) -> str:
+    """
+    추출된 텍스트 + 분석 버전(모델/프롬프트)으로 캐시 키 생성
+
+    원문 대신 SHA-256 해시만 키로 사용하므로 캐시에 문서 내용이 남지 않음
+    """
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
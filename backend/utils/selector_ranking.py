@@ -0,0 +1,119 @@
+"""
+셀렉터 순서 학습 모듈
+필드별 후보 셀렉터(XPath, 텍스트 패턴)의 최근 성공률과 비용을 기록해
+현재 페이지 구조에서 잘 맞는 셀렉터를 먼저 시도하도록 순서를 정함
+
+- 성공률: 지수 가중 이동 평균 (더 이상 맞지 않는 셀렉터는 몇 번의 실패로 뒤로 밀림)
+- 비용: 셀렉터 1회 평가 시간(ms)의 지수 가중 이동 평균
+- 순서: 비용 / 성공률 오름차순 (첫 성공에서 멈추는 순차 탐색의 기대 비용을 최소화)
+  시도한 적 없는 셀렉터는 사전 성공률(prior)로 계산하므로 기존 셀렉터가 실패하기 시작하면 다시 시도됨
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 성공률이 0이어도 순서 계산이 가능하도록 하는 하한
+MIN_SUCCESS_RATE = 0.01
+# 비용 측정 오차(0ms 등)로 순서가 흔들리지 않도록 하는 하한
+MIN_COST_MS = 0.1
+
+
+class _SelectorStat:
+    """셀렉터 1개의 누적 기록"""
+
+    __slots__ = ("attempts", "successes", "success_rate", "cost_ms", "last_success")
+
+    def __init__(self, prior: float):
+        self.attempts = 0
+        self.successes = 0
+        self.success_rate = prior
+        self.cost_ms: Optional[float] = None
+        self.last_success: Optional[float] = None
+
+
+class SelectorRanker:
+    """그룹(필드)별 셀렉터 성공률/비용 기록 및 시도 순서 결정"""
+
+    def __init__(self, decay: float = 0.3, prior: float = 0.5):
+        """
+        Args:
+            decay: 최근 결과의 가중치 (0~1, 클수록 페이지 구조 변화에 빨리 반응)
+            prior: 시도한 적 없는 셀렉터의 성공률
+        """
+        self.decay = min(max(decay, 0.01), 1.0)
+        self.prior = prior
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, _SelectorStat]] = {}
+
+    def record(self, group: str, name: str, matched: bool, cost_ms: Optional[float] = None):
+        """셀렉터 1회 평가 결과 기록"""
+        with self._lock:
+            stat = self._groups.setdefault(group, {}).get(name)
+            if stat is None:
+                stat = self._groups[group][name] = _SelectorStat(self.prior)
+            stat.attempts += 1
+            stat.success_rate += self.decay * ((1.0 if matched else 0.0) - stat.success_rate)
+            if matched:
+                stat.successes += 1
+                stat.last_success = time.time()
+            if cost_ms is not None:
+                stat.cost_ms = cost_ms if stat.cost_ms is None else stat.cost_ms + self.decay * (cost_ms - stat.cost_ms)
+
+    def order(self, group: str, candidates: Sequence[T], name_index: int = 1) -> List[T]:
+        """
+        기대 비용이 낮은 순으로 후보 정렬 (기록이 같으면 원래 순서 유지)
+
+        Args:
+            group: 그룹 이름 (필드)
+            candidates: 후보 튜플 목록 (예: [(XPath, 방법 이름), ...])
+            name_index: 후보 튜플에서 셀렉터 이름의 위치
+        """
+        with self._lock:
+            stats = dict(self._groups.get(group, {}))
+        measured = [stat.cost_ms for stat in stats.values() if stat.cost_ms is not None]
+        # 비용을 모르는 셀렉터는 같은 그룹의 평균 비용으로 가정
+        default_cost = sum(measured) / len(measured) if measured else 1.0
+
+        def _expected_cost(item: Tuple[int, T]) -> Tuple[float, int]:
+            index, candidate = item
+            stat = stats.get(candidate[name_index])
+            if stat is None:
+                return max(default_cost, MIN_COST_MS) / self.prior, index
+            cost = default_cost if stat.cost_ms is None else stat.cost_ms
+            return max(cost, MIN_COST_MS) / max(stat.success_rate, MIN_SUCCESS_RATE), index
+
+        return [candidate for _, candidate in sorted(enumerate(candidates), key=_expected_cost)]
+
+    def stats(self) -> Dict[str, List[Dict]]:
+        """그룹별 셀렉터 기록 (현재 학습된 순서대로)"""
+        with self._lock:
+            groups = {
+                group: [(name, stat.attempts, stat.successes, stat.success_rate, stat.cost_ms, stat.last_success)
+                        for name, stat in stats.items()]
+                for group, stats in self._groups.items()
+            }
+        result = {}
+        for group, rows in sorted(groups.items()):
+            ranked = self.order(group, rows, name_index=0)
+            result[group] = [
+                {
+                    "name": name,
+                    "attempts": attempts,
+                    "successes": successes,
+                    "success_rate": round(success_rate, 4),
+                    "cost_ms": round(cost_ms, 3) if cost_ms is not None else None,
+                    "last_success": last_success,
+                }
+                for name, attempts, successes, success_rate, cost_ms, last_success in ranked
+            ]
+        return result
+
+    def reset(self, group: Optional[str] = None):
+        """학습 기록 초기화 (group 지정 시 해당 그룹만)"""
+        with self._lock:
+            if group is None:
+                self._groups.clear()
+            else:
+                self._groups.pop(group, None)
@@ -3,67 +3,86 @@
 메모리 상의 파일 객체에서 텍스트를 추출 (Zero Storage Policy)
 """
 import io
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 from PyPDF2 import PdfReader
 from docx import Document
+from utils.timing import span
 
 
-def extract_text_from_memory(file_content: bytes, content_type: str) -> str:
+class TextPage(NamedTuple):
+    """페이지 단위 텍스트 조각 (page_number는 1부터 시작)"""
+    page_number: int
+    text: str
+
+
+def iter_text_pages(file_content: bytes, content_type: str) -> Iterator[TextPage]:
     """
-    메모리 상의 파일 바이트에서 텍스트를 추출
-    
+    메모리 상의 파일 바이트에서 페이지 단위로 텍스트를 추출하는 제너레이터
+
+    PDF는 페이지마다 하나씩, TXT/DOCX는 전체를 1페이지로 반환
+    (소비하는 쪽이 문서 전체가 아니라 한 페이지 분량의 메모리만 사용하도록)
+
     Args:
         file_content: 파일의 바이트 데이터
         content_type: 파일의 MIME 타입
-        
-    Returns:
-        추출된 텍스트 문자열
-        
+
+    Yields:
+        TextPage(page_number, text)
+
     Raises:
         ValueError: 지원하지 않는 파일 타입이거나 추출 실패
     """
     try:
         if content_type == "text/plain":
-            # TXT 파일: UTF-8로 디코딩
-            text = file_content.decode('utf-8')
-            
+            # TXT 파일: UTF-8로 디코딩 (실패 시 한글 인코딩 cp949)
+            with span("extract"):
+                try:
+                    text = file_content.decode('utf-8')
+                except UnicodeDecodeError:
+                    try:
+                        text = file_content.decode('cp949')
+                    except UnicodeDecodeError:
+                        raise ValueError("Failed to decode text file. Unsupported encoding.")
+            yield TextPage(1, text)
+
         elif content_type == "application/pdf":
-            # PDF 파일: PyPDF2로 추출
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PdfReader(pdf_file)
-            text_parts = []
-            
-            for page in pdf_reader.pages:
-                text_parts.append(page.extract_text())
-            
-            text = "\n".join(text_parts)
-            
+            # PDF 파일: PyPDF2로 페이지별 추출
+            # 페이지를 소비하는 쪽(PII 검사) 시간은 제외하고 추출 시간만 측정
+            with span("extract"):
+                pdf_reader = PdfReader(io.BytesIO(file_content))
+            for index, page in enumerate(pdf_reader.pages, start=1):
+                with span("extract"):
+                    text = page.extract_text()
+                yield TextPage(index, text)
+
         elif content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
             # DOCX 파일: python-docx로 추출
-            docx_file = io.BytesIO(file_content)
-            doc = Document(docx_file)
-            text_parts = []
-            
-            for paragraph in doc.paragraphs:
-                text_parts.append(paragraph.text)
-            
-            text = "\n".join(text_parts)
-            
+            with span("extract"):
+                doc = Document(io.BytesIO(file_content))
+                text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+            yield TextPage(1, text)
+
         else:
             raise ValueError(f"Unsupported content type: {content_type}")
-        
-        return text.strip()
-        
-    except UnicodeDecodeError:
-        # UTF-8 디코딩 실패 시 다른 인코딩 시도
-        try:
-            if content_type == "text/plain":
-                text = file_content.decode('cp949')  # 한글 인코딩
-                return text.strip()
-        except:
-            pass
-        raise ValueError("Failed to decode text file. Unsupported encoding.")
-    
+
+    except ValueError:
+        raise
     except Exception as e:
         raise ValueError(f"Failed to extract text: {str(e)}")
 
+
+def extract_text_from_memory(file_content: bytes, content_type: str) -> str:
+    """
+    메모리 상의 파일 바이트에서 텍스트를 추출
+
+    Args:
+        file_content: 파일의 바이트 데이터
+        content_type: 파일의 MIME 타입
+
+    Returns:
+        추출된 텍스트 문자열 (페이지를 줄바꿈으로 연결)
+
+    Raises:
+        ValueError: 지원하지 않는 파일 타입이거나 추출 실패
+    """
+    return "\n".join(page.text for page in iter_text_pages(file_content, content_type)).strip()
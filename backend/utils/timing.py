@@ -0,0 +1,157 @@
+"""
+단계별 소요 시간 측정 모듈
+요청마다 타임라인(contextvars)을 두고 각 단계를 span으로 측정해
+Server-Timing 응답 헤더로 반환하고, 프로세스 전역 통계와 /metrics 히스토그램으로도 누적
+"""
+import contextvars
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from utils.metrics import REQUEST_SECONDS, STAGE_SECONDS
+
+
+class Timeline:
+    """요청 1건의 단계별 소요 시간 (같은 이름의 span은 합산, 여러 스레드에서 기록 가능)"""
+
+    def __init__(self, detached: bool = False):
+        """
+        Args:
+            detached: True면 전역 통계에 기록하지 않음 (호출한 쪽에서 merge_spans로 합칠 때)
+        """
+        self.detached = detached
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans: Dict[str, list] = {}
+
+    def add(self, name: str, duration_ms: float):
+        with self._lock:
+            entry = self._spans.setdefault(name, [0.0, 0])
+            entry[0] += duration_ms
+            entry[1] += 1
+
+    def durations(self) -> Dict[str, float]:
+        """단계별 소요 시간 합계 (ms, 기록 순서)"""
+        with self._lock:
+            return {name: round(entry[0], 2) for name, entry in self._spans.items()}
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: extract;dur=12.3, pii;dur=4.1, total;dur=20.5)"""
+        metrics = [f"{_metric_name(name)};dur={duration:.1f}" for name, duration in self.durations().items()]
+        metrics.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(metrics)
+
+
+class StageStats:
+    """프로세스 전역 단계별 누적 통계 (최근 샘플로 p50/p95 계산)"""
+
+    def __init__(self, window: int = 512):
+        self.window = window
+        self._lock = threading.Lock()
+        self._stages: Dict[str, dict] = {}
+
+    def add(self, name: str, duration_ms: float):
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "recent": deque(maxlen=self.window)}
+            stage["count"] += 1
+            stage["total_ms"] += duration_ms
+            stage["max_ms"] = max(stage["max_ms"], duration_ms)
+            stage["recent"].append(duration_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            stages = {name: dict(stage, recent=sorted(stage["recent"])) for name, stage in self._stages.items()}
+        result = {}
+        for name, stage in sorted(stages.items()):
+            recent = stage["recent"]
+            result[name] = {
+                "count": stage["count"],
+                "avg_ms": round(stage["total_ms"] / stage["count"], 2),
+                "max_ms": round(stage["max_ms"], 2),
+                "p50_ms": round(recent[len(recent) // 2], 2) if recent else 0.0,
+                "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 2) if recent else 0.0,
+            }
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._stages.clear()
+
+
+_current_timeline: contextvars.ContextVar[Optional[Timeline]] = contextvars.ContextVar("timeline", default=None)
+_stage_stats = StageStats()
+
+
+def _metric_name(name: str) -> str:
+    """Server-Timing 메트릭 이름으로 사용할 수 없는 문자 치환"""
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+
+
+def start_timeline() -> Timeline:
+    """현재 컨텍스트(요청)의 타임라인 시작"""
+    timeline = Timeline()
+    _current_timeline.set(timeline)
+    return timeline
+
+
+def current_timeline() -> Optional[Timeline]:
+    return _current_timeline.get()
+
+
+def record(name: str, duration_ms: float):
+    """현재 요청의 타임라인과 전역 통계에 소요 시간 기록"""
+    timeline = _current_timeline.get()
+    if timeline is not None:
+        timeline.add(name, duration_ms)
+        if timeline.detached:
+            return
+    _stage_stats.add(name, duration_ms)
+    STAGE_SECONDS.observe(duration_ms / 1000, name)
+
+
+def record_request(method: str, route: str, status_code: int, duration_ms: float):
+    """요청 전체 소요 시간을 전역 통계/히스토그램에만 기록 (Server-Timing 헤더에는 total로 별도 표시)"""
+    _stage_stats.add(f"{method} {route}", duration_ms)
+    REQUEST_SECONDS.observe(duration_ms / 1000, method, route, status_code)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """with 블록 소요 시간을 name 단계로 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def collect_spans() -> Iterator[Timeline]:
+    """
+    별도 프로세스(프로세스 풀 워커)에서 span을 모아 호출한 쪽으로 돌려주기 위한 타임라인
+
+    with collect_spans() as timeline: ... → timeline.durations()를 반환값에 포함하고 merge_spans로 합침
+    """
+    token = _current_timeline.set(Timeline(detached=True))
+    try:
+        yield _current_timeline.get()
+    finally:
+        _current_timeline.reset(token)
+
+
+def merge_spans(durations: Dict[str, float]):
+    """다른 프로세스에서 측정한 단계별 소요 시간을 현재 타임라인/통계에 반영"""
+    for name, duration_ms in durations.items():
+        record(name, duration_ms)
+
+
+def get_timing_stats() -> Dict[str, Dict[str, float]]:
+    """단계별 누적 통계 (count, avg/max/p50/p95 ms)"""
+    return _stage_stats.snapshot()
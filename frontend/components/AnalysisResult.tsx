@@ -204,6 +204,7 @@ export default function AnalysisResult({ result }: AnalysisResultProps) {
                   </p>
                   <p className="mt-1 font-mono text-xs text-gray-500 dark:text-gray-500">
                     {finding.value}
+                    {finding.page !== undefined && ` (${finding.page}페이지)`}
                   </p>
                 </div>
               </div>
@@ -36,6 +36,7 @@ export interface AnalysisResult {
         value: string;
         severity: 'high' | 'medium' | 'low';
         position: [number, number];
+        page?: number;
         description: string;
       }>;
       summary: {
@@ -48,6 +49,13 @@ export interface AnalysisResult {
     ai_analysis: {
       method: 'openai' | 'mock';
       note?: string;
+      partial?: boolean;
+      chunks?: {
+        total: number;
+        selected: number;
+        analyzed: number;
+        failed: number;
+      };
       result: {
         risk_level: 'high' | 'medium' | 'low';
         issues: Array<{
@@ -57,6 +65,7 @@ export interface AnalysisResult {
           problematic_text?: string;
           corrected_text?: string;
           suggestion: string;
+          position?: [number, number] | null;
         }>;
         summary: string;
       };